@@ -0,0 +1,18 @@
+-- Migration 001: JSONB search indexes for admin search
+-- Apply with: psql -d profile_cache -f backend/migrations/001_jsonb_search_indexes.sql
+-- CONCURRENTLY avoids blocking cache writes while the indexes build, so this
+-- file must not be wrapped in a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cache_user_input_gin
+    ON response_cache USING GIN (user_input jsonb_path_ops);
+COMMENT ON INDEX idx_cache_user_input_gin IS 'Containment (@>) search over cached evaluation inputs';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_crt_quiz_responses_gin
+    ON crt_quiz_responses USING GIN (quiz_responses jsonb_path_ops);
+COMMENT ON INDEX idx_crt_quiz_responses_gin IS 'Containment (@>) search over CRT quiz responses';
+
+-- Keyset pagination order for search results (created_at DESC, id DESC)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cache_created_at_id
+    ON response_cache (created_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_crt_created_at_id
+    ON crt_quiz_responses (created_at DESC, id DESC);
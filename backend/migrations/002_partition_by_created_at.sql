@@ -0,0 +1,180 @@
+-- Migration 002: Monthly range partitioning of response_cache and crt_quiz_responses by created_at
+-- Apply with: psql -d profile_cache -f backend/migrations/002_partition_by_created_at.sql
+-- Requires PostgreSQL 13+ (row triggers on partitioned tables).
+--
+-- Retention becomes DETACH/DROP PARTITION instead of DELETE (see
+-- src/services/partition_maintenance.py). A unique constraint on a partitioned
+-- table must include the partition key, so (cache_key, model) and hash_key
+-- uniqueness is now enforced by the writers (advisory lock + insert-if-absent).
+
+BEGIN;
+
+-- =====================================================
+-- Partition helpers (also used by partition_maintenance)
+-- =====================================================
+CREATE OR REPLACE FUNCTION create_monthly_partition(parent TEXT, month_start DATE)
+RETURNS TEXT AS $$
+DECLARE
+    range_start DATE := date_trunc('month', month_start)::date;
+    range_end DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::date;
+    partition_name TEXT := format('%s_p%s', parent, to_char(range_start, 'YYYY_MM'));
+    default_name TEXT := parent || '_default';
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    -- Rows that landed in the default partition for this month must move out
+    -- first, otherwise attaching the new range fails.
+    EXECUTE format(
+        'CREATE TEMP TABLE _partition_moved ON COMMIT DROP AS
+         SELECT * FROM %I WHERE created_at >= %L AND created_at < %L',
+        default_name, range_start, range_end
+    );
+    EXECUTE format(
+        'DELETE FROM %I WHERE created_at >= %L AND created_at < %L',
+        default_name, range_start, range_end
+    );
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, parent, range_start, range_end
+    );
+    EXECUTE format('INSERT INTO %I SELECT * FROM _partition_moved', partition_name);
+    DROP TABLE _partition_moved;
+
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION create_monthly_partition(TEXT, DATE) IS 'Create the <parent>_pYYYY_MM partition for the month containing month_start (idempotent)';
+
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent TEXT, from_month DATE, to_month DATE)
+RETURNS INTEGER AS $$
+DECLARE
+    month_cursor DATE := date_trunc('month', from_month)::date;
+    created INTEGER := 0;
+BEGIN
+    WHILE month_cursor <= to_month LOOP
+        IF to_regclass(format('%s_p%s', parent, to_char(month_cursor, 'YYYY_MM'))) IS NULL THEN
+            PERFORM create_monthly_partition(parent, month_cursor);
+            created := created + 1;
+        END IF;
+        month_cursor := (month_cursor + INTERVAL '1 month')::date;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION create_monthly_partitions(TEXT, DATE, DATE) IS 'Create all missing monthly partitions between from_month and to_month';
+
+
+-- =====================================================
+-- response_cache
+-- =====================================================
+DROP VIEW IF EXISTS cache_statistics;
+ALTER TABLE response_cache RENAME TO response_cache_unpartitioned;
+ALTER SEQUENCE response_cache_id_seq RENAME TO response_cache_unpartitioned_id_seq;
+
+CREATE TABLE response_cache (
+    id BIGSERIAL,
+    cache_key VARCHAR(64) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    user_input JSONB,
+    response_json JSONB NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE response_cache_default PARTITION OF response_cache DEFAULT;
+
+SELECT create_monthly_partitions(
+    'response_cache',
+    COALESCE((SELECT MIN(created_at) FROM response_cache_unpartitioned), CURRENT_TIMESTAMP)::date,
+    (CURRENT_DATE + INTERVAL '3 months')::date
+);
+
+INSERT INTO response_cache (id, cache_key, model, user_input, response_json, created_at, updated_at)
+SELECT id, cache_key, model, user_input, response_json, COALESCE(created_at, CURRENT_TIMESTAMP), updated_at
+FROM response_cache_unpartitioned;
+
+SELECT setval('response_cache_id_seq', COALESCE((SELECT MAX(id) FROM response_cache), 0) + 1, false);
+
+DROP TABLE response_cache_unpartitioned;
+
+CREATE INDEX idx_cache_key_model ON response_cache(cache_key, model);
+CREATE INDEX idx_model ON response_cache(model);
+CREATE INDEX idx_created_at ON response_cache(created_at DESC);
+CREATE INDEX idx_cache_created_at_id ON response_cache(created_at DESC, id DESC);
+CREATE INDEX idx_cache_user_input_gin ON response_cache USING GIN (user_input jsonb_path_ops);
+
+COMMENT ON TABLE response_cache IS 'Stores cached ChatGPT API responses keyed by SHA256 hash of input payload (monthly partitions on created_at)';
+COMMENT ON COLUMN response_cache.cache_key IS 'SHA256 hash of the normalized input payload';
+COMMENT ON COLUMN response_cache.model IS 'OpenAI model identifier';
+COMMENT ON COLUMN response_cache.user_input IS 'Original user input payload (for admin viewing)';
+COMMENT ON COLUMN response_cache.response_json IS 'Full JSON response from ChatGPT API';
+COMMENT ON COLUMN response_cache.created_at IS 'Timestamp when cache entry was first created (partition key)';
+COMMENT ON COLUMN response_cache.updated_at IS 'Timestamp when cache entry was last updated';
+
+CREATE TRIGGER update_response_cache_updated_at
+    BEFORE UPDATE ON response_cache
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+CREATE OR REPLACE VIEW cache_statistics AS
+SELECT
+    COUNT(*) as total_entries,
+    COUNT(DISTINCT model) as unique_models,
+    COUNT(DISTINCT DATE(created_at)) as days_active,
+    MAX(created_at) as latest_entry,
+    MIN(created_at) as oldest_entry,
+    (
+        SELECT pg_size_pretty(SUM(pg_total_relation_size(inhrelid)))
+        FROM pg_inherits
+        WHERE inhparent = 'response_cache'::regclass
+    ) as table_size
+FROM response_cache;
+COMMENT ON VIEW cache_statistics IS 'Provides overview statistics of the response cache';
+
+
+-- =====================================================
+-- crt_quiz_responses
+-- =====================================================
+ALTER TABLE crt_quiz_responses RENAME TO crt_quiz_responses_unpartitioned;
+ALTER SEQUENCE crt_quiz_responses_id_seq RENAME TO crt_quiz_responses_unpartitioned_id_seq;
+
+CREATE TABLE crt_quiz_responses (
+    id BIGSERIAL,
+    hash_key VARCHAR(32) NOT NULL,
+    quiz_responses JSONB NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE crt_quiz_responses_default PARTITION OF crt_quiz_responses DEFAULT;
+
+SELECT create_monthly_partitions(
+    'crt_quiz_responses',
+    COALESCE((SELECT MIN(created_at) FROM crt_quiz_responses_unpartitioned), CURRENT_TIMESTAMP)::date,
+    (CURRENT_DATE + INTERVAL '3 months')::date
+);
+
+INSERT INTO crt_quiz_responses (id, hash_key, quiz_responses, created_at)
+SELECT id, hash_key, quiz_responses, COALESCE(created_at, CURRENT_TIMESTAMP)
+FROM crt_quiz_responses_unpartitioned;
+
+SELECT setval('crt_quiz_responses_id_seq', COALESCE((SELECT MAX(id) FROM crt_quiz_responses), 0) + 1, false);
+
+DROP TABLE crt_quiz_responses_unpartitioned;
+
+CREATE INDEX idx_crt_hash_key ON crt_quiz_responses(hash_key);
+CREATE INDEX idx_crt_created_at ON crt_quiz_responses(created_at DESC);
+CREATE INDEX idx_crt_created_at_id ON crt_quiz_responses(created_at DESC, id DESC);
+CREATE INDEX idx_crt_quiz_responses_gin ON crt_quiz_responses USING GIN (quiz_responses jsonb_path_ops);
+
+COMMENT ON TABLE crt_quiz_responses IS 'Stores Career Roadmap Tool quiz responses keyed by MD5 hash (monthly partitions on created_at)';
+COMMENT ON COLUMN crt_quiz_responses.hash_key IS 'MD5 hash of the normalized quiz responses payload';
+COMMENT ON COLUMN crt_quiz_responses.quiz_responses IS 'Full quiz responses JSON from the frontend';
+COMMENT ON COLUMN crt_quiz_responses.created_at IS 'Timestamp when entry was created (partition key)';
+
+COMMIT;
@@ -0,0 +1,24 @@
+-- Migration 003: MBA readiness score histograms per cohort
+-- Apply with: psql -d profile_cache -f backend/migrations/003_mba_cohort_histograms.sql
+--
+-- Readiness scores are integers in 0-100, so a per-cohort count for every
+-- score is an exact, mergeable quantile sketch. Each API worker accumulates
+-- counts in memory and periodically adds them here (count = count + delta),
+-- then reloads the merged totals; percentile and cohort-size lookups never
+-- touch raw evaluation rows.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS mba_cohort_histograms (
+    role VARCHAR(50) NOT NULL,
+    experience VARCHAR(20) NOT NULL,
+    maturity_level VARCHAR(30) NOT NULL,
+    score SMALLINT NOT NULL CHECK (score BETWEEN 0 AND 100),
+    count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (role, experience, maturity_level, score)
+);
+
+COMMENT ON TABLE mba_cohort_histograms IS 'Readiness score counts per (role, experience, maturity) cohort for empirical percentiles';
+
+COMMIT;
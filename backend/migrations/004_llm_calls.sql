@@ -0,0 +1,37 @@
+-- Migration 004: Per-call token, latency and cost accounting for OpenAI calls
+-- Apply with: psql -d profile_cache -f backend/migrations/004_llm_calls.sql
+--
+-- One row per LLM call made for an evaluation (all attempts and schema
+-- correction round trips included) and one per /evaluate cache hit, so the
+-- admin report can price what the cache saved. Rows are written in batches by
+-- each API worker (src/services/llm_accounting.py); evaluation_id is the
+-- response_cache key for tech evaluations.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS llm_calls (
+    id BIGSERIAL PRIMARY KEY,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    endpoint VARCHAR(50) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    evaluation_id VARCHAR(64),
+    cache_hit BOOLEAN NOT NULL DEFAULT FALSE,
+    success BOOLEAN NOT NULL,
+    attempts SMALLINT NOT NULL DEFAULT 0,
+    corrected BOOLEAN NOT NULL DEFAULT FALSE,
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    latency_ms REAL,
+    cost_usd NUMERIC(12, 6),
+    error VARCHAR(200)
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_calls_created_at ON llm_calls (created_at);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_evaluation_id ON llm_calls (evaluation_id) WHERE evaluation_id IS NOT NULL;
+
+COMMENT ON TABLE llm_calls IS 'Token, latency, attempt and cost accounting per LLM call and per cached /evaluate hit';
+COMMENT ON COLUMN llm_calls.corrected IS 'A schema-validation correction prompt was sent before the final attempt';
+COMMENT ON COLUMN llm_calls.cost_usd IS 'Priced from src/config/llm_pricing.json; NULL for unpriced models';
+
+COMMIT;
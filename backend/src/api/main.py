@@ -2,26 +2,40 @@
 FastAPI application for Free Profile Evaluation.
 Handles HTTP endpoints for profile evaluation.
 """
+import asyncio
 import hashlib
 import json
 import logging
 import os
+from datetime import datetime
 from typing import Dict, Optional, Any
 
 from fastapi import FastAPI, HTTPException, APIRouter, Depends, Security, Header, Query, Request
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 from src.models import FullProfileEvaluationResponse
 from src.services.run_poc import run_poc
+from src.services.request_timing import log_request_timings, start_request_timings
+from src.services.metrics import get_metrics
 from src.config.logging_config import setup_logging, get_logger
 from src.config.settings import get_settings
+from src.config.registry import config_registry
 
 # Setup logging
 setup_logging()
 logger = get_logger(__name__)
 
+# Parse every src/config/*.json once up front; later changes hot-reload by mtime
+config_registry.load_all()
+
+# Optionally fill the deterministic enrichment memo from the quiz option grid
+if get_settings().enrichment_precompute:
+    from src.services.profile_enrichment import start_precompute
+    start_precompute()
+
 
 class QuizResponses(BaseModel):
     currentRole: str
@@ -100,6 +114,35 @@ class CRTStoreResponse(BaseModel):
 
 app = FastAPI(title="Full Profile Evaluation API")
 
+
+def _observe_request_metrics(request: Request, status_code: int, total_ms: float) -> None:
+    if get_settings().enable_metrics:
+        # Route template, not the raw path, so /admin/view/response/{cache_key} is one series
+        route = request.scope.get("route")
+        get_metrics().observe_request(
+            request.method, getattr(route, "path", "unmatched"), status_code, total_ms / 1000
+        )
+
+
+@app.middleware("http")
+async def request_timing_middleware(request: Request, call_next):
+    """Per-stage timings of the request (see request_timing) in Server-Timing and the logs."""
+    timings = start_request_timings()
+    try:
+        response = await call_next(request)
+    except Exception:
+        total_ms = timings.elapsed_ms()
+        log_request_timings(timings, request.method, request.url.path, 500, total_ms)
+        _observe_request_metrics(request, 500, total_ms)
+        raise
+    total_ms = timings.elapsed_ms()
+    if get_settings().server_timing_header:
+        response.headers["Server-Timing"] = timings.server_timing(total_ms)
+    log_request_timings(timings, request.method, request.url.path, response.status_code, total_ms)
+    _observe_request_metrics(request, response.status_code, total_ms)
+    return response
+
+
 # Create API router for all endpoints
 api_router = APIRouter()
 
@@ -222,6 +265,8 @@ async def evaluate_profile(request: EvaluationRequest) -> FullProfileEvaluationR
             input_payload=request.model_dump(),
         )
         logger.info("Profile evaluation completed successfully")
+        if get_settings().enable_metrics:
+            get_metrics().count_evaluation("evaluate", request.quizResponses.currentRole)
         return result
     except RuntimeError as exc:
         logger.exception("Evaluation failed due to configuration error")
@@ -240,6 +285,14 @@ async def healthcheck() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+@api_router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """Prometheus metrics merged across all workers (see src/services/metrics.py)."""
+    if not get_settings().enable_metrics:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(get_metrics().render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @api_router.get("/admin/view/response/{cache_key}")
 async def get_response_by_cache_key(
     cache_key: str,
@@ -275,6 +328,198 @@ async def get_response_by_cache_key(
     }
 
 
+@api_router.get("/admin/config")
+async def get_config_status(
+    username: str = Depends(verify_admin_credentials)
+) -> Dict[str, Any]:
+    """
+    Admin endpoint listing loaded config files with version, mtime and load time.
+    """
+    return config_registry.status()
+
+
+@api_router.get("/admin/cache/stats")
+async def get_cache_stats(
+    username: str = Depends(verify_admin_credentials)
+) -> Dict[str, Any]:
+    """
+    Admin endpoint for cache statistics: catalog-based size/row estimates plus
+    this worker's hit, miss, write, byte and latency counters. Never scans the table.
+    """
+    from src.repositories.cache_repository import CacheRepository
+
+    return CacheRepository().get_stats()
+
+
+@api_router.get("/admin/enrichment/stats")
+async def get_enrichment_stats(
+    username: str = Depends(verify_admin_credentials)
+) -> Dict[str, Any]:
+    """
+    Admin endpoint for this worker's deterministic enrichment memo: size,
+    hit/miss/eviction counters, precomputation progress and the card cache.
+    """
+    from src.services.profile_enrichment import get_profile_enrichment
+
+    return get_profile_enrichment().stats()
+
+
+@api_router.get("/admin/llm/usage")
+async def get_llm_usage(
+    days: int = Query(7, ge=1, le=366),
+    username: str = Depends(verify_admin_credentials)
+) -> Dict[str, Any]:
+    """
+    Admin endpoint for LLM token, latency and cost accounting: this worker's
+    totals per endpoint and model, plus all workers' totals from llm_calls
+    for the last `days` days, including dollars saved by cache hits.
+    """
+    from src.services.llm_accounting import get_llm_accounting
+
+    return get_llm_accounting().report(days)
+
+
+@api_router.get("/admin/db/pool")
+async def get_db_pool_stats(
+    username: str = Depends(verify_admin_credentials)
+) -> Dict[str, Any]:
+    """
+    Admin endpoint for this worker's connection pool usage: connections in
+    use and at peak against the pool limit, exhausted acquisitions and
+    acquire latency per pool.
+    """
+    from src.repositories.pool_stats import pool_usage_snapshot
+
+    return {"pools": pool_usage_snapshot()}
+
+
+@api_router.post("/admin/profile")
+async def start_profile(
+    duration_seconds: int = Query(30, ge=1),
+    cpu: bool = True,
+    heap: bool = True,
+    interval_ms: Optional[float] = Query(None, gt=0),
+    idle: bool = False,
+    username: str = Depends(verify_admin_credentials)
+) -> Dict[str, Any]:
+    """
+    Admin endpoint to start a time-boxed CPU sampling profile and/or
+    tracemalloc heap diff of the worker that receives it. Only one session
+    runs at a time (409 otherwise); poll /admin/profile/{session_id} and
+    download the artifacts it lists once it has finished.
+    """
+    from src.services.profiler import get_profiler
+    from src.config.exceptions import AppException
+
+    logger.info(f"Admin {username} starting profile: {duration_seconds}s, cpu={cpu}, heap={heap}")
+
+    try:
+        return get_profiler().start(duration_seconds, cpu=cpu, heap=heap, interval_ms=interval_ms, idle=idle)
+    except AppException as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+
+
+@api_router.get("/admin/profile/{session_id}")
+async def get_profile_session(
+    session_id: str,
+    username: str = Depends(verify_admin_credentials)
+) -> Dict[str, Any]:
+    """
+    Admin endpoint for a profiling session's status, sample counts,
+    measured overhead, top heap growth and available artifacts.
+    """
+    from src.services.profiler import get_profiler
+    from src.config.exceptions import NotFoundError
+
+    try:
+        return get_profiler().session(session_id)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+
+
+@api_router.get("/admin/profile/{session_id}/{artifact}")
+async def download_profile_artifact(
+    session_id: str,
+    artifact: str,
+    username: str = Depends(verify_admin_credentials)
+) -> FileResponse:
+    """
+    Admin endpoint to download a profiling artifact: cpu.collapsed (folded
+    stacks for flamegraph.pl / speedscope) or heap_top.txt (top allocations).
+    """
+    from src.services.profiler import get_profiler
+    from src.config.exceptions import NotFoundError
+
+    try:
+        path = get_profiler().artifact_path(session_id, artifact)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+
+    return FileResponse(path, media_type="text/plain", filename=f"profile-{session_id}-{artifact}")
+
+
+@api_router.get("/admin/search/responses")
+async def search_cached_responses(
+    filters: list[str] = Query([], alias="filter"),
+    limit: int = Query(20, ge=1),
+    cursor: Optional[str] = None,
+    username: str = Depends(verify_admin_credentials)
+) -> Dict[str, Any]:
+    """
+    Admin endpoint to search cached evaluations by user_input fields.
+
+    Example:
+        /admin/search/responses?filter=quizResponses.targetCompany=faang&filter=quizResponses.experience=8%2B
+
+    Returns:
+        Dictionary with items (no response bodies) and next_cursor for the next page
+    """
+    from src.repositories.cache_repository import CacheRepository
+    from src.config.exceptions import ValidationError as FilterValidationError
+    from src.utils.jsonb_search import parse_filters
+
+    try:
+        return CacheRepository().search(parse_filters(filters), limit=limit, cursor=cursor)
+    except FilterValidationError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    except Exception as exc:
+        logger.exception(f"Failed to search cached responses: {exc}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to search cached responses"
+        ) from exc
+
+
+@api_router.get("/admin/export/{table}")
+def export_table(
+    table: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    fetch_size: Optional[int] = Query(None, ge=1, le=50000),
+    username: str = Depends(verify_admin_credentials)
+) -> StreamingResponse:
+    """
+    Admin endpoint to stream a table (response_cache or crt_quiz_responses)
+    as gzip NDJSON, optionally limited to a created_at range [since, until).
+    """
+    from src.services.data_export import stream_export
+    from src.config.exceptions import NotFoundError
+
+    logger.info(f"Admin export request for table={table}, since={since}, until={until}")
+
+    try:
+        body = stream_export(table, since=since, until=until, fetch_size=fetch_size)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+
+    filename = f"{table}-{datetime.utcnow():%Y%m%dT%H%M%S}.ndjson.gz"
+    return StreamingResponse(
+        body,
+        media_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 crt_router = APIRouter(prefix="/crt", tags=["Career Roadmap Tool"])
 
 
@@ -286,25 +531,16 @@ def _make_crt_hash(quiz_responses: Dict[str, Any]) -> str:
 
 @crt_router.post("/store", response_model=CRTStoreResponse)
 async def store_crt_quiz_responses(request: CRTStoreRequest) -> CRTStoreResponse:
-    from database import get_db_connection
-    
+    from src.repositories.crt_writer import get_crt_writer
+
     quiz_responses = request.quizResponses
     hash_key = _make_crt_hash(quiz_responses)
     
     logger.info(f"Storing CRT quiz responses with hash: {hash_key}")
     
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO crt_quiz_responses (hash_key, quiz_responses)
-                    VALUES (%s, %s)
-                    ON CONFLICT (hash_key) DO UPDATE SET
-                        quiz_responses = EXCLUDED.quiz_responses
-                    """,
-                    (hash_key, json.dumps(quiz_responses))
-                )
+        # Known hashes resolve immediately; new ones join the next batched insert
+        await asyncio.wrap_future(get_crt_writer().submit(hash_key, quiz_responses))
         
         logger.info(f"Successfully stored CRT quiz responses: {hash_key}")
         return CRTStoreResponse(hash_key=hash_key)
@@ -362,6 +598,35 @@ async def get_crt_quiz_responses(
         ) from exc
 
 
+@crt_router.get("/admin/search")
+async def search_crt_quiz_responses(
+    filters: list[str] = Query([], alias="filter"),
+    limit: int = Query(20, ge=1),
+    cursor: Optional[str] = None,
+    username: str = Depends(verify_admin_credentials)
+) -> Dict[str, Any]:
+    """
+    Admin endpoint to search CRT submissions by quiz_responses fields.
+
+    Example:
+        /crt/admin/search?filter=targetRole=backend-sde&filter=yearsOfExperience=3-5
+    """
+    from src.repositories.crt_repository import CRTRepository
+    from src.config.exceptions import ValidationError as FilterValidationError
+    from src.utils.jsonb_search import parse_filters
+
+    try:
+        return CRTRepository().search(parse_filters(filters), limit=limit, cursor=cursor)
+    except FilterValidationError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.message) from exc
+    except Exception as exc:
+        logger.exception(f"Failed to search CRT quiz responses: {exc}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to search quiz responses"
+        ) from exc
+
+
 # Include CRT router under the main API router
 api_router.include_router(crt_router)
 
@@ -398,6 +663,8 @@ async def evaluate_mba_readiness(request: Dict[str, Any]):
         result = evaluate_mba_readiness(request)
 
         logger.info("MBA evaluation completed successfully")
+        if get_settings().enable_metrics:
+            get_metrics().count_evaluation("mba/evaluate", request.get('role'))
         return result
 
     except Exception as exc:
@@ -38,3 +38,8 @@ class RateLimitError(AppException):
 class NotFoundError(AppException):
     def __init__(self, message: str = "Resource not found"):
         super().__init__(message, status_code=404)
+
+
+class ConflictError(AppException):
+    def __init__(self, message: str = "Resource is busy"):
+        super().__init__(message, status_code=409)
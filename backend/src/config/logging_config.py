@@ -28,6 +28,9 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "user_id"):
             log_data["user_id"] = record.user_id
 
+        if hasattr(record, "timings"):
+            log_data["timings"] = record.timings
+
         return json.dumps(log_data)
 
 
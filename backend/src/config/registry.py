@@ -0,0 +1,159 @@
+"""
+Central registry for the JSON config files in src/config.
+
+Each file is parsed once (at startup via load_all(), or on first use) into
+frozen structures: dicts become read-only MappingProxyType views and lists
+become tuples, so request code can share them without copying. File mtimes
+are re-checked at most every CONFIG_RELOAD_INTERVAL_SECONDS; a changed file
+is re-parsed and swapped in atomically, and a file that fails to parse keeps
+serving the previous version.
+"""
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+
+logger = get_logger(__name__)
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into read-only structures."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Inverse of freeze(), for callers that need mutable or JSON-serializable copies."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigEntry:
+    name: str
+    path: str
+    data: Any
+    version: int
+    mtime: float
+    size: int
+    loaded_at: float
+    load_ms: float
+
+
+class ConfigRegistry:
+    def __init__(self, config_dir: str = CONFIG_DIR, reload_interval: Optional[float] = None):
+        self._config_dir = config_dir
+        self._reload_interval = (
+            settings.config_reload_interval_seconds if reload_interval is None else reload_interval
+        )
+        self._entries: Dict[str, ConfigEntry] = {}
+        self._last_checked: Dict[str, float] = {}
+        self._listeners: Dict[str, List[Callable[[ConfigEntry], None]]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._config_dir, f"{name}.json")
+
+    def _load(self, name: str, previous: Optional[ConfigEntry]) -> ConfigEntry:
+        path = self._path(name)
+        started = time.perf_counter()
+        stat = os.stat(path)
+        with open(path, "r", encoding="utf-8") as f:
+            data = freeze(json.load(f))
+        entry = ConfigEntry(
+            name=name,
+            path=path,
+            data=data,
+            version=(previous.version + 1) if previous else 1,
+            mtime=stat.st_mtime,
+            size=stat.st_size,
+            loaded_at=time.time(),
+            load_ms=round((time.perf_counter() - started) * 1000, 3),
+        )
+        logger.info(f"Loaded config {name}.json v{entry.version} in {entry.load_ms}ms")
+        return entry
+
+    def _refresh(self, name: str) -> ConfigEntry:
+        with self._lock:
+            entry = self._entries.get(name)
+            now = time.monotonic()
+            if entry is not None:
+                if not self._reload_interval or now - self._last_checked.get(name, 0) < self._reload_interval:
+                    return entry
+                self._last_checked[name] = now
+                try:
+                    if os.stat(entry.path).st_mtime == entry.mtime:
+                        return entry
+                    new_entry = self._load(name, entry)
+                except (OSError, ValueError) as exc:
+                    logger.error(f"Config reload failed for {name}.json, keeping v{entry.version}: {exc}")
+                    return entry
+            else:
+                new_entry = self._load(name, None)
+                self._last_checked[name] = now
+
+            self._entries[name] = new_entry
+            listeners = list(self._listeners.get(name, []))
+
+        for listener in listeners:
+            try:
+                listener(new_entry)
+            except Exception as exc:
+                logger.error(f"Config listener for {name}.json failed: {exc}")
+        return new_entry
+
+    def entry(self, name: str) -> ConfigEntry:
+        """Current entry for a config file (loads on first use, hot-reloads on mtime change)."""
+        entry = self._entries.get(name)
+        if entry is not None and (
+            not self._reload_interval
+            or time.monotonic() - self._last_checked.get(name, 0) < self._reload_interval
+        ):
+            return entry
+        return self._refresh(name)
+
+    def get(self, name: str) -> Any:
+        """Frozen contents of src/config/<name>.json."""
+        return self.entry(name).data
+
+    def on_reload(self, name: str, listener: Callable[[ConfigEntry], None]) -> None:
+        """Call listener with the new entry whenever <name>.json is (re)loaded."""
+        with self._lock:
+            self._listeners.setdefault(name, []).append(listener)
+
+    def load_all(self) -> None:
+        """Eagerly load every JSON file in the config directory."""
+        for filename in sorted(os.listdir(self._config_dir)):
+            if filename.endswith(".json"):
+                self.entry(filename[:-len(".json")])
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Version, size and load time for every loaded config file."""
+        return {
+            name: {
+                "path": entry.path,
+                "version": entry.version,
+                "size_bytes": entry.size,
+                "mtime": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(entry.mtime)),
+                "loaded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(entry.loaded_at)),
+                "load_ms": entry.load_ms,
+            }
+            for name, entry in sorted(self._entries.items())
+        }
+
+
+config_registry = ConfigRegistry()
@@ -17,6 +17,8 @@ class Settings(BaseSettings):
     port: int = 8000
     openai_api_key: str
     openai_model: str = "gpt-4o"
+    # Point the OpenAI clients at a compatible server (e.g. src/services/openai_stub.py)
+    openai_base_url: Optional[str] = None
     openai_timeout: int = 60
     openai_max_retries: int = 3
     openai_retry_delay: float = 1.5
@@ -25,7 +27,27 @@ class Settings(BaseSettings):
     db_max_overflow: int = 20
     db_pool_timeout: int = 30
     cache_enabled: bool = True
-    cache_ttl: Optional[int] = None 
+    cache_ttl: Optional[int] = None
+    admin_search_max_limit: int = 100
+    admin_search_timeout_ms: int = 5000
+    export_fetch_size: int = 2000
+    import_batch_size: int = 50000
+    partition_premake_months: int = 3
+    cache_retention_months: Optional[int] = None
+    crt_retention_months: Optional[int] = None
+    crt_known_hash_cache_size: int = 100000
+    crt_flush_interval_ms: int = 20
+    crt_max_batch_size: int = 500
+    config_reload_interval_seconds: float = 5.0
+    cohort_stats_flush_interval_seconds: float = 30.0
+    cohort_stats_min_samples: int = 100
+    mba_lookup_path: Optional[str] = None
+    enrichment_cache_size: int = 4096
+    enrichment_precompute: bool = False
+    llm_accounting_flush_interval_seconds: float = 10.0
+    llm_accounting_max_pending: int = 10000
+    slow_request_threshold_ms: float = 8000.0
+    server_timing_header: bool = True
     allowed_origins: str = "http://localhost:3000,http://127.0.0.1:3000"
 
     def get_cors_origins(self) -> List[str]:
@@ -36,6 +58,16 @@ class Settings(BaseSettings):
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
     enable_metrics: bool = True
+    # Per-worker snapshot files merged at scrape time (see src/services/metrics.py)
+    metrics_dir: Optional[str] = None
+    metrics_flush_interval_seconds: float = 5.0
+    # Admin CPU/heap profiling sessions (see src/services/profiler.py)
+    profiling_dir: Optional[str] = None
+    profiling_max_seconds: int = 120
+    profiling_sample_interval_ms: float = 10.0
+    profiling_max_overhead_percent: float = 5.0
+    profiling_tracemalloc_frames: int = 10
+    profiling_keep_sessions: int = 10
     sentry_dsn: Optional[str] = None
     admin_username: str
     admin_password: str
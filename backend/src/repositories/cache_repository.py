@@ -1,7 +1,10 @@
 import hashlib
 import json
+import time
 from contextlib import contextmanager
-from typing import Any, Dict, Optional
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 import psycopg2
 from psycopg2 import pool
@@ -10,10 +13,30 @@ from psycopg2.extras import RealDictCursor
 from src.config.exceptions import CacheError, DatabaseError
 from src.config.logging_config import get_logger
 from src.config.settings import settings
+from src.repositories.cache_stats import cache_counters
+from src.repositories.pool_stats import get_pool_usage
+from src.utils.copy_source import CsvCopySource
+from src.utils.jsonb_search import build_containment, decode_cursor, encode_cursor
 
 logger = get_logger(__name__)
 
 
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+def _import_row(record: Dict[str, Any]) -> tuple:
+    user_input = record.get("user_input")
+    return (
+        record["cache_key"],
+        record["model"],
+        json.dumps(user_input) if user_input is not None else None,
+        json.dumps(record["response_json"]),
+        record.get("created_at"),
+        record.get("updated_at"),
+    )
+
+
 class CacheRepository:
     def __init__(self):
         self._pool: Optional[pool.SimpleConnectionPool] = None
@@ -56,7 +79,14 @@ class CacheRepository:
         if pool_instance is None:
             raise CacheError("Database pool not initialized")
 
-        conn = pool_instance.getconn()
+        usage = get_pool_usage("response_cache", settings.db_pool_size)
+        started = time.perf_counter()
+        try:
+            conn = pool_instance.getconn()
+        except pool.PoolError:
+            usage.record_exhausted()
+            raise
+        usage.record_acquire(_elapsed_ms(started))
         try:
             yield conn
             conn.commit()
@@ -65,6 +95,7 @@ class CacheRepository:
             raise
         finally:
             pool_instance.putconn(conn)
+            usage.record_release()
 
     @staticmethod
     def generate_cache_key(payload: Dict[str, Any], model: str) -> str:
@@ -75,6 +106,7 @@ class CacheRepository:
         if self._disabled or not settings.cache_enabled:
             return None
 
+        started = time.perf_counter()
         try:
             with self._get_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
@@ -92,20 +124,25 @@ class CacheRepository:
                         logger.info(f"✅ Cache HIT for key: {cache_key[:16]}...")
                         response_data = result['response_json']
                         if isinstance(response_data, dict):
-                            return json.dumps(response_data)
+                            response_data = json.dumps(response_data)
+                        cache_counters.record_read(
+                            True, _elapsed_ms(started), len(response_data or "")
+                        )
                         return response_data
 
                     logger.info(f"❌ Cache MISS for key: {cache_key[:16]}...")
+                    cache_counters.record_read(False, _elapsed_ms(started))
                     return None
 
         except Exception as exc:
             logger.warning(f"Cache read failed: {exc}")
+            cache_counters.record_read_error(_elapsed_ms(started))
             return None
 
     def get_by_key(self, cache_key: str, model: str) -> Optional[Dict[str, Any]]:
         """
-        Get full cache entry including user_input and response_json.
-        Reuses the same query pattern as get() but returns additional metadata.
+        Get full cache entry including user_input and response_json (admin view).
+        Unlike get(), this is not an evaluation lookup, so it leaves cache_counters alone.
         
         Args:
             cache_key: The cache key
@@ -114,18 +151,15 @@ class CacheRepository:
         Returns:
             Dictionary with response_json, user_input, created_at, updated_at, or None if not found
         """
-        # First check if entry exists using get() - reuse the same logic
-        response_json_str = self.get(cache_key, model)
-        if not response_json_str:
+        if self._disabled or not settings.cache_enabled:
             return None
 
-        # If entry exists, fetch additional fields (user_input, timestamps)
         try:
             with self._get_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     cur.execute(
                         """
-                        SELECT user_input, created_at, updated_at
+                        SELECT response_json, user_input, created_at, updated_at
                         FROM response_cache
                         WHERE cache_key = %s AND model = %s
                         """,
@@ -133,25 +167,231 @@ class CacheRepository:
                     )
                     result = cur.fetchone()
 
-                    if result:
-                        # Parse response_json from get() result
+                    if not result or not result['response_json']:
+                        return None
+
+                    response_json = result['response_json']
+                    if isinstance(response_json, str):
                         try:
-                            response_json = json.loads(response_json_str) if isinstance(response_json_str, str) else response_json_str
-                        except (json.JSONDecodeError, TypeError):
-                            response_json = response_json_str
-                        
-                        return {
-                            "response_json": response_json,
-                            "user_input": result['user_input'],
-                            "created_at": result['created_at'].isoformat() if result['created_at'] else None,
-                            "updated_at": result['updated_at'].isoformat() if result['updated_at'] else None,
-                        }
-                    return None
+                            response_json = json.loads(response_json)
+                        except json.JSONDecodeError:
+                            pass
+
+                    return {
+                        "response_json": response_json,
+                        "user_input": result['user_input'],
+                        "created_at": result['created_at'].isoformat() if result['created_at'] else None,
+                        "updated_at": result['updated_at'].isoformat() if result['updated_at'] else None,
+                    }
 
         except Exception as exc:
-            logger.warning(f"Failed to get cache metadata: {exc}")
+            logger.warning(f"Failed to get cache entry: {exc}")
             return None
 
+    def search(
+        self,
+        filters: Dict[str, str],
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Search cached evaluations by user_input fields (admin only).
+        Uses JSONB containment so the GIN index on user_input serves the filter,
+        keyset pagination on (created_at, id) and a statement timeout to bound cost.
+
+        Args:
+            filters: Dotted user_input paths to values, e.g. {"quizResponses.targetCompany": "faang"}
+            limit: Page size (capped at settings.admin_search_max_limit)
+            cursor: Opaque cursor from a previous page's next_cursor
+
+        Returns:
+            Dictionary with items and next_cursor (None on the last page)
+        """
+        if self._disabled or not settings.cache_enabled:
+            return {"items": [], "next_cursor": None}
+
+        limit = max(1, min(limit, settings.admin_search_max_limit))
+        containment = json.dumps(build_containment(filters))
+        after = decode_cursor(cursor)
+
+        query = """
+            SELECT id, cache_key, model, user_input, created_at, updated_at
+            FROM response_cache
+            WHERE user_input @> %s::jsonb
+        """
+        params: list = [containment]
+        if after:
+            query += " AND (created_at, id) < (%s, %s)"
+            params.extend(after)
+        query += " ORDER BY created_at DESC, id DESC LIMIT %s"
+        params.append(limit + 1)
+
+        with self._get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    "SET LOCAL statement_timeout = %s",
+                    (settings.admin_search_timeout_ms,)
+                )
+                cur.execute(query, params)
+                rows = cur.fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        items = [
+            {
+                "cache_key": row["cache_key"],
+                "model": row["model"],
+                "user_input": row["user_input"],
+                "created_at": row["created_at"].isoformat() if row["created_at"] else None,
+                "updated_at": row["updated_at"].isoformat() if row["updated_at"] else None,
+            }
+            for row in rows
+        ]
+        next_cursor = None
+        if has_more and rows[-1]["created_at"]:
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+        return {"items": items, "next_cursor": next_cursor}
+
+    def iter_export(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        fetch_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream response_cache rows through a named (server-side) cursor so only
+        fetch_size rows are held in memory at a time.
+
+        Args:
+            since: Only rows with created_at >= since
+            until: Only rows with created_at < until
+            fetch_size: Rows per round trip (defaults to settings.export_fetch_size)
+
+        Yields:
+            Row dictionaries (cache_key, model, user_input, response_json, created_at, updated_at)
+        """
+        if self._disabled or not settings.cache_enabled:
+            return
+
+        conditions = []
+        params: list = []
+        if since is not None:
+            conditions.append("created_at >= %s")
+            params.append(since)
+        if until is not None:
+            conditions.append("created_at < %s")
+            params.append(until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT cache_key, model, user_input, response_json, created_at, updated_at
+            FROM response_cache
+            {where}
+            ORDER BY created_at, id
+        """
+
+        with self._get_connection() as conn:
+            with conn.cursor(name="export_response_cache", cursor_factory=RealDictCursor) as cur:
+                cur.itersize = fetch_size or settings.export_fetch_size
+                cur.execute(query, params)
+                for row in cur:
+                    yield row
+
+    def bulk_import(self, records: Iterable[Dict[str, Any]], batch_size: Optional[int] = None) -> int:
+        """
+        Load exported cache rows via COPY into a temp staging table, then merge
+        into response_cache with the same conflict handling as set(): the
+        imported response wins and an existing user_input is kept when the
+        imported one is NULL. Each batch is its own transaction.
+
+        Args:
+            records: Row dictionaries as produced by iter_export()
+            batch_size: Rows per COPY/merge transaction (defaults to settings.import_batch_size)
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        if self._disabled or not settings.cache_enabled:
+            return 0
+
+        batch_size = batch_size or settings.import_batch_size
+        iterator = iter(records)
+        merged = 0
+
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        CREATE TEMP TABLE response_cache_import (
+                            cache_key VARCHAR(64),
+                            model VARCHAR(100),
+                            user_input JSONB,
+                            response_json JSONB,
+                            created_at TIMESTAMP,
+                            updated_at TIMESTAMP
+                        ) ON COMMIT DROP
+                        """
+                    )
+                    cur.copy_expert(
+                        """
+                        COPY response_cache_import
+                            (cache_key, model, user_input, response_json, created_at, updated_at)
+                        FROM STDIN WITH (FORMAT csv)
+                        """,
+                        CsvCopySource(_import_row(record) for record in batch)
+                    )
+                    cur.execute(
+                        """
+                        CREATE TEMP TABLE response_cache_import_latest ON COMMIT DROP AS
+                        SELECT DISTINCT ON (cache_key, model) *
+                        FROM response_cache_import
+                        ORDER BY cache_key, model, updated_at DESC NULLS LAST
+                        """
+                    )
+                    # Same conflict rules as set(). The table lock stands in for the
+                    # per-key advisory locks set() takes, keeping (cache_key, model)
+                    # unique across partitions while the batch merges.
+                    cur.execute("LOCK TABLE response_cache IN SHARE ROW EXCLUSIVE MODE")
+                    cur.execute(
+                        """
+                        UPDATE response_cache AS rc
+                        SET user_input = COALESCE(imp.user_input, rc.user_input),
+                            response_json = imp.response_json,
+                            updated_at = CURRENT_TIMESTAMP
+                        FROM response_cache_import_latest AS imp
+                        WHERE rc.cache_key = imp.cache_key AND rc.model = imp.model
+                        """
+                    )
+                    merged += cur.rowcount
+                    cur.execute(
+                        """
+                        INSERT INTO response_cache
+                            (cache_key, model, user_input, response_json, created_at, updated_at)
+                        SELECT
+                            imp.cache_key,
+                            imp.model,
+                            imp.user_input,
+                            imp.response_json,
+                            COALESCE(imp.created_at, CURRENT_TIMESTAMP),
+                            COALESCE(imp.updated_at, CURRENT_TIMESTAMP)
+                        FROM response_cache_import_latest AS imp
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM response_cache AS rc
+                            WHERE rc.cache_key = imp.cache_key AND rc.model = imp.model
+                        )
+                        """
+                    )
+                    merged += cur.rowcount
+
+            logger.info(f"📥 Cache IMPORT merged batch of {len(batch)} rows ({merged} total)")
+
+        return merged
+
     def backfill_user_input(self, cache_key: str, model: str, user_input: Dict[str, Any]) -> bool:
         """
         Update user_input for existing cache entries.
@@ -198,6 +438,7 @@ class CacheRepository:
         if self._disabled or not settings.cache_enabled:
             return False
 
+        started = time.perf_counter()
         try:
             user_input_json = None
             if user_input is not None:
@@ -205,24 +446,39 @@ class CacheRepository:
 
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
+                    # response_cache is partitioned by created_at, so (cache_key, model)
+                    # cannot carry a unique constraint. A per-key advisory lock makes
+                    # update-else-insert behave like the former ON CONFLICT upsert.
+                    cur.execute(
+                        "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+                        (f"response_cache:{cache_key}:{model}",)
+                    )
                     cur.execute(
                         """
-                        INSERT INTO response_cache (cache_key, model, user_input, response_json)
-                        VALUES (%s, %s, %s::jsonb, %s::jsonb)
-                        ON CONFLICT (cache_key, model)
-                        DO UPDATE SET
-                            user_input = COALESCE(EXCLUDED.user_input, response_cache.user_input),
-                            response_json = EXCLUDED.response_json,
+                        UPDATE response_cache
+                        SET user_input = COALESCE(%s::jsonb, user_input),
+                            response_json = %s::jsonb,
                             updated_at = CURRENT_TIMESTAMP
+                        WHERE cache_key = %s AND model = %s
                         """,
-                        (cache_key, model, user_input_json, response_json)
+                        (user_input_json, response_json, cache_key, model)
                     )
+                    if cur.rowcount == 0:
+                        cur.execute(
+                            """
+                            INSERT INTO response_cache (cache_key, model, user_input, response_json)
+                            VALUES (%s, %s, %s::jsonb, %s::jsonb)
+                            """,
+                            (cache_key, model, user_input_json, response_json)
+                        )
 
             logger.info(f"💾 Cache WRITE for key: {cache_key[:16]}...")
+            cache_counters.record_write(True, _elapsed_ms(started), len(response_json))
             return True
 
         except Exception as exc:
             logger.error(f"Cache write failed: {exc}")
+            cache_counters.record_write(False, _elapsed_ms(started))
             return False
 
     def delete(self, cache_key: str, model: str) -> bool:
@@ -240,6 +496,13 @@ class CacheRepository:
             return False
 
     def clear(self, model: Optional[str] = None) -> int:
+        """
+        Delete cached responses (all of them when model is None).
+
+        Returns:
+            Number of entries deleted; for a full clear this is the planner
+            estimate (as in get_stats), so the table is not scanned while locked
+        """
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
@@ -248,11 +511,26 @@ class CacheRepository:
                             "DELETE FROM response_cache WHERE model = %s",
                             (model,)
                         )
+                        deleted_count = cur.rowcount
                     else:
-                        cur.execute("DELETE FROM response_cache")
+                        cur.execute(
+                            """
+                            WITH relations AS (
+                                SELECT 'response_cache'::regclass AS oid
+                                UNION ALL
+                                SELECT inhrelid FROM pg_inherits
+                                WHERE inhparent = 'response_cache'::regclass
+                            )
+                            SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint
+                            FROM relations r
+                            JOIN pg_class c ON c.oid = r.oid
+                            """
+                        )
+                        deleted_count = cur.fetchone()[0]
+                        # TRUNCATE empties every partition without DELETE bloat
+                        cur.execute("TRUNCATE response_cache")
 
-                    deleted_count = cur.rowcount
-                    logger.info(f"Cleared {deleted_count} cache entries")
+                    logger.info(f"Cleared {'~' if not model else ''}{deleted_count} cache entries")
                     return deleted_count
 
         except Exception as exc:
@@ -261,39 +539,57 @@ class CacheRepository:
 
     def get_stats(self) -> Dict[str, Any]:
         """
-        Get cache statistics.
+        Get cache statistics without scanning response_cache.
+        Row count and size are planner/catalog estimates summed over all
+        partitions; hit/miss/write counters come from this worker process.
 
         Returns:
             Dictionary with cache statistics
         """
         if self._disabled or not settings.cache_enabled:
-            return {"enabled": False, "total_entries": 0}
+            return {"enabled": False, "total_entries": 0, "counters": cache_counters.snapshot()}
 
         try:
             with self._get_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     cur.execute(
                         """
+                        WITH relations AS (
+                            SELECT 'response_cache'::regclass AS oid
+                            UNION ALL
+                            SELECT inhrelid FROM pg_inherits
+                            WHERE inhparent = 'response_cache'::regclass
+                        )
                         SELECT
-                            COUNT(*) as total_entries,
-                            COUNT(DISTINCT model) as unique_models,
-                            MAX(created_at) as latest_entry,
-                            MIN(created_at) as oldest_entry,
-                            pg_size_pretty(
-                                SUM(LENGTH(response_json::text))::bigint
-                            ) as total_size
-                        FROM response_cache
+                            COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint AS total_entries,
+                            COALESCE(SUM(pg_total_relation_size(c.oid)), 0)::bigint AS total_bytes,
+                            pg_size_pretty(COALESCE(SUM(pg_total_relation_size(c.oid)), 0)::bigint) AS total_size,
+                            COUNT(*) - 1 AS partitions
+                        FROM relations r
+                        JOIN pg_class c ON c.oid = r.oid
                         """
                     )
-                    stats = cur.fetchone()
-                    return {
-                        "enabled": True,
-                        **dict(stats)
-                    }
+                    stats = dict(cur.fetchone())
+                    # Served from idx_created_at, not a table scan
+                    cur.execute(
+                        """
+                        SELECT
+                            (SELECT MAX(created_at) FROM response_cache) AS latest_entry,
+                            (SELECT MIN(created_at) FROM response_cache) AS oldest_entry
+                        """
+                    )
+                    stats.update(cur.fetchone())
+
+            return {
+                "enabled": True,
+                "total_entries_estimated": True,
+                **stats,
+                "counters": cache_counters.snapshot(),
+            }
 
         except Exception as exc:
             logger.error(f"Failed to get cache stats: {exc}")
-            return {"enabled": False, "error": str(exc)}
+            return {"enabled": False, "error": str(exc), "counters": cache_counters.snapshot()}
 
     def health_check(self) -> bool:
         """
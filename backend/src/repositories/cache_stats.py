@@ -0,0 +1,140 @@
+"""
+In-process cache counters.
+Updated on every CacheRepository read/write so monitoring never has to scan
+response_cache. Counters are per worker process and reset on restart.
+"""
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Sequence
+
+# Latency histogram bucket upper bounds in milliseconds (last bucket is +inf)
+LATENCY_BUCKETS_MS: List[float] = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (not thread-safe; callers hold their own lock)."""
+
+    def __init__(self, buckets_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.count = 0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def _quantile(self, q: float) -> float:
+        """Upper bound of the bucket containing the q-quantile (capped at the observed max)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if i < len(self.buckets_ms):
+                    return min(self.buckets_ms[i], round(self.max_ms, 3))
+                return round(self.max_ms, 3)
+        return self.max_ms
+
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram(self.buckets_ms)
+        clone.counts = list(self.counts)
+        clone.total_ms = self.total_ms
+        clone.max_ms = self.max_ms
+        clone.count = self.count
+        return clone
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self._quantile(0.50),
+            "p95_ms": self._quantile(0.95),
+            "p99_ms": self._quantile(0.99),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class CacheCounters:
+    """Thread-safe hit/miss/write/byte/latency counters for the response cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._started_at = time.time()
+            self.hits = 0
+            self.misses = 0
+            self.read_errors = 0
+            self.writes = 0
+            self.write_errors = 0
+            self.bytes_read = 0
+            self.bytes_written = 0
+            self._read_latency = LatencyHistogram()
+            self._write_latency = LatencyHistogram()
+
+    def record_read(self, hit: bool, elapsed_ms: float, size: int = 0) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self.bytes_read += size
+            else:
+                self.misses += 1
+            self._read_latency.observe(elapsed_ms)
+
+    def record_read_error(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.read_errors += 1
+            self._read_latency.observe(elapsed_ms)
+
+    def record_write(self, success: bool, elapsed_ms: float, size: int = 0) -> None:
+        with self._lock:
+            if success:
+                self.writes += 1
+                self.bytes_written += size
+            else:
+                self.write_errors += 1
+            self._write_latency.observe(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "since": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self._started_at)),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "read_errors": self.read_errors,
+                "writes": self.writes,
+                "write_errors": self.write_errors,
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+                "read_latency": self._read_latency.snapshot(),
+                "write_latency": self._write_latency.snapshot(),
+            }
+
+    def export(self) -> Dict[str, Any]:
+        """Raw counters and histogram copies for the Prometheus exporter (src/services/metrics.py)."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "read_errors": self.read_errors,
+                "writes": self.writes,
+                "write_errors": self.write_errors,
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+                "read_latency": self._read_latency.copy(),
+                "write_latency": self._write_latency.copy(),
+            }
+
+
+cache_counters = CacheCounters()
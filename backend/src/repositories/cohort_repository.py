@@ -0,0 +1,63 @@
+from typing import Dict, List, Tuple
+
+from psycopg2.extras import execute_values
+
+from database import get_db_connection
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CohortKey = Tuple[str, str, str]
+
+
+class CohortRepository:
+    """Data access for per-cohort MBA readiness score histograms (mba_cohort_histograms)."""
+
+    def add_counts(self, deltas: Dict[CohortKey, Dict[int, int]]) -> int:
+        """
+        Add per-score count deltas to the stored histograms. Addition commutes,
+        so workers can merge their counts in any order.
+
+        Returns:
+            Number of (cohort, score) rows touched
+        """
+        rows = [
+            (role, experience, maturity_level, score, count)
+            for (role, experience, maturity_level), counts in deltas.items()
+            for score, count in counts.items()
+            if count
+        ]
+        if not rows:
+            return 0
+
+        # Stable order so concurrent flushes lock rows in the same sequence
+        rows.sort()
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO mba_cohort_histograms (role, experience, maturity_level, score, count)
+                    VALUES %s
+                    ON CONFLICT (role, experience, maturity_level, score)
+                    DO UPDATE SET count = mba_cohort_histograms.count + EXCLUDED.count,
+                                  updated_at = CURRENT_TIMESTAMP
+                    """,
+                    rows,
+                    page_size=len(rows)
+                )
+        return len(rows)
+
+    def load_all(self) -> Dict[CohortKey, Dict[int, int]]:
+        """Merged histograms for every cohort (at most 101 rows per cohort)."""
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT role, experience, maturity_level, score, count FROM mba_cohort_histograms"
+                )
+                rows: List[tuple] = cur.fetchall()
+
+        histograms: Dict[CohortKey, Dict[int, int]] = {}
+        for role, experience, maturity_level, score, count in rows:
+            histograms.setdefault((role, experience, maturity_level), {})[score] = count
+        return histograms
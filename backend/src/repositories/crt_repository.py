@@ -0,0 +1,192 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from psycopg2.extras import RealDictCursor, execute_values
+
+from database import get_db_connection
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+from src.utils.jsonb_search import build_containment, decode_cursor, encode_cursor
+
+logger = get_logger(__name__)
+
+
+class CRTRepository:
+    """Data access for Career Roadmap Tool quiz responses (crt_quiz_responses)."""
+
+    def store(self, hash_key: str, quiz_responses: Dict[str, Any]) -> bool:
+        """
+        Persist quiz responses under their MD5 hash if not already stored.
+        The hash is derived from the content, so an existing row is never rewritten.
+
+        Returns:
+            True if a new row was inserted, False if the hash already existed
+        """
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                # crt_quiz_responses is partitioned by created_at, so hash_key
+                # uniqueness is enforced with a per-hash advisory lock.
+                cur.execute(
+                    "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+                    (f"crt_quiz_responses:{hash_key}",)
+                )
+                cur.execute(
+                    """
+                    INSERT INTO crt_quiz_responses (hash_key, quiz_responses)
+                    SELECT %s, %s::jsonb
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM crt_quiz_responses WHERE hash_key = %s
+                    )
+                    """,
+                    (hash_key, json.dumps(quiz_responses), hash_key)
+                )
+                return cur.rowcount > 0
+
+    def store_many(self, entries: List[Tuple[str, Dict[str, Any]]]) -> Tuple[int, Dict[str, datetime]]:
+        """
+        Persist a batch of (hash_key, quiz_responses) in one multi-row insert,
+        skipping hashes that are already stored. Same uniqueness rules as store().
+
+        Returns:
+            (number of new rows inserted, created_at of each hash's stored row);
+            created_at decides when retention drops the row's partition
+        """
+        if not entries:
+            return 0, {}
+        # NOT EXISTS cannot see rows inserted by this same statement; hashes are content-derived
+        entries = list(dict(entries).items())
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                # The partitioned table has no unique constraint on hash_key: these locks plus
+                # NOT EXISTS are what keep hashes unique. Lock in a stable order so concurrent
+                # batches cannot deadlock
+                cur.execute(
+                    """
+                    SELECT pg_advisory_xact_lock(hashtextextended('crt_quiz_responses:' || hash_key, 0))
+                    FROM unnest(%s::text[]) AS hash_key
+                    ORDER BY hash_key
+                    """,
+                    (sorted(hash_key for hash_key, _ in entries),)
+                )
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO crt_quiz_responses (hash_key, quiz_responses)
+                    SELECT v.hash_key, v.quiz_responses::jsonb
+                    FROM (VALUES %s) AS v(hash_key, quiz_responses)
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM crt_quiz_responses c WHERE c.hash_key = v.hash_key
+                    )
+                    """,
+                    [(hash_key, json.dumps(quiz_responses)) for hash_key, quiz_responses in entries],
+                    page_size=len(entries)
+                )
+                inserted = cur.rowcount
+                cur.execute(
+                    """
+                    SELECT hash_key, MIN(created_at)
+                    FROM crt_quiz_responses
+                    WHERE hash_key = ANY(%s)
+                    GROUP BY hash_key
+                    """,
+                    ([hash_key for hash_key, _ in entries],)
+                )
+                return inserted, dict(cur.fetchall())
+
+    def search(
+        self,
+        filters: Dict[str, str],
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Search CRT submissions by quiz_responses fields (admin only).
+        Mirrors CacheRepository.search: GIN-backed containment, keyset
+        pagination on (created_at, id) and a statement timeout.
+
+        Args:
+            filters: Dotted quiz_responses paths to values, e.g. {"targetRole": "backend-sde"}
+            limit: Page size (capped at settings.admin_search_max_limit)
+            cursor: Opaque cursor from a previous page's next_cursor
+
+        Returns:
+            Dictionary with items and next_cursor (None on the last page)
+        """
+        limit = max(1, min(limit, settings.admin_search_max_limit))
+        containment = json.dumps(build_containment(filters))
+        after = decode_cursor(cursor)
+
+        query = """
+            SELECT id, hash_key, quiz_responses, created_at
+            FROM crt_quiz_responses
+            WHERE quiz_responses @> %s::jsonb
+        """
+        params: list = [containment]
+        if after:
+            query += " AND (created_at, id) < (%s, %s)"
+            params.extend(after)
+        query += " ORDER BY created_at DESC, id DESC LIMIT %s"
+        params.append(limit + 1)
+
+        with get_db_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    "SET LOCAL statement_timeout = %s",
+                    (settings.admin_search_timeout_ms,)
+                )
+                cur.execute(query, params)
+                rows = cur.fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        items = [
+            {
+                "hash_key": row["hash_key"],
+                "quiz_responses": row["quiz_responses"],
+                "created_at": row["created_at"].isoformat() if row["created_at"] else None,
+            }
+            for row in rows
+        ]
+        next_cursor = None
+        if has_more and rows[-1]["created_at"]:
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+        return {"items": items, "next_cursor": next_cursor}
+
+    def iter_export(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        fetch_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream crt_quiz_responses rows through a named (server-side) cursor.
+        See CacheRepository.iter_export.
+
+        Yields:
+            Row dictionaries (hash_key, quiz_responses, created_at)
+        """
+        conditions = []
+        params: list = []
+        if since is not None:
+            conditions.append("created_at >= %s")
+            params.append(since)
+        if until is not None:
+            conditions.append("created_at < %s")
+            params.append(until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT hash_key, quiz_responses, created_at
+            FROM crt_quiz_responses
+            {where}
+            ORDER BY created_at, id
+        """
+
+        with get_db_connection() as conn:
+            with conn.cursor(name="export_crt_quiz_responses", cursor_factory=RealDictCursor) as cur:
+                cur.itersize = fetch_size or settings.export_fetch_size
+                cur.execute(query, params)
+                for row in cur:
+                    yield row
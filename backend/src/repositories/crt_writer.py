@@ -0,0 +1,197 @@
+"""
+Write path for /crt/store.
+
+Hashes are content-derived (MD5 of the normalized quiz responses), so a hash
+that has already been persisted needs no further round trip while its row
+exists. With CRT_RETENTION_MONTHS set, partition maintenance drops rows once
+their created_at month leaves the retention window, so a known hash expires
+(a day early) at that point and its next submit stores it again. New hashes
+are queued and written by a single background thread in multi-row batches
+(group commit); each caller gets a Future that resolves once its batch is
+committed, so failures still reach the request.
+"""
+import atexit
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+from src.repositories.crt_repository import CRTRepository
+
+logger = get_logger(__name__)
+
+_STOP = object()
+
+
+# Expire known hashes this long before retention can drop their partition
+RETENTION_SAFETY_MARGIN = timedelta(days=1)
+
+
+def retained_until(created_at: datetime, retention_months: Optional[int]) -> Optional[float]:
+    """
+    Epoch seconds after which a row created at created_at may have been dropped
+    by partition maintenance (None: kept forever). Retention keeps whole months,
+    so the row lives until the first day of its month plus retention_months.
+    """
+    if not retention_months:
+        return None
+    index = created_at.year * 12 + (created_at.month - 1) + retention_months
+    dropped_from = created_at.replace(
+        year=index // 12, month=index % 12 + 1, day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    return (dropped_from - RETENTION_SAFETY_MARGIN).timestamp()
+
+
+class KnownHashCache:
+    """Thread-safe LRU set of hashes known to be persisted, each valid until an optional expiry."""
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._hashes: "OrderedDict[str, Optional[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, hash_key: str) -> bool:
+        with self._lock:
+            if hash_key not in self._hashes:
+                return False
+            expires_at = self._hashes[hash_key]
+            if expires_at is not None and time.time() >= expires_at:
+                del self._hashes[hash_key]
+                return False
+            self._hashes.move_to_end(hash_key)
+            return True
+
+    def add(self, hash_key: str, expires_at: Optional[float] = None) -> None:
+        with self._lock:
+            self._hashes[hash_key] = expires_at
+            self._hashes.move_to_end(hash_key)
+            while len(self._hashes) > self._capacity:
+                self._hashes.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._hashes)
+
+
+class CRTBatchWriter:
+    """Micro-batching writer for CRT quiz responses (one per worker process)."""
+
+    def __init__(
+        self,
+        repository: Optional[CRTRepository] = None,
+        flush_interval_ms: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        known_hash_capacity: Optional[int] = None,
+    ):
+        self._repository = repository or CRTRepository()
+        self._flush_interval = (flush_interval_ms or settings.crt_flush_interval_ms) / 1000
+        self._max_batch_size = max_batch_size or settings.crt_max_batch_size
+        self.known_hashes = KnownHashCache(known_hash_capacity or settings.crt_known_hash_cache_size)
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, hash_key: str, quiz_responses: Dict[str, Any]) -> Future:
+        """
+        Queue quiz responses for persistence.
+
+        Returns:
+            Future resolving to True once the hash is stored (immediately for known hashes)
+        """
+        if hash_key in self.known_hashes:
+            future: Future = Future()
+            future.set_result(True)
+            return future
+
+        with self._lock:
+            pending = self._inflight.get(hash_key)
+            if pending is not None:
+                return pending
+            future = Future()
+            self._inflight[hash_key] = future
+            self._ensure_started()
+
+        self._queue.put((hash_key, quiz_responses))
+        return future
+
+    def _ensure_started(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            if self._thread is None:
+                atexit.register(self.close)
+            self._thread = threading.Thread(target=self._run, name="crt-batch-writer", daemon=True)
+            self._thread.start()
+
+    def _next_batch(self) -> Tuple[List[Tuple[str, Dict[str, Any]]], bool]:
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        error: Optional[BaseException] = None
+        created_at: Dict[str, datetime] = {}
+        try:
+            inserted, created_at = self._repository.store_many(batch)
+            logger.info(f"💾 CRT batch flushed: {len(batch)} submitted, {inserted} new")
+        except Exception as exc:
+            logger.error(f"CRT batch write failed ({len(batch)} entries): {exc}")
+            error = exc
+
+        with self._lock:
+            futures = [self._inflight.pop(hash_key) for hash_key, _ in batch]
+        for (hash_key, _), future in zip(batch, futures):
+            if error is None:
+                if hash_key in created_at:
+                    self.known_hashes.add(
+                        hash_key, retained_until(created_at[hash_key], settings.crt_retention_months)
+                    )
+                future.set_result(True)
+            else:
+                future.set_exception(error)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush anything queued and stop the writer thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+
+_writer: Optional[CRTBatchWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_crt_writer() -> CRTBatchWriter:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = CRTBatchWriter()
+        return _writer
@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from psycopg2.extras import RealDictCursor, execute_values
+
+from database import get_db_connection
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Column order of the rows passed to insert_calls()
+LLM_CALL_COLUMNS = (
+    "created_at", "endpoint", "model", "evaluation_id", "cache_hit", "success", "attempts", "corrected",
+    "prompt_tokens", "cached_prompt_tokens", "completion_tokens", "latency_ms", "cost_usd", "error",
+)
+
+
+class LLMUsageRepository:
+    """Data access for per-call LLM token, latency and cost rows (llm_calls)."""
+
+    def insert_calls(self, rows: Sequence[Sequence[Any]]) -> int:
+        """
+        Insert accounting rows (values in LLM_CALL_COLUMNS order) in one statement.
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    f"INSERT INTO llm_calls ({', '.join(LLM_CALL_COLUMNS)}) VALUES %s",
+                    rows,
+                    page_size=len(rows)
+                )
+        return len(rows)
+
+    def summary(self, since: datetime, until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Totals per (endpoint, model) over all workers for calls made in [since, until).
+
+        Dollars saved by cache hits are the number of hits times the average cost
+        of a successful call for the same endpoint and model in the window.
+        """
+        with get_db_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(
+                    """
+                    WITH windowed AS (
+                        SELECT * FROM llm_calls
+                        WHERE created_at >= %(since)s
+                          AND (%(until)s::timestamp IS NULL OR created_at < %(until)s::timestamp)
+                    ),
+                    totals AS (
+                        SELECT
+                            endpoint,
+                            model,
+                            COUNT(*) FILTER (WHERE NOT cache_hit) AS calls,
+                            COUNT(*) FILTER (WHERE NOT cache_hit AND NOT success) AS failures,
+                            COUNT(*) FILTER (WHERE NOT cache_hit AND corrected) AS corrected_calls,
+                            COALESCE(SUM(attempts) FILTER (WHERE NOT cache_hit), 0) AS attempts,
+                            COALESCE(SUM(prompt_tokens), 0) AS prompt_tokens,
+                            COALESCE(SUM(cached_prompt_tokens), 0) AS cached_prompt_tokens,
+                            COUNT(*) FILTER (WHERE cached_prompt_tokens > 0) AS prefix_cached_calls,
+                            COALESCE(SUM(completion_tokens), 0) AS completion_tokens,
+                            COALESCE(SUM(cost_usd), 0) AS cost_usd,
+                            AVG(cost_usd) FILTER (WHERE NOT cache_hit AND success) AS avg_call_cost_usd,
+                            AVG(latency_ms) FILTER (WHERE NOT cache_hit) AS avg_latency_ms,
+                            percentile_cont(0.95) WITHIN GROUP (ORDER BY latency_ms)
+                                FILTER (WHERE NOT cache_hit) AS p95_latency_ms,
+                            COUNT(*) FILTER (WHERE cache_hit) AS cache_hits
+                        FROM windowed
+                        GROUP BY endpoint, model
+                    )
+                    SELECT
+                        *,
+                        ROUND(cached_prompt_tokens::numeric / NULLIF(prompt_tokens, 0), 4) AS prefix_cache_hit_rate,
+                        ROUND((cache_hits * COALESCE(avg_call_cost_usd, 0))::numeric, 4) AS saved_by_cache_usd
+                    FROM totals
+                    ORDER BY cost_usd DESC, endpoint, model
+                    """,
+                    {"since": since, "until": until}
+                )
+                rows = cur.fetchall()
+
+        report = []
+        for row in rows:
+            entry = dict(row)
+            for key in ("cost_usd", "avg_call_cost_usd", "avg_latency_ms", "p95_latency_ms", "saved_by_cache_usd"):
+                if entry[key] is not None:
+                    entry[key] = round(float(entry[key]), 6 if "usd" in key else 1)
+            if entry["prefix_cache_hit_rate"] is not None:
+                entry["prefix_cache_hit_rate"] = float(entry["prefix_cache_hit_rate"])
+            report.append(entry)
+        return report
@@ -0,0 +1,101 @@
+"""
+In-process connection pool usage counters.
+Updated on every getconn/putconn of the psycopg2 pools so load tests and
+monitoring can see how close a worker runs to its pool limit. psycopg2's
+SimpleConnectionPool never waits: a full pool raises PoolError, counted
+here as exhausted. Counters are per worker process and reset on restart.
+"""
+import threading
+import time
+from typing import Any, Dict, List
+
+from src.repositories.cache_stats import LatencyHistogram
+
+# Acquiring a pooled connection is sub-millisecond; opening a new one is not
+ACQUIRE_BUCKETS_MS: List[float] = [0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250]
+
+
+class PoolUsage:
+    """Thread-safe in-use, peak, exhaustion and acquire-latency counters for one pool."""
+
+    def __init__(self, name: str, max_size: int):
+        self.name = name
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._started_at = time.time()
+            self.in_use = 0
+            self.peak_in_use = 0
+            self.acquisitions = 0
+            self.exhausted = 0
+            self._acquire_latency = LatencyHistogram(ACQUIRE_BUCKETS_MS)
+
+    def record_acquire(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.acquisitions += 1
+            self._acquire_latency.observe(elapsed_ms)
+
+    def record_release(self) -> None:
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "since": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self._started_at)),
+                "max_size": self.max_size,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "utilization": round(self.in_use / self.max_size, 4) if self.max_size else None,
+                "peak_utilization": round(self.peak_in_use / self.max_size, 4) if self.max_size else None,
+                "acquisitions": self.acquisitions,
+                "exhausted": self.exhausted,
+                "acquire_latency": self._acquire_latency.snapshot(),
+            }
+
+    def export(self) -> Dict[str, Any]:
+        """Raw counters and a histogram copy for the Prometheus exporter (src/services/metrics.py)."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "max_size": self.max_size,
+                "in_use": self.in_use,
+                "acquisitions": self.acquisitions,
+                "exhausted": self.exhausted,
+                "acquire_latency": self._acquire_latency.copy(),
+            }
+
+
+_pools: Dict[str, PoolUsage] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool_usage(name: str, max_size: int) -> PoolUsage:
+    """Counters for the named pool (one per name; instances of the same pool share them)."""
+    with _pools_lock:
+        usage = _pools.get(name)
+        if usage is None:
+            usage = _pools[name] = PoolUsage(name, max_size)
+        return usage
+
+
+def pool_usage_snapshot() -> List[Dict[str, Any]]:
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [usage.snapshot() for usage in sorted(pools, key=lambda usage: usage.name)]
+
+
+def pool_usage_export() -> List[Dict[str, Any]]:
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [usage.export() for usage in sorted(pools, key=lambda usage: usage.name)]
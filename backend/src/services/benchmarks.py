@@ -0,0 +1,386 @@
+"""
+Micro-benchmarks for the deterministic engines and serialization hot paths.
+
+Each benchmark runs one function over a fixed, seeded set of realistic inputs
+(quiz option grid answers, MBA answers from the scoring maps, a schema-valid
+evaluation from the OpenAI stand-in) and reports the best time per call over
+several timeit rounds, with GC disabled during timing.
+
+Results are compared with benchmarks/baseline.json, which is only
+meaningful on the machine and Python version that recorded it (re-record
+with --update, e.g. once per CI runner type). The CLI runs with
+PYTHONHASHSEED=0, as dict and set layout shifts µs-scale timings between
+processes, and with the production log configuration (Settings' default
+LOG_LEVEL and LOG_FORMAT) writing to os.devnull, so hot-path logging is
+measured whatever the caller's environment sets. A benchmark regresses when it is more than --threshold percent
+(default 20) slower than the baseline, confirmed by re-measuring it; the
+command then exits 1.
+
+CLI:
+    python -m src.services.benchmarks                     # compare with the baseline
+    python -m src.services.benchmarks --update            # record a new baseline
+    python -m src.services.benchmarks -k mba --threshold 10
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+BASELINE_PATH = Path(__file__).resolve().parents[2] / "benchmarks" / "baseline.json"
+DEFAULT_THRESHOLD_PERCENT = 20.0
+DEFAULT_REPEAT = 5
+# Re-measurements of an apparent regression before it fails the run
+CONFIRM_ROUNDS = 2
+# Inputs per benchmark pass; times are reported per call
+INPUT_COUNT = 64
+
+# Returns (run one pass over the inputs, calls per pass)
+BenchmarkSetup = Callable[[], Tuple[Callable[[], Any], int]]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: BenchmarkSetup
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    def register(setup: BenchmarkSetup) -> BenchmarkSetup:
+        BENCHMARKS.append(Benchmark(name, setup))
+        return setup
+    return register
+
+
+def _quiz_inputs() -> List[Tuple[str, Dict[str, Any]]]:
+    """Every n-th (background, quiz_responses) of the quiz option grid, tech and non-tech."""
+    from src.services.profile_enrichment import iter_option_grid, option_grid_size
+
+    step = max(1, option_grid_size() // INPUT_COUNT)
+    return [item for index, item in enumerate(iter_option_grid()) if index % step == 0][:INPUT_COUNT]
+
+
+def _mba_inputs() -> List[Dict[str, Any]]:
+    """Seeded MBA quiz responses across all roles and experience bands."""
+    from src.services.mba_lookup import ROLE_QUESTION_PREFIXES
+    from src.services.mba_scoring_orchestrator import EXPERIENCE_SCORES
+    from src.services.mba_skill_scoring_maps import ANSWER_SCORES
+
+    rng = random.Random(0)
+    roles = list(ROLE_QUESTION_PREFIXES)
+    responses = []
+    for index in range(INPUT_COUNT):
+        role = roles[index % len(roles)]
+        response = {'role': role, 'experience': rng.choice(list(EXPERIENCE_SCORES))}
+        for question_key, answers in ANSWER_SCORES.items():
+            if question_key.startswith(ROLE_QUESTION_PREFIXES[role]):
+                response[question_key] = rng.choice(list(answers))
+        responses.append(response)
+    return responses
+
+
+def _raw_evaluation():
+    """A schema-valid FullProfileEvaluationResponseRaw, as the LLM would return it."""
+    from src.models.models_raw import FullProfileEvaluationResponseRaw
+    from src.services.openai_stub import SchemaFiller
+    from src.services.run_poc import _strict_response_schema
+
+    schema = _strict_response_schema()
+    return FullProfileEvaluationResponseRaw.model_validate(SchemaFiller(schema, random.Random(0)).fill(schema))
+
+
+@benchmark("calculate_mba_readiness_score")
+def _bench_mba_readiness():
+    from src.services.mba_scoring_orchestrator import calculate_mba_readiness_score
+
+    inputs = _mba_inputs()
+
+    def run():
+        for responses in inputs:
+            calculate_mba_readiness_score(responses)
+    return run, len(inputs)
+
+
+@benchmark("infer_skills_from_responses")
+def _bench_infer_skills():
+    from src.services.mba_skill_inference import infer_skills_from_responses
+
+    inputs = [(responses['role'], responses) for responses in _mba_inputs()]
+
+    def run():
+        for role, responses in inputs:
+            infer_skills_from_responses(role, responses)
+    return run, len(inputs)
+
+
+@benchmark("match_persona")
+def _bench_match_persona():
+    from src.services.mba_persona_matcher import match_persona
+    from src.services.mba_scoring_orchestrator import calculate_mba_readiness_score
+
+    inputs = [(responses['role'], calculate_mba_readiness_score(responses)) for responses in _mba_inputs()]
+
+    def run():
+        for role, readiness in inputs:
+            match_persona(role, readiness)
+    return run, len(inputs)
+
+
+@benchmark("get_ai_tools_for_role")
+def _bench_ai_tools():
+    from src.services.mba_ai_tools import get_ai_tools_for_role
+    from src.services.mba_skill_inference import infer_skills_from_responses
+
+    inputs = [
+        (responses['role'], infer_skills_from_responses(responses['role'], responses)['gaps'])
+        for responses in _mba_inputs()
+    ]
+
+    def run():
+        for role, gaps in inputs:
+            get_ai_tools_for_role(role, gaps)
+    return run, len(inputs)
+
+
+@benchmark("calculate_profile_strength")
+def _bench_profile_strength():
+    from src.services.scoring_logic import calculate_profile_strength
+
+    inputs = _quiz_inputs()
+
+    def run():
+        for background, quiz_responses in inputs:
+            calculate_profile_strength(background, quiz_responses)
+    return run, len(inputs)
+
+
+@benchmark("calculate_interview_readiness")
+def _bench_interview_readiness():
+    from src.services.interview_readiness_logic import calculate_interview_readiness
+
+    inputs = _quiz_inputs()
+
+    def run():
+        for background, quiz_responses in inputs:
+            calculate_interview_readiness(background, quiz_responses)
+    return run, len(inputs)
+
+
+@benchmark("generate_recommended_roles")
+def _bench_recommended_roles():
+    from src.services.job_descriptions import generate_recommended_roles
+
+    inputs = _quiz_inputs()
+
+    def run():
+        for background, quiz_responses in inputs:
+            generate_recommended_roles(background, quiz_responses)
+    return run, len(inputs)
+
+
+@benchmark("generate_recommended_roles[cold]")
+def _bench_recommended_roles_cold():
+    from src.services.job_descriptions import _cached_cards, generate_recommended_roles
+
+    inputs = _quiz_inputs()
+
+    def run():
+        for background, quiz_responses in inputs:
+            _cached_cards.cache_clear()
+            generate_recommended_roles(background, quiz_responses)
+    return run, len(inputs)
+
+
+@benchmark("enrich_full_profile_evaluation")
+def _bench_enrich():
+    from src.models import enrich_full_profile_evaluation
+
+    raw = _raw_evaluation()
+
+    def run():
+        enrich_full_profile_evaluation(raw)
+    return run, 1
+
+
+@benchmark("FullProfileEvaluationResponse.model_dump_json")
+def _bench_response_serialize():
+    from src.models import enrich_full_profile_evaluation
+
+    response = enrich_full_profile_evaluation(_raw_evaluation())
+
+    def run():
+        response.model_dump_json()
+    return run, 1
+
+
+@benchmark("FullProfileEvaluationResponse.model_validate_json")
+def _bench_response_deserialize():
+    from src.models import FullProfileEvaluationResponse, enrich_full_profile_evaluation
+
+    response_json = enrich_full_profile_evaluation(_raw_evaluation()).model_dump_json()
+
+    def run():
+        FullProfileEvaluationResponse.model_validate_json(response_json)
+    return run, 1
+
+
+@benchmark("CacheRepository.generate_cache_key")
+def _bench_cache_key():
+    from src.repositories.cache_repository import CacheRepository
+
+    inputs = [
+        {
+            "background": background,
+            "quizResponses": {**quiz_responses, "mockInterviews": "never", "currentCompany": "Product Company"},
+            "goals": {"requirementType": [], "targetCompany": "Not specified", "topicOfInterest": []},
+        }
+        for background, quiz_responses in _quiz_inputs()
+    ]
+
+    def run():
+        for payload in inputs:
+            CacheRepository.generate_cache_key(payload, "gpt-4o")
+    return run, len(inputs)
+
+
+def measure(run: Callable[[], Any], calls_per_run: int, repeat: int = DEFAULT_REPEAT) -> float:
+    """Best nanoseconds per call over `repeat` rounds of ~0.2 s each."""
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number / calls_per_run * 1e9
+
+
+def run_benchmarks(
+    pattern: Optional[str] = None,
+    repeat: int = DEFAULT_REPEAT,
+    names: Optional[Set[str]] = None,
+) -> Dict[str, Any]:
+    """Measure every benchmark whose name contains `pattern` (or is in `names`)."""
+    from src.config.registry import config_registry
+
+    config_registry.load_all()
+    results = {}
+    for bench in BENCHMARKS:
+        if (pattern and pattern not in bench.name) or (names is not None and bench.name not in names):
+            continue
+        run, calls = bench.setup()
+        run()  # warm caches and lazily compiled state
+        results[bench.name] = {"ns_per_call": round(measure(run, calls, repeat), 1)}
+    return {
+        "metadata": {
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "benchmarks": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold_percent: float) -> List[Dict[str, Any]]:
+    """Per benchmark: current and baseline times, change and regression flag."""
+    rows = []
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        row = {"name": name, "ns_per_call": result["ns_per_call"], "baseline_ns": None,
+               "change_percent": None, "regressed": False}
+        if base:
+            change = (result["ns_per_call"] / base["ns_per_call"] - 1) * 100
+            row.update(baseline_ns=base["ns_per_call"], change_percent=round(change, 1),
+                       regressed=change > threshold_percent)
+        rows.append(row)
+    return rows
+
+
+def _format_ns(ns: Optional[float]) -> str:
+    if ns is None:
+        return "-"
+    for unit, size in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= size:
+            return f"{ns / size:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def _setup_benchmark_logging() -> None:
+    """Production logging (level, formatter, handler) with the output discarded."""
+    from src.config.logging_config import setup_logging
+    from src.config.settings import Settings, settings
+
+    for field in ("log_level", "log_format"):
+        setattr(settings, field, Settings.model_fields[field].default)
+    setup_logging()
+    devnull = open(os.devnull, "w", encoding="utf-8")
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler):
+            handler.setStream(devnull)
+
+
+def main(argv: Optional[list] = None) -> int:
+
+    parser = argparse.ArgumentParser(description="Run micro-benchmarks and compare them with the stored baseline")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PERCENT,
+                        help="Fail when a benchmark is this many percent slower than the baseline")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update", action="store_true", help="Write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    if argv is None and os.environ.get("PYTHONHASHSEED") != "0":
+        os.execve(sys.executable, sys.orig_argv, {**os.environ, "PYTHONHASHSEED": "0"})
+
+    _setup_benchmark_logging()
+    current = run_benchmarks(args.pattern, args.repeat)
+
+    if args.update:
+        if args.pattern and args.baseline.exists():
+            # Partial runs only replace the benchmarks they measured
+            stored = json.loads(args.baseline.read_text())
+            current["benchmarks"] = {**stored["benchmarks"], **current["benchmarks"]}
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"Baseline with {len(current['benchmarks'])} benchmarks written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; record one with --update", file=sys.stderr)
+        return 2
+    baseline = json.loads(args.baseline.read_text())
+    recorded_on = {key: baseline["metadata"].get(key) for key in ("python", "machine")}
+    if recorded_on != {key: current["metadata"][key] for key in ("python", "machine")}:
+        print(f"Baseline was recorded on {recorded_on}; timings may not be comparable", file=sys.stderr)
+    rows = compare(current, baseline, args.threshold)
+    for _ in range(CONFIRM_ROUNDS):
+        suspects = {row["name"] for row in rows if row["regressed"]}
+        if not suspects:
+            break
+        # Keep the faster measurement; a real regression stays slow every time
+        for name, result in run_benchmarks(repeat=args.repeat, names=suspects)["benchmarks"].items():
+            if result["ns_per_call"] < current["benchmarks"][name]["ns_per_call"]:
+                current["benchmarks"][name] = result
+        rows = compare(current, baseline, args.threshold)
+
+    width = max(len(row["name"]) for row in rows)
+    print(f"{'benchmark':<{width}} {'current':>10} {'baseline':>10} {'change':>8}")
+    for row in rows:
+        change = "new" if row["change_percent"] is None else f"{row['change_percent']:+.1f}%"
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(f"{row['name']:<{width}} {_format_ns(row['ns_per_call']):>10} {_format_ns(row['baseline_ns']):>10} {change:>8}{flag}")
+    regressions = [row["name"] for row in rows if row["regressed"]]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:g}%: "
+              f"{', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
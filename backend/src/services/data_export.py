@@ -0,0 +1,103 @@
+"""
+Streaming NDJSON export of response_cache and crt_quiz_responses.
+Rows come from server-side cursors and are gzip-compressed incrementally,
+so memory stays constant regardless of table size.
+
+CLI:
+    python -m src.services.data_export response_cache --since 2025-01-01 -o cache.ndjson.gz
+"""
+import argparse
+import json
+import sys
+import zlib
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from src.repositories.cache_repository import CacheRepository
+from src.repositories.crt_repository import CRTRepository
+from src.config.exceptions import NotFoundError
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Flush the compressor once this many uncompressed bytes are buffered
+_CHUNK_BYTES = 64 * 1024
+
+EXPORT_TABLES: Dict[str, Callable[[], Any]] = {
+    "response_cache": CacheRepository,
+    "crt_quiz_responses": CRTRepository,
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def iter_export_records(
+    table: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    fetch_size: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield rows of an exportable table within the [since, until) created_at range."""
+    repository_cls = EXPORT_TABLES.get(table)
+    if repository_cls is None:
+        raise NotFoundError(f"Unknown export table: {table}")
+    return repository_cls().iter_export(since=since, until=until, fetch_size=fetch_size)
+
+
+def iter_gzip_ndjson(records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode records as NDJSON and yield gzip-compressed chunks."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    buffer = bytearray()
+    count = 0
+
+    for record in records:
+        buffer += json.dumps(record, default=_json_default, separators=(",", ":")).encode("utf-8")
+        buffer += b"\n"
+        count += 1
+        if len(buffer) >= _CHUNK_BYTES:
+            chunk = compressor.compress(bytes(buffer))
+            buffer.clear()
+            if chunk:
+                yield chunk
+
+    tail = compressor.compress(bytes(buffer)) + compressor.flush()
+    if tail:
+        yield tail
+    logger.info(f"Exported {count} rows as gzip NDJSON")
+
+
+def stream_export(
+    table: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    fetch_size: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Gzip NDJSON byte stream for a table, suitable for a StreamingResponse."""
+    return iter_gzip_ndjson(iter_export_records(table, since, until, fetch_size))
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export a table as gzip NDJSON")
+    parser.add_argument("table", choices=sorted(EXPORT_TABLES))
+    parser.add_argument("--since", type=datetime.fromisoformat, help="created_at >= SINCE (ISO 8601)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="created_at < UNTIL (ISO 8601)")
+    parser.add_argument("--fetch-size", type=int, default=None, help="Rows per server-side cursor fetch")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        for chunk in stream_export(args.table, args.since, args.until, args.fetch_size):
+            out.write(chunk)
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""
+Bulk cache import/restore from an NDJSON export (see data_export).
+Seeds response_cache in a new environment so users do not pay for a
+gpt-4o miss on evaluations that were already computed elsewhere.
+
+CLI:
+    python -m src.services.data_import cache.ndjson.gz
+"""
+import argparse
+import gzip
+import json
+import sys
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+
+from src.repositories.cache_repository import CacheRepository
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_REQUIRED_FIELDS = ("cache_key", "model", "response_json")
+
+
+def _open_export(path: str) -> BinaryIO:
+    """Open an export file, transparently decompressing gzip."""
+    stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    if stream.peek(2)[:2] == b"\x1f\x8b":
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+def iter_ndjson_records(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Yield valid cache records from an NDJSON stream, skipping malformed lines."""
+    skipped = 0
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            skipped += 1
+            logger.warning(f"Skipping line {line_no}: invalid JSON")
+            continue
+        if not all(record.get(field) is not None for field in _REQUIRED_FIELDS):
+            skipped += 1
+            logger.warning(f"Skipping line {line_no}: missing one of {_REQUIRED_FIELDS}")
+            continue
+        yield record
+
+    if skipped:
+        logger.warning(f"Skipped {skipped} malformed export lines")
+
+
+def import_cache(path: str, batch_size: Optional[int] = None) -> int:
+    """Import a response_cache NDJSON export; returns the number of merged rows."""
+    with _open_export(path) as stream:
+        merged = CacheRepository().bulk_import(iter_ndjson_records(stream), batch_size=batch_size)
+    logger.info(f"Cache import complete: {merged} rows merged from {path}")
+    return merged
+
+
+def main(argv: Optional[list] = None) -> int:
+    from src.config.logging_config import setup_logging
+
+    parser = argparse.ArgumentParser(description="Import a response_cache NDJSON export (gzip or plain)")
+    parser.add_argument("path", help="Export file, or - for stdin")
+    parser.add_argument("--batch-size", type=int, default=None, help="Rows per COPY/merge transaction")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    merged = import_cache(args.path, batch_size=args.batch_size)
+    print(f"Merged {merged} rows", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
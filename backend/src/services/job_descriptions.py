@@ -7,15 +7,23 @@ Generates 3 career timeline cards:
 3. Different role + target company (alternative specialization)
 
 For non-tech exploring users: Shows 2 intern roles (frontend + backend)
+
+The cards are built once per request and projected into both the
+JobOpportunityCard and RecommendedRole views (generate_career_cards).
 """
 
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from src.models.models import JobOpportunityCard, RecommendedRole
 from src.services.persona_matcher import (
     get_matching_persona,
     get_alternative_role
 )
-from src.services.timeline_logic import calculate_timeline_for_card
+from src.services.persona_store import get_persona_store
+from src.services.timeline_logic import build_card_timeline, calculate_timeline_adjustment
+
+# (persona, target role, target company, timeline adjustment) combinations kept per worker
+CARD_CACHE_SIZE = 4096
 
 
 def _format_role_display(role: str, company_type: Optional[str] = None) -> str:
@@ -135,22 +143,106 @@ def _generate_exploring_cards(persona_id: str) -> List[JobOpportunityCard]:
     ]
 
 
-def generate_job_opportunities(
+# Per-card copy for each view: (key_focus) and (reason template, key_gap, confidence)
+_CARD_KEY_FOCUS = {
+    "target": "Your stated goal - focus on these areas",
+    "alternative_1_easier_company": "Easier entry point - faster timeline",
+    "alternative_2_different_role": "Alternative specialization - expands your options",
+}
+_CARD_REASONS = {
+    "target": ("Your stated target role at {company}", "Primary focus area", "high"),
+    "alternative_1_easier_company": ("Same role, easier entry point at {company}", "Faster path to your goal", "high"),
+    "alternative_2_different_role": (
+        "Alternative specialization at {company} - expands your options", "New specialization", "medium"
+    ),
+}
+
+CardPair = Tuple[JobOpportunityCard, RecommendedRole]
+
+
+def _project_card(card_type: str, role: str, company: str, timeline: Dict[str, Any]) -> CardPair:
+    """Build both views of one card from its timeline."""
+    title = _format_role_display(role, company)
+    reason, key_gap, confidence = _CARD_REASONS[card_type]
+
+    opportunity = JobOpportunityCard(
+        title=title,
+        role=role,
+        copy=timeline["copy"],
+        goal=timeline["goal"],
+        action_items=timeline["action_items"],
+        key_focus=_CARD_KEY_FOCUS[card_type],
+        milestones=timeline["milestones"],
+        min_months=timeline["min_months"],
+        max_months=timeline["max_months"],
+        timeline_text=timeline["timeline_text"],
+        card_type=card_type
+    )
+    recommended = RecommendedRole(
+        title=title,
+        role=role,
+        seniority="Entry",  # Would be derived from role ID in production
+        reason=reason.format(company=_format_company_display(company)),
+        key_gap=key_gap,
+        milestones=timeline["milestones"],
+        timeline_text=timeline["timeline_text"],
+        min_months=timeline["min_months"],
+        max_months=timeline["max_months"],
+        card_type=card_type,
+        confidence=confidence
+    )
+    return opportunity, recommended
+
+
+def _build_cards(persona_id: str, target_role: str, target_company: str, adjustment: int) -> Tuple[CardPair, ...]:
+    """
+    The 3 cards: target role + target company, same role + easier company,
+    different role + target company (only if the persona has an alternative).
+    """
+    easier_company = _get_easier_company(target_company)
+    cards = [
+        _project_card(
+            "target", target_role, target_company,
+            build_card_timeline(persona_id, "target", adjustment)
+        ),
+        _project_card(
+            "alternative_1_easier_company", target_role, easier_company,
+            build_card_timeline(persona_id, "alternative_1_easier_company", adjustment)
+        ),
+    ]
+
+    alt_role = get_alternative_role(persona_id, target_role)
+    if alt_role:
+        cards.append(_project_card(
+            "alternative_2_different_role", alt_role, target_company,
+            build_card_timeline(persona_id, "alternative_2_different_role", adjustment)
+        ))
+
+    return tuple(cards)
+
+
+@lru_cache(maxsize=CARD_CACHE_SIZE)
+def _cached_cards(
+    persona_version: int, persona_id: str, target_role: str, target_company: str, adjustment: int
+) -> Tuple[CardPair, ...]:
+    # persona_version keys out cards built from an older personas.json
+    return _build_cards(persona_id, target_role, target_company, adjustment)
+
+
+def generate_career_cards(
     background: str,
     quiz_responses: Dict[str, Any]
-) -> List[JobOpportunityCard]:
+) -> Tuple[List[JobOpportunityCard], List[RecommendedRole]]:
     """
-    Generate 3 career timeline cards for the user.
-
-    For non-tech exploring users: Returns 2 intern cards
-    For others: Returns 3 cards (target, alternative_1_easier_company, alternative_2_different_role)
+    Compute the career timeline cards once and return both views:
+    (job opportunity cards, recommended roles).
 
-    Args:
-        background: "tech" or "non-tech"
-        quiz_responses: User's quiz responses
+    For non-tech exploring users: 2 intern cards in each view
+    For others: 3 cards (target, alternative_1_easier_company, alternative_2_different_role)
 
-    Returns:
-        List of JobOpportunityCard objects
+    Cards depend only on the persona, target role/company and the persona's
+    timeline adjustment for this user, so they are cached per combination;
+    the returned cards are shared between calls and must not be modified.
     """
 
     # Get basic info
@@ -170,84 +262,36 @@ def generate_job_opportunities(
 
     # Handle non-tech exploring case
     if background == "non-tech" and target_role == "not-sure":
-        return _generate_exploring_cards(persona_id)
+        return _generate_exploring_cards(persona_id), _generate_exploring_recommended_roles()
 
-    # Generate 3 cards: target, easier company, different role
-    cards = []
+    adjustment = calculate_timeline_adjustment(persona_id, quiz_responses)
+    try:
+        cards = _cached_cards(get_persona_store().version, persona_id, target_role, target_company, adjustment)
+    except TypeError:
+        # Unhashable answers (not sent by the quiz) skip the cache
+        cards = _build_cards(persona_id, target_role, target_company, adjustment)
 
-    # CARD 1: Target role + target company
-    card1_timeline = calculate_timeline_for_card(
-        persona_id=persona_id,
-        card_type="target",
-        quiz_responses=quiz_responses,
-        target_company=target_company
-    )
+    return [opportunity for opportunity, _ in cards], [recommended for _, recommended in cards]
 
-    card1 = JobOpportunityCard(
-        title=_format_role_display(target_role, target_company),
-        role=target_role,
-        copy=card1_timeline["copy"],
-        goal=card1_timeline["goal"],
-        action_items=card1_timeline["action_items"],
-        key_focus="Your stated goal - focus on these areas",
-        milestones=card1_timeline["milestones"],
-        min_months=card1_timeline["min_months"],
-        max_months=card1_timeline["max_months"],
-        timeline_text=card1_timeline["timeline_text"],
-        card_type="target"
-    )
-    cards.append(card1)
 
-    # CARD 2: Same role + easier company
-    easier_company = _get_easier_company(target_company)
-    card2_timeline = calculate_timeline_for_card(
-        persona_id=persona_id,
-        card_type="alternative_1_easier_company",
-        quiz_responses=quiz_responses,
-        target_company=easier_company
-    )
-
-    card2 = JobOpportunityCard(
-        title=_format_role_display(target_role, easier_company),
-        role=target_role,
-        copy=card2_timeline["copy"],
-        goal=card2_timeline["goal"],
-        action_items=card2_timeline["action_items"],
-        key_focus="Easier entry point - faster timeline",
-        milestones=card2_timeline["milestones"],
-        min_months=card2_timeline["min_months"],
-        max_months=card2_timeline["max_months"],
-        timeline_text=card2_timeline["timeline_text"],
-        card_type="alternative_1_easier_company"
-    )
-    cards.append(card2)
+def generate_job_opportunities(
+    background: str,
+    quiz_responses: Dict[str, Any]
+) -> List[JobOpportunityCard]:
+    """
+    Generate 3 career timeline cards for the user.
 
-    # CARD 3: Different role + target company
-    alt_role = get_alternative_role(persona_id, target_role)
-    if alt_role:
-        card3_timeline = calculate_timeline_for_card(
-            persona_id=persona_id,
-            card_type="alternative_2_different_role",
-            quiz_responses=quiz_responses,
-            target_company=target_company
-        )
+    For non-tech exploring users: Returns 2 intern cards
+    For others: Returns 3 cards (target, alternative_1_easier_company, alternative_2_different_role)
 
-        card3 = JobOpportunityCard(
-            title=_format_role_display(alt_role, target_company),
-            role=alt_role,
-            copy=card3_timeline["copy"],
-            goal=card3_timeline["goal"],
-            action_items=card3_timeline["action_items"],
-            key_focus="Alternative specialization - expands your options",
-            milestones=card3_timeline["milestones"],
-            min_months=card3_timeline["min_months"],
-            max_months=card3_timeline["max_months"],
-            timeline_text=card3_timeline["timeline_text"],
-            card_type="alternative_2_different_role"
-        )
-        cards.append(card3)
+    Args:
+        background: "tech" or "non-tech"
+        quiz_responses: User's quiz responses
 
-    return cards
+    Returns:
+        List of JobOpportunityCard objects
+    """
+    return generate_career_cards(background, quiz_responses)[0]
 
 
 def generate_recommended_roles(
@@ -259,101 +303,12 @@ def generate_recommended_roles(
 
     Same 3 cards as job opportunities, but using RecommendedRole schema.
     """
+    return generate_career_cards(background, quiz_responses)[1]
 
-    # Get basic info
-    target_role = quiz_responses.get("targetRole")
-    target_company = quiz_responses.get("targetCompany", "any-tech")
-
-    # Match to persona
-    persona_id, persona = get_matching_persona(
-        background=background,
-        currentRole=quiz_responses.get("currentRole"),
-        currentSkill=quiz_responses.get("currentSkill"),
-        experience=quiz_responses.get("experience"),
-        targetRole=target_role,
-        targetCompany=target_company,
-        codeComfort=quiz_responses.get("codeComfort")
-    )
-
-    # For exploring users, show 2 roles instead
-    if background == "non-tech" and target_role == "not-sure":
-        return _generate_exploring_recommended_roles()
-
-    roles = []
-
-    # CARD 1: Target role + target company
-    card1_timeline = calculate_timeline_for_card(
-        persona_id=persona_id,
-        card_type="target",
-        quiz_responses=quiz_responses,
-        target_company=target_company
-    )
-
-    role1 = RecommendedRole(
-        title=_format_role_display(target_role, target_company),
-        role=target_role,
-        seniority="Entry",  # Would be derived from role ID in production
-        reason=f"Your stated target role at {_format_company_display(target_company)}",
-        key_gap="Primary focus area",
-        milestones=card1_timeline["milestones"],
-        timeline_text=card1_timeline["timeline_text"],
-        min_months=card1_timeline["min_months"],
-        max_months=card1_timeline["max_months"],
-        card_type="target",
-        confidence="high"
-    )
-    roles.append(role1)
-
-    # CARD 2: Easier company
-    easier_company = _get_easier_company(target_company)
-    card2_timeline = calculate_timeline_for_card(
-        persona_id=persona_id,
-        card_type="alternative_1_easier_company",
-        quiz_responses=quiz_responses,
-        target_company=easier_company
-    )
-
-    role2 = RecommendedRole(
-        title=_format_role_display(target_role, easier_company),
-        role=target_role,
-        seniority="Entry",
-        reason=f"Same role, easier entry point at {_format_company_display(easier_company)}",
-        key_gap="Faster path to your goal",
-        milestones=card2_timeline["milestones"],
-        timeline_text=card2_timeline["timeline_text"],
-        min_months=card2_timeline["min_months"],
-        max_months=card2_timeline["max_months"],
-        card_type="alternative_1_easier_company",
-        confidence="high"
-    )
-    roles.append(role2)
-
-    # CARD 3: Different role
-    alt_role = get_alternative_role(persona_id, target_role)
-    if alt_role:
-        card3_timeline = calculate_timeline_for_card(
-            persona_id=persona_id,
-            card_type="alternative_2_different_role",
-            quiz_responses=quiz_responses,
-            target_company=target_company
-        )
-
-        role3 = RecommendedRole(
-            title=_format_role_display(alt_role, target_company),
-            role=alt_role,
-            seniority="Entry",
-            reason=f"Alternative specialization at {_format_company_display(target_company)} - expands your options",
-            key_gap="New specialization",
-            milestones=card3_timeline["milestones"],
-            timeline_text=card3_timeline["timeline_text"],
-            min_months=card3_timeline["min_months"],
-            max_months=card3_timeline["max_months"],
-            card_type="alternative_2_different_role",
-            confidence="medium"
-        )
-        roles.append(role3)
 
-    return roles
+def card_cache_info() -> Dict[str, int]:
+    """Hit/miss counters of the per-worker card cache."""
+    return _cached_cards.cache_info()._asdict()
 
 
 def _generate_exploring_recommended_roles() -> List[RecommendedRole]:
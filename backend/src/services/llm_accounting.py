@@ -0,0 +1,362 @@
+"""
+Token, latency and cost accounting for OpenAI calls.
+
+Each evaluation's chat completions run inside LLMAccounting.call(). The call
+adds response.usage over every attempt and times the whole exchange,
+including retries and schema-correction round trips. It then prices the call
+with src/config/llm_pricing.json. /evaluate cache hits are recorded too, so the
+report can put a dollar figure on the response cache.
+
+Totals per (endpoint, model) are kept in memory per worker and reset on
+restart. The individual rows are queued and written to llm_calls
+(migration 004) by a background thread every
+LLM_ACCOUNTING_FLUSH_INTERVAL_SECONDS.
+"""
+import atexit
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from src.config.logging_config import get_logger
+from src.config.registry import config_registry
+from src.config.settings import settings
+from src.repositories.cache_stats import LatencyHistogram
+from src.repositories.llm_usage_repository import LLMUsageRepository
+
+logger = get_logger(__name__)
+
+ENDPOINT_EVALUATE = "evaluate"
+ENDPOINT_MBA_EVALUATE = "mba/evaluate"
+
+# LLM calls take seconds, not the milliseconds of a cache read
+LLM_LATENCY_BUCKETS_MS = [250, 500, 1000, 2000, 3000, 5000, 7500, 10000, 15000, 20000, 30000, 60000]
+
+MAX_ERROR_LENGTH = 200
+
+
+class LLMCallRecord(NamedTuple):
+    created_at: datetime
+    endpoint: str
+    model: str
+    evaluation_id: Optional[str]
+    cache_hit: bool
+    success: bool
+    attempts: int
+    corrected: bool
+    prompt_tokens: int
+    cached_prompt_tokens: int
+    completion_tokens: int
+    latency_ms: Optional[float]
+    cost_usd: Optional[float]
+    error: Optional[str]
+
+
+def price_call(model: str, prompt_tokens: int, cached_prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    """Cost in USD from llm_pricing.json, or None when the model has no price."""
+    prices = config_registry.get("llm_pricing")["models"].get(model)
+    if prices is None:
+        return None
+    uncached = max(0, prompt_tokens - cached_prompt_tokens)
+    cost = (
+        uncached * prices["input"]
+        + cached_prompt_tokens * prices.get("cached_input", prices["input"])
+        + completion_tokens * prices["output"]
+    ) / 1_000_000
+    return round(cost, 6)
+
+
+class LLMCall:
+    """Accounting for one logical LLM call; use as a context manager around all its attempts."""
+
+    def __init__(self, accounting: "LLMAccounting", endpoint: str, model: str, evaluation_id: Optional[str] = None):
+        self._accounting = accounting
+        self.endpoint = endpoint
+        self.model = model
+        self.evaluation_id = evaluation_id
+        self.attempts = 0
+        self.corrected = False
+        self.success = True
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.completion_tokens = 0
+        self._started = 0.0
+
+    def add_usage(self, usage: Any) -> None:
+        """Add an OpenAI response.usage (tokens are billed for every attempt, valid or not)."""
+        if usage is None:
+            return
+        self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.cached_prompt_tokens += getattr(details, "cached_tokens", 0) or 0
+
+    def __enter__(self) -> "LLMCall":
+        self._accounting.call_started(self.endpoint, self.model)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        latency_ms = (time.perf_counter() - self._started) * 1000
+        self._accounting.call_finished(self.endpoint, self.model)
+        success = self.success and exc_type is None
+        error = None
+        if exc_type is not None:
+            error = f"{exc_type.__name__}: {exc}"[:MAX_ERROR_LENGTH]
+        self._accounting.record(LLMCallRecord(
+            created_at=datetime.utcnow(),
+            endpoint=self.endpoint,
+            model=self.model,
+            evaluation_id=self.evaluation_id,
+            cache_hit=False,
+            success=success,
+            attempts=self.attempts,
+            corrected=self.corrected,
+            prompt_tokens=self.prompt_tokens,
+            cached_prompt_tokens=self.cached_prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            latency_ms=round(latency_ms, 1),
+            cost_usd=price_call(self.model, self.prompt_tokens, self.cached_prompt_tokens, self.completion_tokens),
+            error=error,
+        ))
+        return False
+
+
+class _UsageTotals:
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.attempts = 0
+        self.corrected = 0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.prefix_cached_calls = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.priced_successes = 0
+        self.priced_success_cost_usd = 0.0
+        self.unpriced = 0
+        self.cache_hits = 0
+        self.latency = LatencyHistogram(LLM_LATENCY_BUCKETS_MS)
+
+    def add(self, record: LLMCallRecord) -> None:
+        if record.cache_hit:
+            self.cache_hits += 1
+            return
+        self.calls += 1
+        self.failures += not record.success
+        self.attempts += record.attempts
+        self.corrected += record.corrected
+        self.prompt_tokens += record.prompt_tokens
+        self.cached_prompt_tokens += record.cached_prompt_tokens
+        self.prefix_cached_calls += record.cached_prompt_tokens > 0
+        self.completion_tokens += record.completion_tokens
+        if record.cost_usd is None:
+            self.unpriced += 1
+        else:
+            self.cost_usd += record.cost_usd
+            if record.success:
+                self.priced_successes += 1
+                self.priced_success_cost_usd += record.cost_usd
+        if record.latency_ms is not None:
+            self.latency.observe(record.latency_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        avg_cost = self.priced_success_cost_usd / self.priced_successes if self.priced_successes else None
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "attempts": self.attempts,
+            "corrected_calls": self.corrected,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_prompt_tokens": self.cached_prompt_tokens,
+            # Share of prompt tokens served from the provider's prompt prefix cache
+            "prefix_cache_hit_rate": (
+                round(self.cached_prompt_tokens / self.prompt_tokens, 4) if self.prompt_tokens else None
+            ),
+            "prefix_cached_calls": self.prefix_cached_calls,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "avg_call_cost_usd": round(avg_cost, 6) if avg_cost is not None else None,
+            "unpriced_calls": self.unpriced,
+            "cache_hits": self.cache_hits,
+            "saved_by_cache_usd": round(self.cache_hits * (avg_cost or 0.0), 4),
+            "latency": self.latency.snapshot(),
+        }
+
+
+class LLMAccounting:
+    """Per-worker LLM usage totals plus a batched writer to llm_calls."""
+
+    def __init__(
+        self,
+        repository: Optional[LLMUsageRepository] = None,
+        flush_interval: Optional[float] = None,
+        max_pending: Optional[int] = None,
+    ):
+        self._repository = repository or LLMUsageRepository()
+        self._flush_interval = (
+            settings.llm_accounting_flush_interval_seconds if flush_interval is None else flush_interval
+        )
+        max_pending = settings.llm_accounting_max_pending if max_pending is None else max_pending
+        self._pending: Deque[LLMCallRecord] = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Calls currently waiting on OpenAI; not cleared by reset() while they are outstanding
+        self._in_flight: Dict[Tuple[str, str], int] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._started_at = time.time()
+            self._totals: Dict[Tuple[str, str], _UsageTotals] = {}
+            self.persisted = 0
+            self.dropped = 0
+            self.flush_errors = 0
+
+    def call(self, endpoint: str, model: str, evaluation_id: Optional[str] = None) -> LLMCall:
+        return LLMCall(self, endpoint, model, evaluation_id)
+
+    def call_started(self, endpoint: str, model: str) -> None:
+        with self._lock:
+            self._in_flight[(endpoint, model)] = self._in_flight.get((endpoint, model), 0) + 1
+
+    def call_finished(self, endpoint: str, model: str) -> None:
+        with self._lock:
+            self._in_flight[(endpoint, model)] = max(0, self._in_flight.get((endpoint, model), 0) - 1)
+
+    def record_cache_hit(self, endpoint: str, model: str, evaluation_id: Optional[str] = None) -> None:
+        """Count a response served from cache instead of an LLM call."""
+        self.record(LLMCallRecord(
+            created_at=datetime.utcnow(),
+            endpoint=endpoint,
+            model=model,
+            evaluation_id=evaluation_id,
+            cache_hit=True,
+            success=True,
+            attempts=0,
+            corrected=False,
+            prompt_tokens=0,
+            cached_prompt_tokens=0,
+            completion_tokens=0,
+            latency_ms=None,
+            cost_usd=0.0,
+            error=None,
+        ))
+
+    def record(self, record: LLMCallRecord) -> None:
+        with self._lock:
+            totals = self._totals.get((record.endpoint, record.model))
+            if totals is None:
+                totals = self._totals[(record.endpoint, record.model)] = _UsageTotals()
+            totals.add(record)
+            if len(self._pending) == self._pending.maxlen:
+                # Oldest unsaved row is overwritten; in-memory totals still include it
+                self.dropped += 1
+            self._pending.append(record)
+            self._ensure_started()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "since": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self._started_at)),
+                "pending_rows": len(self._pending),
+                "persisted_rows": self.persisted,
+                "dropped_rows": self.dropped,
+                "flush_errors": self.flush_errors,
+                "by_endpoint": [
+                    {
+                        "endpoint": endpoint,
+                        "model": model,
+                        "in_flight": self._in_flight.get((endpoint, model), 0),
+                        **totals.snapshot(),
+                    }
+                    for (endpoint, model), totals in sorted(self._totals.items())
+                ],
+            }
+
+    def export(self) -> List[Dict[str, Any]]:
+        """Raw counters and histogram copies per (endpoint, model) for the Prometheus exporter."""
+        with self._lock:
+            rows = []
+            for endpoint, model in sorted(set(self._totals) | set(self._in_flight)):
+                totals = self._totals.get((endpoint, model)) or _UsageTotals()
+                rows.append({
+                    "endpoint": endpoint,
+                    "model": model,
+                    "in_flight": self._in_flight.get((endpoint, model), 0),
+                    "calls": totals.calls,
+                    "failures": totals.failures,
+                    "attempts": totals.attempts,
+                    "cache_hits": totals.cache_hits,
+                    "prompt_tokens": totals.prompt_tokens,
+                    "cached_prompt_tokens": totals.cached_prompt_tokens,
+                    "completion_tokens": totals.completion_tokens,
+                    "cost_usd": totals.cost_usd,
+                    "latency": totals.latency.copy(),
+                })
+            return rows
+
+    def report(self, days: int = 7) -> Dict[str, Any]:
+        """This worker's totals plus the all-worker totals stored in llm_calls for the last `days` days."""
+        report: Dict[str, Any] = {"days": days, "worker": self.snapshot()}
+        try:
+            report["persisted"] = self._repository.summary(datetime.utcnow() - timedelta(days=days))
+        except Exception as exc:
+            logger.error(f"Failed to load LLM usage summary: {exc}")
+            report["persisted"] = None
+            report["error"] = str(exc)
+        return report
+
+    def flush(self) -> None:
+        """Write queued rows to llm_calls; rows stay queued (bounded) if the database is unavailable."""
+        with self._flush_lock:
+            with self._lock:
+                rows: List[LLMCallRecord] = list(self._pending)
+                self._pending.clear()
+            if not rows:
+                return
+            try:
+                self._repository.insert_calls(rows)
+            except Exception as exc:
+                logger.warning(f"LLM accounting flush failed, keeping {len(rows)} rows in memory: {exc}")
+                with self._lock:
+                    self.flush_errors += 1
+                    requeued = deque(rows, maxlen=self._pending.maxlen)
+                    requeued.extend(self._pending)
+                    self.dropped += len(rows) + len(self._pending) - len(requeued)
+                    self._pending = requeued
+            else:
+                with self._lock:
+                    self.persisted += len(rows)
+
+    def _ensure_started(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            if self._thread is None:
+                atexit.register(self.close)
+            self._thread = threading.Thread(target=self._run, name="llm-accounting", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flush thread and persist anything pending."""
+        self._stop.set()
+        self.flush()
+
+
+_accounting: Optional[LLMAccounting] = None
+_accounting_lock = threading.Lock()
+
+
+def get_llm_accounting() -> LLMAccounting:
+    global _accounting
+    with _accounting_lock:
+        if _accounting is None:
+            _accounting = LLMAccounting()
+        return _accounting
@@ -0,0 +1,545 @@
+"""
+Load generator for /evaluate, /mba/evaluate and /crt/store.
+
+Payloads are synthesized from the answer options in QUIZ_QUESTIONS_AND_OPTIONS.md
+(tech and non-tech quizzes, mapped the way the frontend maps them) and from
+the MBA quiz's scoring maps. Option popularity follows a Zipf distribution
+(--skew 0 is uniform, higher values favour the first options), and
+--repeat-rate resends earlier payloads so caches see realistic reuse.
+
+Traffic is either open-loop at a target --rps (latency is measured from each
+request's scheduled start, so queueing is not hidden) or closed-loop with
+--concurrency requests in flight. The report has p50/p95/p99 latency,
+throughput and error rate per endpoint. With admin credentials (ADMIN_USERNAME /
+ADMIN_PASSWORD) it adds the response cache and enrichment memo hit ratios
+over the run and DB pool saturation polled from /admin/db/pool. Server
+counters are per worker, so run the API with one worker for exact figures.
+
+Fully offline: the API, a local Postgres and the OpenAI stand-in
+(src/services/openai_stub.py, via OPENAI_BASE_URL) are all that is needed.
+
+CLI:
+    python -m src.services.load_test --rps 20 --duration 60 --mix evaluate=1,mba=2,crt=2 --skew 1.1 --repeat-rate 0.3
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+
+logger = get_logger(__name__)
+
+DEFAULT_BASE_URL = "http://127.0.0.1:8000/career-profile-tool/api"
+DEFAULT_QUIZ_OPTIONS_PATH = Path(__file__).resolve().parents[3] / "QUIZ_QUESTIONS_AND_OPTIONS.md"
+
+ENDPOINT_PATHS = {
+    "evaluate": "/evaluate",
+    "mba": "/mba/evaluate",
+    "crt": "/crt/store",
+}
+
+# Previously sent payloads kept per endpoint for --repeat-rate
+REPEAT_POOL_SIZE = 1000
+
+Option = Tuple[str, str]  # (value, display text)
+
+_SECTION = re.compile(r"^## For (Tech|Non-Tech)")
+_QUESTION = re.compile(r"^#### Q\d+: `(\w+)`")
+_CONDITION = re.compile(r"^\*\*If role = ")
+_OPTION_ROW = re.compile(r"^\| `([^`]+)` \| (.+?) \|$")
+
+
+def parse_quiz_options(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Answer options per quiz and question from QUIZ_QUESTIONS_AND_OPTIONS.md.
+
+    Returns:
+        {"tech": {...}, "non-tech": {...}}; each maps a question key to its
+        (value, display text) options. Questions whose options depend on the
+        current role (currentSkill) map each currentRole value to its options,
+        matched by order.
+    """
+    quizzes: Dict[str, Dict[str, Any]] = {}
+    quiz: Optional[Dict[str, Any]] = None
+    question: Optional[str] = None
+    options: Optional[List[Option]] = None
+
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        section = _SECTION.match(line)
+        if section:
+            quiz = quizzes.setdefault(section.group(1).lower(), {})
+            question = None
+            continue
+        if line.startswith("## "):
+            quiz, question = None, None
+            continue
+        if quiz is None:
+            continue
+        match = _QUESTION.match(line)
+        if match:
+            question = match.group(1)
+            options = quiz.setdefault(question, [])
+            continue
+        if question and _CONDITION.match(line):
+            # Role-dependent options: one table per currentRole, in the same order
+            if not isinstance(quiz[question], dict):
+                quiz[question] = {}
+            role_value = quiz["currentRole"][len(quiz[question])][0]
+            options = quiz[question].setdefault(role_value, [])
+            continue
+        row = _OPTION_ROW.match(line)
+        if question and row and options is not None:
+            options.append((row.group(1), row.group(2).strip()))
+
+    for name in ("tech", "non-tech"):
+        if not quizzes.get(name):
+            raise ValueError(f"No {name} quiz options found in {path}")
+    return quizzes
+
+
+def _mba_options() -> Dict[str, Any]:
+    from src.services.mba_career_journey import CAREER_JOURNEY_RECOMMENDATIONS
+    from src.services.mba_lookup import ROLE_QUESTION_PREFIXES
+    from src.services.mba_scoring_orchestrator import EXPERIENCE_SCORES
+    from src.services.mba_skill_scoring_maps import ANSWER_SCORES
+
+    return {
+        "roles": {
+            role: [(question_key, list(answers)) for question_key, answers in ANSWER_SCORES.items()
+                   if question_key.startswith(prefix)]
+            for role, prefix in ROLE_QUESTION_PREFIXES.items()
+        },
+        "experience": list(EXPERIENCE_SCORES),
+        "career_goal": list(CAREER_JOURNEY_RECOMMENDATIONS),
+    }
+
+
+class PayloadGenerator:
+    """Synthesizes request bodies with Zipf-skewed answers and a configurable repeat rate."""
+
+    def __init__(self, quiz_options: Dict[str, Dict[str, Any]], skew: float = 1.0,
+                 repeat_rate: float = 0.0, seed: Optional[int] = None):
+        self.quiz_options = quiz_options
+        self.mba_options = _mba_options()
+        self.skew = skew
+        self.repeat_rate = repeat_rate
+        self._rng = random.Random(seed)
+        self._cum_weights: Dict[int, List[float]] = {}
+        self._sent: Dict[str, Deque[Dict[str, Any]]] = {
+            endpoint: deque(maxlen=REPEAT_POOL_SIZE) for endpoint in ENDPOINT_PATHS
+        }
+
+    def pick(self, options: Sequence[Any]) -> Any:
+        """One option; the i-th is chosen with weight 1 / (i + 1) ** skew."""
+        weights = self._cum_weights.get(len(options))
+        if weights is None:
+            weights, total = [], 0.0
+            for rank in range(len(options)):
+                total += 1.0 / (rank + 1) ** self.skew
+                weights.append(total)
+            self._cum_weights[len(options)] = weights
+        return self._rng.choices(options, cum_weights=weights)[0]
+
+    def next(self, endpoint: str) -> Tuple[Dict[str, Any], bool]:
+        """(payload, repeated) for the endpoint."""
+        sent = self._sent[endpoint]
+        if sent and self._rng.random() < self.repeat_rate:
+            return self._rng.choice(sent), True
+        payload = getattr(self, f"_{endpoint}_payload")()
+        sent.append(payload)
+        return payload, False
+
+    def _quiz_answers(self, background: str) -> Dict[str, str]:
+        """Raw answers as the quiz stores them (option values plus display labels)."""
+        answers: Dict[str, str] = {}
+        for question, options in self.quiz_options[background].items():
+            if isinstance(options, dict):
+                options = options.get(answers.get("currentRole"), [])
+            if not options:
+                continue
+            # systemDesign is only asked when problemSolving != '0-10'
+            if question == "systemDesign" and answers.get("problemSolving") == "0-10":
+                continue
+            value, label = self.pick(options)
+            answers[question] = value
+            answers[f"{question}Label"] = label
+        return answers
+
+    def _evaluate_payload(self) -> Dict[str, Any]:
+        background = self.pick(("tech", "non-tech"))
+        answers = self._quiz_answers(background)
+        if background == "tech":
+            quiz_responses = _map_tech_quiz_responses(answers)
+        else:
+            quiz_responses = _map_nontech_quiz_responses(answers)
+        return {
+            "background": background,
+            "quizResponses": quiz_responses,
+            "goals": {"requirementType": [], "targetCompany": "Not specified", "topicOfInterest": []},
+        }
+
+    def _mba_payload(self) -> Dict[str, Any]:
+        role = self.pick(list(self.mba_options["roles"]))
+        career_goal = self.pick(self.mba_options["career_goal"])
+        payload = {
+            "role": role,
+            "currentRole": role,
+            "experience": self.pick(self.mba_options["experience"]),
+            "career_goal": career_goal,
+            "careerGoal": career_goal,
+        }
+        for question_key, answers in self.mba_options["roles"][role]:
+            payload[question_key] = self.pick(answers)
+        return payload
+
+    def _crt_payload(self) -> Dict[str, Any]:
+        background = self.pick(("tech", "non-tech"))
+        return {"quizResponses": {"background": background, **self._quiz_answers(background)}}
+
+
+def _map_tech_quiz_responses(answers: Dict[str, str]) -> Dict[str, Any]:
+    """Python port of mapTechQuizResponses in frontend/src/utils/evaluationLogic.js."""
+    current_role = answers["currentRole"]
+    problem_solving = answers.get("problemSolving", "0-10")
+    current_company = {
+        "swe-product": "Product Company",
+        "swe-service": "Service Company",
+    }.get(current_role, "Tech Company")
+    return {
+        "currentRole": current_role,
+        "experience": answers.get("experience", "0-2"),
+        "targetRole": answers.get("targetRole", "fullstack-sde"),
+        "problemSolving": problem_solving,
+        "systemDesign": answers.get("systemDesign", "not-yet"),
+        "portfolio": answers.get("portfolio", "none"),
+        "mockInterviews": "never",
+        "requirementType": answers.get("primaryGoal", "upskilling"),
+        "targetCompany": answers.get("targetCompany", "Not specified"),
+        "currentCompany": current_company,
+        "currentSkill": answers.get("currentSkill", problem_solving),
+        "currentRoleLabel": answers.get("currentRoleLabel", current_company),
+        "targetRoleLabel": answers.get("targetRoleLabel"),
+        "targetCompanyLabel": answers.get("targetCompanyLabel"),
+    }
+
+
+def _map_nontech_quiz_responses(answers: Dict[str, str]) -> Dict[str, Any]:
+    """Python port of mapNonTechQuizResponses in frontend/src/utils/evaluationLogic.js."""
+    problem_solving = {"confident": "51-100", "learning": "11-50"}.get(answers.get("codeComfort"), "0-10")
+    portfolio = {"51-100": "limited-1-5", "11-50": "inactive"}.get(problem_solving, "none")
+    return {
+        "currentRole": answers.get("currentBackground", "career-switcher"),
+        "experience": answers.get("experience", "0-2"),
+        "targetRole": answers.get("targetRole", "exploring"),
+        "problemSolving": problem_solving,
+        "systemDesign": "not-yet",
+        "portfolio": portfolio,
+        "mockInterviews": "never",
+        "requirementType": answers.get("motivation", "career-switch"),
+        "targetCompany": answers.get("targetCompany", "Transitioning from non-tech background"),
+        "currentCompany": "Transitioning from non-tech background",
+        "currentSkill": problem_solving,
+        "currentRoleLabel": answers.get("currentBackgroundLabel", "Career Switcher"),
+        "targetRoleLabel": answers.get("targetRoleLabel"),
+        "targetCompanyLabel": answers.get("targetCompanyLabel"),
+    }
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending sequence."""
+    if not sorted_values:
+        return None
+    rank = min(len(sorted_values), max(1, math.ceil(q * len(sorted_values))))
+    return round(sorted_values[rank - 1], 1)
+
+
+@dataclass
+class EndpointResults:
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+    repeated: int = 0
+
+    def record(self, status: str, latency_ms: float, ok: bool, repeated: bool) -> None:
+        self.latencies_ms.append(latency_ms)
+        self.statuses[status] += 1
+        self.errors += not ok
+        self.repeated += repeated
+
+    def summary(self, elapsed_s: float) -> Dict[str, Any]:
+        latencies = sorted(self.latencies_ms)
+        count = len(latencies)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else None,
+            "repeated": self.repeated,
+            "throughput_rps": round(count / elapsed_s, 2) if elapsed_s else None,
+            "statuses": dict(self.statuses),
+            "latency_ms": {
+                "p50": percentile(latencies, 0.50),
+                "p95": percentile(latencies, 0.95),
+                "p99": percentile(latencies, 0.99),
+                "max": round(latencies[-1], 1) if latencies else None,
+                "mean": round(sum(latencies) / count, 1) if count else None,
+            },
+        }
+
+
+@dataclass(frozen=True)
+class LoadTestConfig:
+    base_url: str = DEFAULT_BASE_URL
+    mix: Tuple[Tuple[str, float], ...] = (("evaluate", 1.0), ("mba", 1.0), ("crt", 1.0))
+    rps: Optional[float] = None
+    concurrency: int = 16
+    duration_s: float = 30.0
+    max_requests: Optional[int] = None
+    skew: float = 1.0
+    repeat_rate: float = 0.2
+    timeout_s: float = 60.0
+    poll_interval_s: float = 0.5
+    seed: Optional[int] = None
+
+
+class LoadTest:
+    """One load test run against a running API."""
+
+    def __init__(self, config: LoadTestConfig, generator: PayloadGenerator,
+                 admin_auth: Optional[Tuple[str, str]] = None):
+        self.config = config
+        self.generator = generator
+        self.admin_auth = admin_auth
+        self.results: Dict[str, EndpointResults] = {endpoint: EndpointResults() for endpoint, _ in config.mix}
+        self._endpoints = [endpoint for endpoint, _ in config.mix]
+        self._endpoint_weights = [weight for _, weight in config.mix]
+        self._rng = random.Random(config.seed)
+        self._issued = 0
+        self._pool_peaks: Dict[str, Dict[str, Any]] = {}
+
+    def _take(self) -> bool:
+        if self.config.max_requests is not None and self._issued >= self.config.max_requests:
+            return False
+        self._issued += 1
+        return True
+
+    async def _send(self, client: httpx.AsyncClient, started: float) -> None:
+        endpoint = self._rng.choices(self._endpoints, weights=self._endpoint_weights)[0]
+        payload, repeated = self.generator.next(endpoint)
+        try:
+            response = await client.post(ENDPOINT_PATHS[endpoint], json=payload)
+            status, ok = str(response.status_code), response.is_success
+        except httpx.HTTPError as exc:
+            status, ok = type(exc).__name__, False
+        self.results[endpoint].record(status, (time.perf_counter() - started) * 1000, ok, repeated)
+
+    async def _open_loop(self, client: httpx.AsyncClient, deadline: float) -> None:
+        gate = asyncio.Semaphore(self.config.concurrency)
+        interval = 1.0 / self.config.rps
+        start = time.perf_counter()
+        tasks = set()
+
+        async def gated(scheduled: float) -> None:
+            async with gate:
+                await self._send(client, scheduled)
+
+        index = 0
+        while True:
+            scheduled = start + index * interval
+            if scheduled >= deadline or not self._take():
+                break
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            task = asyncio.create_task(gated(scheduled))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            index += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def _closed_loop(self, client: httpx.AsyncClient, deadline: float) -> None:
+        async def worker() -> None:
+            while time.perf_counter() < deadline and self._take():
+                await self._send(client, time.perf_counter())
+
+        await asyncio.gather(*(worker() for _ in range(self.config.concurrency)))
+
+    async def _admin_get(self, client: httpx.AsyncClient, path: str) -> Optional[Dict[str, Any]]:
+        if self.admin_auth is None:
+            return None
+        try:
+            response = await client.get(path, auth=self.admin_auth)
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.warning(f"Admin stats unavailable ({path}): {exc}")
+            return None
+
+    async def _poll_pools(self, client: httpx.AsyncClient, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            stats = await self._admin_get(client, "/admin/db/pool")
+            for pool in (stats or {}).get("pools", []):
+                peak = self._pool_peaks.setdefault(pool["name"], {
+                    "max_size": pool["max_size"], "peak_in_use": 0, "exhausted_start": pool["exhausted"],
+                })
+                peak["peak_in_use"] = max(peak["peak_in_use"], pool["in_use"])
+                peak["exhausted_end"] = pool["exhausted"]
+            try:
+                await asyncio.wait_for(stop.wait(), self.config.poll_interval_s)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self) -> Dict[str, Any]:
+        limits = httpx.Limits(max_connections=self.config.concurrency, max_keepalive_connections=self.config.concurrency)
+        async with httpx.AsyncClient(base_url=self.config.base_url, timeout=self.config.timeout_s, limits=limits) as client, \
+                httpx.AsyncClient(base_url=self.config.base_url, timeout=10.0) as admin_client:
+            cache_before = await self._admin_get(admin_client, "/admin/cache/stats")
+            enrichment_before = await self._admin_get(admin_client, "/admin/enrichment/stats")
+            stop = asyncio.Event()
+            poller = asyncio.create_task(self._poll_pools(admin_client, stop))
+
+            started = time.perf_counter()
+            deadline = started + self.config.duration_s
+            if self.config.rps:
+                await self._open_loop(client, deadline)
+            else:
+                await self._closed_loop(client, deadline)
+            elapsed = time.perf_counter() - started
+
+            stop.set()
+            await poller
+            cache_after = await self._admin_get(admin_client, "/admin/cache/stats")
+            enrichment_after = await self._admin_get(admin_client, "/admin/enrichment/stats")
+
+        total = EndpointResults()
+        for results in self.results.values():
+            total.latencies_ms += results.latencies_ms
+            total.statuses.update(results.statuses)
+            total.errors += results.errors
+            total.repeated += results.repeated
+        return {
+            "config": asdict(self.config),
+            "elapsed_s": round(elapsed, 2),
+            "overall": total.summary(elapsed),
+            "endpoints": {endpoint: results.summary(elapsed) for endpoint, results in self.results.items()},
+            "server": {
+                "response_cache": _hit_ratio(
+                    (cache_before or {}).get("counters"), (cache_after or {}).get("counters")
+                ),
+                "enrichment": _hit_ratio(enrichment_before, enrichment_after),
+                "db_pools": {
+                    name: {
+                        "max_size": peak["max_size"],
+                        "peak_in_use": peak["peak_in_use"],
+                        "saturation": round(peak["peak_in_use"] / peak["max_size"], 4) if peak["max_size"] else None,
+                        "exhausted": peak.get("exhausted_end", peak["exhausted_start"]) - peak["exhausted_start"],
+                    }
+                    for name, peak in sorted(self._pool_peaks.items())
+                } if self.admin_auth else None,
+            },
+        }
+
+
+def _hit_ratio(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Hits and misses over the run from two counter snapshots (None without admin access)."""
+    if not before or not after:
+        return None
+    hits = after["hits"] - before["hits"]
+    misses = after["misses"] - before["misses"]
+    lookups = hits + misses
+    return {"hits": hits, "misses": misses, "hit_ratio": round(hits / lookups, 4) if lookups else None}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"{'endpoint':<10} {'reqs':>7} {'rps':>8} {'err%':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}",
+    ]
+    rows = [*report["endpoints"].items(), ("total", report["overall"])]
+    for endpoint, summary in rows:
+        latency = summary["latency_ms"]
+        error_rate = summary["error_rate"]
+        lines.append(
+            f"{endpoint:<10} {summary['requests']:>7} {summary['throughput_rps'] or 0:>8.2f} "
+            f"{(error_rate or 0) * 100:>6.2f} "
+            + " ".join(f"{latency[key] if latency[key] is not None else '-':>9}" for key in ("p50", "p95", "p99", "max"))
+        )
+    lines.append(f"latency in ms over {report['elapsed_s']}s; statuses: {report['overall']['statuses']}")
+
+    server = report["server"]
+    for name in ("response_cache", "enrichment"):
+        stats = server[name]
+        if stats:
+            lines.append(f"{name} hit ratio: {stats['hit_ratio']} ({stats['hits']} hits, {stats['misses']} misses)")
+    if server["db_pools"] is None:
+        lines.append("server counters skipped (no admin credentials)")
+    for name, pool in (server["db_pools"] or {}).items():
+        lines.append(
+            f"db pool {name}: peak {pool['peak_in_use']}/{pool['max_size']} "
+            f"(saturation {pool['saturation']}), exhausted {pool['exhausted']}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_mix(value: str) -> Tuple[Tuple[str, float], ...]:
+    mix = []
+    for part in value.split(","):
+        endpoint, _, weight = part.partition("=")
+        endpoint = endpoint.strip()
+        if endpoint not in ENDPOINT_PATHS:
+            raise argparse.ArgumentTypeError(f"Unknown endpoint {endpoint!r} (choose from {', '.join(ENDPOINT_PATHS)})")
+        mix.append((endpoint, float(weight or 1)))
+    return tuple(mix)
+
+
+def main(argv: Optional[list] = None) -> int:
+    from src.config.logging_config import setup_logging
+
+    defaults = LoadTestConfig()
+    parser = argparse.ArgumentParser(description="Drive the API with synthesized quiz traffic and report latency")
+    parser.add_argument("--base-url", default=defaults.base_url)
+    parser.add_argument("--mix", type=_parse_mix, default=defaults.mix,
+                        help="Endpoint weights, e.g. evaluate=1,mba=2,crt=2")
+    parser.add_argument("--rps", type=float, help="Open-loop target requests per second (default: closed loop)")
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency,
+                        help="Requests in flight (closed loop) or the cap on them (open loop)")
+    parser.add_argument("--duration", type=float, default=defaults.duration_s, dest="duration_s")
+    parser.add_argument("--requests", type=int, dest="max_requests", help="Stop after this many requests")
+    parser.add_argument("--skew", type=float, default=defaults.skew, help="Zipf exponent of answer popularity (0 = uniform)")
+    parser.add_argument("--repeat-rate", type=float, default=defaults.repeat_rate,
+                        help="Share of requests that resend an earlier payload")
+    parser.add_argument("--timeout", type=float, default=defaults.timeout_s, dest="timeout_s")
+    parser.add_argument("--poll-interval", type=float, default=defaults.poll_interval_s, dest="poll_interval_s")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--quiz-options", type=Path, default=DEFAULT_QUIZ_OPTIONS_PATH)
+    parser.add_argument("--no-admin", action="store_true", help="Skip server-side cache and pool counters")
+    parser.add_argument("--json", type=Path, help="Also write the full report to this file")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    config = LoadTestConfig(**{
+        name: getattr(args, name) for name in LoadTestConfig.__dataclass_fields__ if hasattr(args, name)
+    })
+    generator = PayloadGenerator(
+        parse_quiz_options(args.quiz_options), skew=config.skew, repeat_rate=config.repeat_rate, seed=config.seed
+    )
+    admin_auth = None if args.no_admin else (settings.admin_username, settings.admin_password)
+
+    report = asyncio.run(LoadTest(config, generator, admin_auth).run())
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+    return 1 if report["overall"]["requests"] == 0 else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,27 +1,19 @@
 """
 MBA AI Tools Recommendations
 Role-specific AI tools with explanations of impact
+
+The tool lists below are compiled once at import into immutable AIToolRecord
+tuples, and every (role, gap) combination's recommendation list is
+precomputed from them. Requests get shared lists of shared dicts back, so
+callers must not modify them.
 """
-from typing import List, Dict, Any
+import itertools
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Tuple
 
 
-def get_ai_tools_for_role(role: str, skill_gaps: List[str]) -> List[Dict[str, Any]]:
-    """
-    Get AI tool recommendations based on role and skill gaps
-
-    Returns:
-        [
-            {
-                'name': 'ChatGPT',
-                'category': 'General AI Assistant',
-                'use_case': 'How to use it',
-                'impact': 'Why it helps',
-                'priority': 'must-have' | 'recommended' | 'nice-to-have'
-            }
-        ]
-    """
-    # Universal tools (everyone needs these)
-    universal_tools = [
+def _universal_ai_tools() -> List[Dict[str, Any]]:
+    """Universal tools (everyone needs these)"""
+    return [
         {
             'name': 'ChatGPT / Claude',
             'category': 'General AI Assistant',
@@ -56,34 +48,6 @@ def get_ai_tools_for_role(role: str, skill_gaps: List[str]) -> List[Dict[str, An
         }
     ]
 
-    # Role-specific tools
-    role_tools_map = {
-        'pm': _pm_ai_tools,
-        'finance': _finance_ai_tools,
-        'sales': _sales_ai_tools,
-        'marketing': _marketing_ai_tools,
-        'operations': _operations_ai_tools,
-        'founder': _founder_ai_tools
-    }
-
-    role_tools = role_tools_map.get(role, lambda: [])()
-
-    # Gap-based tools
-    gap_tools = _get_gap_specific_tools(skill_gaps)
-
-    # Combine and deduplicate
-    all_tools = universal_tools + role_tools + gap_tools
-    seen = set()
-    unique_tools = []
-    for tool in all_tools:
-        if tool['name'] not in seen:
-            seen.add(tool['name'])
-            unique_tools.append(tool)
-
-    # Return exactly 9 tools (4 universal + 5 role-specific/gap)
-    # OpenAI can add up to 6 more tools if needed via personalization
-    return unique_tools[:9]
-
 
 def _pm_ai_tools() -> List[Dict[str, Any]]:
     """AI tools for Product Managers"""
@@ -601,9 +565,9 @@ def _founder_ai_tools() -> List[Dict[str, Any]]:
     ]
 
 
-def _get_gap_specific_tools(skill_gaps: List[str]) -> List[Dict[str, Any]]:
-    """Get AI tools to address specific skill gaps"""
-    gap_tools = {
+def _gap_ai_tools() -> Dict[str, Dict[str, Any]]:
+    """AI tools to address specific skill gaps"""
+    return {
         'data_analytics': {
             'name': 'Julius AI',
             'category': 'Data Analysis',
@@ -630,4 +594,91 @@ def _get_gap_specific_tools(skill_gaps: List[str]) -> List[Dict[str, Any]]:
         }
     }
 
-    return [gap_tools[gap] for gap in skill_gaps if gap in gap_tools]
+
+class AIToolRecord(NamedTuple):
+    name: str
+    category: str
+    use_case: str
+    impact: str
+    priority: str
+    url: str
+
+
+# Return exactly 9 tools (4 universal + 5 role-specific/gap)
+# OpenAI can add up to 6 more tools if needed via personalization
+MAX_TOOLS = 9
+
+UNIVERSAL_TOOLS: Tuple[AIToolRecord, ...] = tuple(AIToolRecord(**tool) for tool in _universal_ai_tools())
+ROLE_TOOLS: Dict[str, Tuple[AIToolRecord, ...]] = {
+    role: tuple(AIToolRecord(**tool) for tool in factory())
+    for role, factory in (
+        ('pm', _pm_ai_tools),
+        ('finance', _finance_ai_tools),
+        ('sales', _sales_ai_tools),
+        ('marketing', _marketing_ai_tools),
+        ('operations', _operations_ai_tools),
+        ('founder', _founder_ai_tools),
+    )
+}
+GAP_TOOLS: Dict[str, AIToolRecord] = {gap: AIToolRecord(**tool) for gap, tool in _gap_ai_tools().items()}
+
+ToolList = List[Dict[str, Any]]
+
+# One dict per record, shared by every response that includes it
+_TOOL_DICTS: Dict[AIToolRecord, Dict[str, Any]] = {}
+
+
+def _select(tools: Sequence[AIToolRecord]) -> ToolList:
+    """First MAX_TOOLS tools with distinct names, as shared dicts."""
+    seen = set()
+    selected = []
+    for tool in tools:
+        if tool.name not in seen:
+            seen.add(tool.name)
+            selected.append(_TOOL_DICTS.setdefault(tool, tool._asdict()))
+    return selected[:MAX_TOOLS]
+
+
+def _precompute() -> Tuple[Dict[Optional[str], ToolList], Dict[Tuple[Optional[str], Tuple[str, ...]], ToolList]]:
+    # Roles whose universal + role tools already fill the list ignore skill gaps
+    by_role: Dict[Optional[str], ToolList] = {}
+    by_role_and_gaps: Dict[Tuple[Optional[str], Tuple[str, ...]], ToolList] = {}
+    gap_orders = [
+        order
+        for size in range(len(GAP_TOOLS) + 1)
+        for order in itertools.permutations(GAP_TOOLS, size)
+    ]
+    for role in (*ROLE_TOOLS, None):
+        base = UNIVERSAL_TOOLS + ROLE_TOOLS.get(role, ())
+        if len({tool.name for tool in base}) >= MAX_TOOLS:
+            by_role[role] = _select(base)
+            continue
+        for order in gap_orders:
+            by_role_and_gaps[(role, order)] = _select(base + tuple(GAP_TOOLS[gap] for gap in order))
+    return by_role, by_role_and_gaps
+
+
+_RESULTS_BY_ROLE, _RESULTS_BY_ROLE_AND_GAPS = _precompute()
+
+
+def get_ai_tools_for_role(role: str, skill_gaps: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get AI tool recommendations based on role and skill gaps
+
+    Returns (shared, do not modify):
+        [
+            {
+                'name': 'ChatGPT',
+                'category': 'General AI Assistant',
+                'use_case': 'How to use it',
+                'impact': 'Why it helps',
+                'priority': 'must-have' | 'recommended' | 'nice-to-have'
+            }
+        ]
+    """
+    tools = _RESULTS_BY_ROLE.get(role)
+    if tools is not None:
+        return tools
+    # Only gaps with a dedicated tool matter, in first-seen order
+    gaps = tuple(dict.fromkeys(gap for gap in skill_gaps if gap in GAP_TOOLS))
+    return _RESULTS_BY_ROLE_AND_GAPS[(role if role in ROLE_TOOLS else None, gaps)]
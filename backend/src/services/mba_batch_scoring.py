@@ -0,0 +1,277 @@
+"""
+Vectorized batch scoring for MBA quiz responses.
+
+Replays large sets of responses (e.g. for recalibrating SCORING_WEIGHTS or
+the 40-80 score band) through the same compiled rules as
+calculate_mba_readiness_score and infer_skills_from_responses, but as NumPy
+operations over an integer answer matrix instead of one dict at a time.
+Results match the scalar functions exactly.
+
+NumPy is an optional dependency:
+    pip install -e ".[batch]"
+
+Usage:
+    from src.services.mba_batch_scoring import score_mba_batch
+    scores = score_mba_batch(responses_list)
+    scores['overall_score']  # int array, one entry per response
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from src.services.mba_scoring_orchestrator import (
+    AI_MATURITY_FLOOR,
+    AI_MATURITY_THRESHOLDS,
+    AIMaturityLevel,
+    COMPILED_ROLE_RULES,
+    DEFAULT_EXPERIENCE_SCORE,
+    DEFAULT_ROLE_RULES,
+    EXPERIENCE_SCORES,
+    OVERALL_SCORE_CEILING,
+    OVERALL_SCORE_FLOOR,
+    OVERALL_SCORE_SCALE,
+    PERCENTILE_FLOOR,
+    PERCENTILE_STEPS,
+    SCORING_WEIGHTS,
+)
+from src.services.mba_skill_inference import ROLE_SCORING_TABLES
+
+# Maturity levels in the order of their integer codes
+MATURITY_LEVELS: Tuple[AIMaturityLevel, ...] = (
+    AIMaturityLevel.AI_UNAWARE,
+    AIMaturityLevel.AI_CURIOUS,
+    AIMaturityLevel.AI_CAPABLE,
+    AIMaturityLevel.AI_STRATEGIC,
+    AIMaturityLevel.AI_NATIVE,
+)
+
+MAX_SKILLS = max(len(table.skills) for table in ROLE_SCORING_TABLES.values())
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError('NumPy is required for batch scoring: pip install -e ".[batch]"')
+
+
+class AnswerEncoder:
+    """
+    Integer encoding of quiz responses.
+
+    Every question used by the readiness rules or the skill scoring tables gets
+    a column; every known answer gets a code >= 1 within its column. Code 0
+    means missing or an answer no rule scores, which is exactly how the scalar
+    functions treat it.
+    """
+
+    def __init__(self):
+        answers: Dict[str, Dict[str, int]] = {}
+
+        def add(question_key: str, answer_keys) -> None:
+            codes = answers.setdefault(question_key, {})
+            for answer in answer_keys:
+                codes.setdefault(answer, len(codes) + 1)
+
+        for rules in [DEFAULT_ROLE_RULES, *COMPILED_ROLE_RULES.values()]:
+            for question_key, answer_effects in rules.questions:
+                add(question_key, answer_effects)
+        for table in ROLE_SCORING_TABLES.values():
+            for question_key, answer_scores, _ in table.questions:
+                add(question_key, answer_scores)
+
+        self.questions: Tuple[str, ...] = tuple(answers)
+        self.answer_codes: Dict[str, Dict[str, int]] = answers
+        self.column = {question_key: index for index, question_key in enumerate(self.questions)}
+        self.max_code = max((len(codes) for codes in answers.values()), default=0)
+        self._lookup = {
+            question_key: (self.column[question_key], codes) for question_key, codes in answers.items()
+        }
+
+        self.readiness_roles: Tuple[Optional[str], ...] = (None, *COMPILED_ROLE_RULES)
+        self._readiness_role_codes = {role: index for index, role in enumerate(self.readiness_roles)}
+        self.skill_roles: Tuple[str, ...] = tuple(ROLE_SCORING_TABLES)
+        self._skill_role_codes = {role: index for index, role in enumerate(self.skill_roles)}
+        self._default_skill_role = self._skill_role_codes['pm']
+
+    def encode(self, responses: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """Encode responses into role codes, experience scores and an answer matrix."""
+        _require_numpy()
+        count = len(responses)
+        answers = np.zeros((count, len(self.questions)), dtype=np.int16)
+        readiness_roles = np.zeros(count, dtype=np.int16)
+        skill_roles = np.full(count, self._default_skill_role, dtype=np.int16)
+        experience = np.full(count, DEFAULT_EXPERIENCE_SCORE, dtype=np.int64)
+
+        lookup = self._lookup
+        for row, response in enumerate(responses):
+            role = response.get('role')
+            if isinstance(role, str):
+                readiness_roles[row] = self._readiness_role_codes.get(role, 0)
+                skill_roles[row] = self._skill_role_codes.get(role, self._default_skill_role)
+            experience_key = response.get('experience')
+            if isinstance(experience_key, str):
+                experience[row] = EXPERIENCE_SCORES.get(experience_key, DEFAULT_EXPERIENCE_SCORE)
+            for question_key, answer in response.items():
+                entry = lookup.get(question_key)
+                if entry is not None and answer and isinstance(answer, str):
+                    answers[row, entry[0]] = entry[1].get(answer, 0)
+
+        return {
+            'answers': answers,
+            'readiness_roles': readiness_roles,
+            'skill_roles': skill_roles,
+            'experience': experience,
+        }
+
+
+class BatchScorer:
+    """Lookup tensors compiled from the scalar scoring rules."""
+
+    def __init__(self, encoder: Optional[AnswerEncoder] = None):
+        _require_numpy()
+        self.encoder = encoder or AnswerEncoder()
+        enc = self.encoder
+        code_count = enc.max_code + 1
+
+        # Readiness: [role, question, answer code] → points per category
+        # Each role only gathers its own question columns
+        role_count = len(enc.readiness_roles)
+        self._bases = np.zeros((role_count, 3), dtype=np.int64)
+        self._readiness_columns: List[Any] = []
+        self._effects: List[Any] = []
+        for role_code, role in enumerate(enc.readiness_roles):
+            rules = DEFAULT_ROLE_RULES if role is None else COMPILED_ROLE_RULES[role]
+            self._bases[role_code] = (rules.role_maturity_base, rules.ai_fluency_base, rules.ownership_base)
+            effects = np.zeros((len(rules.questions), code_count, 3), dtype=np.int64)
+            for slot, (question_key, answer_effects) in enumerate(rules.questions):
+                codes = enc.answer_codes[question_key]
+                for answer, effect in answer_effects.items():
+                    effects[slot, codes[answer]] = (effect.role_maturity, effect.ai_fluency, effect.ownership)
+            self._readiness_columns.append(np.array([enc.column[q] for q, _ in rules.questions], dtype=np.intp))
+            self._effects.append(effects)
+
+        # Skills, per role: [question slot, answer code] → score, [question slot, skill] → feeds skill
+        self.skill_names: List[Tuple[str, ...]] = []
+        self._skill_columns: List[Any] = []
+        self._skill_scores: List[Any] = []
+        self._skill_feeds: List[Any] = []
+        for role in enc.skill_roles:
+            table = ROLE_SCORING_TABLES[role]
+            self.skill_names.append(tuple(skill for skill, _, _ in table.skills))
+            scores = np.zeros((len(table.questions), code_count), dtype=np.int64)
+            feeds = np.zeros((len(table.questions), MAX_SKILLS), dtype=np.int64)
+            for slot, (question_key, answer_scores, skill_indices) in enumerate(table.questions):
+                codes = enc.answer_codes[question_key]
+                for answer, score in answer_scores.items():
+                    scores[slot, codes[answer]] = score
+                feeds[slot, list(skill_indices)] = 1
+            self._skill_columns.append(np.array([enc.column[q] for q, _, _ in table.questions], dtype=np.intp))
+            self._skill_scores.append(scores)
+            self._skill_feeds.append(feeds)
+
+    def score(self, encoded: Dict[str, Any]) -> Dict[str, Any]:
+        """Score an encoded batch; see score_mba_batch for the returned arrays."""
+        answers = encoded['answers']
+        readiness_roles = encoded['readiness_roles']
+        skill_roles = encoded['skill_roles']
+        experience_score = encoded['experience']
+        count = len(answers)
+
+        # Category scores: base + sum of per-question effects, capped at 100
+        categories = self._bases[readiness_roles]
+        for role_code in np.unique(readiness_roles):
+            rows = np.flatnonzero(readiness_roles == role_code)
+            columns = self._readiness_columns[role_code]
+            if len(columns):
+                slots = np.arange(len(columns))
+                categories[rows] += self._effects[role_code][slots, answers[np.ix_(rows, columns)]].sum(axis=1)
+        categories = np.minimum(categories, 100)
+        role_maturity_score = categories[:, 0]
+        ai_fluency_score = categories[:, 1]
+        ownership_score = categories[:, 2]
+
+        # Same operation order as the scalar function so floats match bit for bit
+        raw_score = (
+            experience_score * SCORING_WEIGHTS['experience'] +
+            role_maturity_score * SCORING_WEIGHTS['role_maturity'] +
+            ai_fluency_score * SCORING_WEIGHTS['ai_fluency'] +
+            ownership_score * SCORING_WEIGHTS['ownership']
+        )
+        overall_score = np.clip(
+            np.trunc(OVERALL_SCORE_FLOOR + (raw_score * OVERALL_SCORE_SCALE)).astype(np.int64),
+            OVERALL_SCORE_FLOOR, OVERALL_SCORE_CEILING,
+        )
+
+        maturity_codes = np.select(
+            [
+                (ai_fluency_score >= min_ai_fluency) & (True if min_score is None else raw_score >= min_score)
+                for _, min_ai_fluency, min_score in AI_MATURITY_THRESHOLDS
+            ],
+            [MATURITY_LEVELS.index(level) for level, _, _ in AI_MATURITY_THRESHOLDS],
+            default=MATURITY_LEVELS.index(AI_MATURITY_FLOOR),
+        )
+        percentile = np.select(
+            [overall_score >= bound for bound, _ in PERCENTILE_STEPS],
+            [value for _, value in PERCENTILE_STEPS],
+            default=PERCENTILE_FLOOR,
+        )
+
+        # Skills: per-skill sum and count of answered question scores
+        totals = np.zeros((count, MAX_SKILLS), dtype=np.int64)
+        counts = np.zeros((count, MAX_SKILLS), dtype=np.int64)
+        for role_code in np.unique(skill_roles):
+            rows = np.flatnonzero(skill_roles == role_code)
+            columns = self._skill_columns[role_code]
+            slots = np.arange(len(columns))
+            scores = self._skill_scores[role_code][slots, answers[np.ix_(rows, columns)]]
+            feeds = self._skill_feeds[role_code]
+            totals[rows] = scores @ feeds
+            counts[rows] = (scores > 0).astype(np.int64) @ feeds
+        with np.errstate(divide='ignore', invalid='ignore'):
+            internal = np.clip(np.rint(totals / counts), 1, 5)
+        levels = np.where(internal <= 2, 1, np.where(internal == 3, 2, 3))
+        skill_levels = np.where(counts > 0, levels, 2).astype(np.int8)
+
+        return {
+            'overall_score': overall_score,
+            'raw_score': raw_score,
+            'experience': experience_score,
+            'role_maturity': role_maturity_score,
+            'ai_fluency': ai_fluency_score,
+            'ownership': ownership_score,
+            'maturity_code': maturity_codes,
+            'maturity_level': np.array(MATURITY_LEVELS, dtype=object)[maturity_codes],
+            'percentile': percentile,
+            'skill_role': skill_roles,
+            'skill_levels': skill_levels,
+        }
+
+
+_scorer: Optional[BatchScorer] = None
+
+
+def get_batch_scorer() -> BatchScorer:
+    global _scorer
+    if _scorer is None:
+        _scorer = BatchScorer()
+    return _scorer
+
+
+def score_mba_batch(responses: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Score many quiz responses at once.
+
+    Returns a dict of arrays with one entry per response:
+        overall_score, raw_score, percentile: as calculate_mba_readiness_score
+        experience, role_maturity, ai_fluency, ownership: category scores
+        maturity_level: AIMaturityLevel values (maturity_code: index into MATURITY_LEVELS)
+        skill_levels: (n, MAX_SKILLS) skill levels, in the order of
+            scorer.skill_names[skill_role[i]] (as infer_skills_from_responses)
+
+    Readiness tags are not computed; they are list-valued and stay with the
+    scalar function.
+    """
+    scorer = get_batch_scorer()
+    return scorer.score(scorer.encoder.encode(responses))
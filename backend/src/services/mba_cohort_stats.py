@@ -0,0 +1,187 @@
+"""
+Empirical percentiles and cohort sizes for MBA readiness scores.
+
+Every evaluation adds its overall score to the histogram of its
+(role, experience, maturity level) cohort. Scores are integers in 0-100, so
+a 101-bin count histogram is an exact quantile sketch that merges by
+addition. Each worker keeps its new counts in memory and, every
+COHORT_STATS_FLUSH_INTERVAL_SECONDS, adds them to mba_cohort_histograms
+(migration 003) and reloads the merged totals from all workers.
+
+After each merge every cohort's score → percentile table is precomputed, so
+request-time lookups are a dict hit plus a list index. Cohorts with fewer
+than COHORT_STATS_MIN_SAMPLES evaluations return None and callers keep the
+static estimates.
+"""
+import atexit
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+from src.repositories.cohort_repository import CohortKey, CohortRepository
+from src.services.mba_scoring_orchestrator import EXPERIENCE_SCORES, ROLE_IDENTIFIER_TAGS
+from src.services.mba_skill_inference import ROLE_SKILL_MAPS
+
+logger = get_logger(__name__)
+
+SCORE_BINS = 101  # scores 0-100
+OTHER = 'other'
+# Quiz role keys ('pm', ...) and scoring role keys ('product-manager', ...)
+KNOWN_ROLES = frozenset(ROLE_IDENTIFIER_TAGS) | frozenset(ROLE_SKILL_MAPS)
+
+
+class CohortLookup(NamedTuple):
+    percentile: int
+    cohort_size: int
+
+
+class _CohortTable(NamedTuple):
+    count: int
+    # percentile for each score 0-100 (mid-rank: below + half of ties)
+    percentiles: Tuple[int, ...]
+
+
+def cohort_key(role: Optional[str], experience: Optional[str], maturity_level: Optional[str]) -> CohortKey:
+    """Normalize a cohort; unknown roles/experience share an 'other' bucket so cohorts stay bounded."""
+    maturity = getattr(maturity_level, 'value', maturity_level)
+    return (
+        role if role in KNOWN_ROLES else OTHER,
+        experience if experience in EXPERIENCE_SCORES else OTHER,
+        maturity if isinstance(maturity, str) else OTHER,
+    )
+
+
+def _build_table(histogram: List[int]) -> _CohortTable:
+    total = sum(histogram)
+    percentiles = []
+    below = 0
+    for count in histogram:
+        if total:
+            percentile = round(100 * (below + count / 2) / total)
+            percentiles.append(max(1, min(99, percentile)))
+        else:
+            percentiles.append(0)
+        below += count
+    return _CohortTable(count=total, percentiles=tuple(percentiles))
+
+
+class CohortStats:
+    """Per-worker cohort histograms, merged through the database."""
+
+    def __init__(
+        self,
+        repository: Optional[CohortRepository] = None,
+        flush_interval: Optional[float] = None,
+        min_samples: Optional[int] = None,
+    ):
+        self._repository = repository or CohortRepository()
+        self._flush_interval = (
+            settings.cohort_stats_flush_interval_seconds if flush_interval is None else flush_interval
+        )
+        self._min_samples = settings.cohort_stats_min_samples if min_samples is None else min_samples
+        self._merged: Dict[CohortKey, List[int]] = {}
+        self._pending: Dict[CohortKey, List[int]] = {}
+        self._tables: Dict[CohortKey, _CohortTable] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, role: Optional[str], experience: Optional[str], maturity_level: Optional[str], score: int) -> None:
+        """Count one evaluation (visible to lookups after the next flush)."""
+        key = cohort_key(role, experience, maturity_level)
+        score = max(0, min(SCORE_BINS - 1, int(score)))
+        with self._lock:
+            histogram = self._pending.get(key)
+            if histogram is None:
+                histogram = self._pending[key] = [0] * SCORE_BINS
+            histogram[score] += 1
+            self._ensure_started()
+
+    def lookup(
+        self, role: Optional[str], experience: Optional[str], maturity_level: Optional[str], score: int
+    ) -> Optional[CohortLookup]:
+        """Empirical percentile and cohort size, or None while the cohort is too small."""
+        table = self._tables.get(cohort_key(role, experience, maturity_level))
+        if table is None or table.count < self._min_samples:
+            return None
+        return CohortLookup(
+            percentile=table.percentiles[max(0, min(SCORE_BINS - 1, int(score)))],
+            cohort_size=table.count,
+        )
+
+    def flush(self) -> None:
+        """Add pending counts to the shared histograms, reload the merged totals and rebuild lookup tables."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+
+            merged = self._merged
+            unsaved: Dict[CohortKey, List[int]] = {}
+            try:
+                self._repository.add_counts({
+                    key: {score: count for score, count in enumerate(histogram) if count}
+                    for key, histogram in pending.items()
+                })
+            except Exception as exc:
+                if pending:
+                    logger.warning(f"Cohort stats flush failed, keeping {len(pending)} cohorts in memory: {exc}")
+                unsaved = pending
+            else:
+                try:
+                    merged = {
+                        key: [counts.get(score, 0) for score in range(SCORE_BINS)]
+                        for key, counts in self._repository.load_all().items()
+                    }
+                except Exception as exc:
+                    logger.warning(f"Cohort stats reload failed, merging locally: {exc}")
+                    merged = {key: list(histogram) for key, histogram in merged.items()}
+                    for key, histogram in pending.items():
+                        current = merged.setdefault(key, [0] * SCORE_BINS)
+                        for score, count in enumerate(histogram):
+                            current[score] += count
+
+            with self._lock:
+                for key, histogram in unsaved.items():
+                    current = self._pending.setdefault(key, [0] * SCORE_BINS)
+                    for score, count in enumerate(histogram):
+                        current[score] += count
+                combined = {key: list(histogram) for key, histogram in merged.items()}
+                for key, histogram in self._pending.items():
+                    current = combined.setdefault(key, [0] * SCORE_BINS)
+                    for score, count in enumerate(histogram):
+                        current[score] += count
+
+            self._merged = merged
+            self._tables = {key: _build_table(histogram) for key, histogram in combined.items()}
+
+    def _ensure_started(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            if self._thread is None:
+                atexit.register(self.close)
+            self._thread = threading.Thread(target=self._run, name="mba-cohort-stats", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flush thread and persist anything pending."""
+        self._stop.set()
+        self.flush()
+
+
+_cohort_stats: Optional[CohortStats] = None
+_cohort_stats_lock = threading.Lock()
+
+
+def get_cohort_stats() -> CohortStats:
+    global _cohort_stats
+    with _cohort_stats_lock:
+        if _cohort_stats is None:
+            _cohort_stats = CohortStats()
+            # Load merged totals from other workers once at startup
+            threading.Thread(target=_cohort_stats.flush, name="mba-cohort-stats-load", daemon=True).start()
+        return _cohort_stats
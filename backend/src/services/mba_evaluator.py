@@ -2,10 +2,8 @@
 MBA Evaluation Orchestrator
 Main entry point that coordinates all MBA evaluation services
 """
-import json
-import os
 import random
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from src.services.mba_scoring_orchestrator import calculate_mba_readiness_score
 from src.services.mba_skill_inference import infer_skills_from_responses
 from src.services.mba_ai_tools import get_ai_tools_for_role
@@ -14,20 +12,19 @@ from src.services.mba_industry_data import (
     get_transformation_insights_for_role
 )
 from src.services.mba_persona_matcher import match_persona
+from src.services.mba_cohort_stats import get_cohort_stats
+from src.services.mba_lookup import get_mba_lookup
 from src.services.mba_openai_service import generate_mba_openai_content
+from src.services.request_timing import stage
 from src.config.logging_config import get_logger
+from src.config.registry import config_registry
 
 logger = get_logger(__name__)
 
 
 def _load_transformation_companies() -> Dict[str, Any]:
-    """Load transformation companies from JSON file"""
-    companies_file = os.path.join(
-        os.path.dirname(__file__),
-        '..', 'config', 'transformation_companies.json'
-    )
-    with open(companies_file, 'r') as f:
-        return json.load(f)
+    """Transformation companies from transformation_companies.json (frozen, loaded once by the config registry)"""
+    return config_registry.get('transformation_companies')
 
 
 def _get_role_display_name(role: str) -> str:
@@ -63,31 +60,34 @@ def evaluate_mba_readiness(quiz_responses: Dict[str, Any]) -> Dict[str, Any]:
     role = quiz_responses.get('role')
     logger.info(f"Starting MBA evaluation for role={role}")
 
-    # 1. Calculate MBA Readiness Score
-    readiness = calculate_mba_readiness_score(quiz_responses)
-
-    # 2. Match persona based on role + AI maturity
-    persona_info = match_persona(role, readiness)
+    # 1-7. Readiness, persona, skills, AI tools, industry data and peer comparison:
+    # served from the precomputed lookup file when available, else computed live
+    with stage("lookup"):
+        sections = get_mba_lookup().get(quiz_responses)
+    if not sections:
+        with stage("scoring"):
+            sections = compute_deterministic_sections(quiz_responses)
+    readiness = sections['readiness']
+    persona_info = sections['persona']
+    skills_analysis = sections['skills']
+    ai_tools = sections['ai_tools']
+    industry_stats = sections['industry_stats']
+    transformation_insights = sections['transformation_insights']
+    peer_comparison = sections['peer_comparison']
     logger.info(f"Matched persona: {persona_info['badge_label']}")
 
-    # 3. Infer skill levels (role-specific skills)
-    skills_analysis = infer_skills_from_responses(role, quiz_responses)
-
-    # 4. Get AI tools recommendations (list to personalize via OpenAI)
-    ai_tools = get_ai_tools_for_role(
-        role=role,
-        skill_gaps=skills_analysis['gaps']
-    )
-
-    # 5. Get industry stats
-    industry_stats = get_industry_stats_for_role(role)
-    logger.info(f"Retrieved {len(industry_stats)} industry stats for role: {role}")
-
-    # 6. Get transformation insights
-    transformation_insights = get_transformation_insights_for_role(role)
-
-    # 7. Generate peer comparison message
-    peer_comparison = _generate_peer_comparison(readiness)
+    # Empirical percentile within the (role, experience, maturity) cohort once it is large enough
+    with stage("cohort_stats"):
+        cohort_stats = get_cohort_stats()
+        cohort = cohort_stats.lookup(
+            role, quiz_responses.get('experience'), readiness['maturity_level'], readiness['overall_score']
+        )
+        cohort_stats.record(
+            role, quiz_responses.get('experience'), readiness['maturity_level'], readiness['overall_score']
+        )
+    if cohort:
+        readiness['percentile'] = cohort.percentile
+        peer_comparison = _generate_peer_comparison(readiness, cohort.cohort_size)
 
     # 8. Select 3 random companies for transformation stories
     transformation_companies_data = _load_transformation_companies()
@@ -172,10 +172,56 @@ def evaluate_mba_readiness(quiz_responses: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _generate_peer_comparison(readiness: Dict[str, Any]) -> Dict[str, Any]:
+def compute_deterministic_sections(quiz_responses: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Sections of the evaluation that depend only on the quiz answers
+    (role, experience and role-specific questions). mba_lookup precomputes
+    these for every answer combination.
+    """
+    role = quiz_responses.get('role')
+
+    # 1. Calculate MBA Readiness Score
+    readiness = calculate_mba_readiness_score(quiz_responses)
+
+    # 2. Match persona based on role + AI maturity
+    persona_info = match_persona(role, readiness)
+
+    # 3. Infer skill levels (role-specific skills)
+    skills_analysis = infer_skills_from_responses(role, quiz_responses)
+
+    # 4. Get AI tools recommendations (list to personalize via OpenAI)
+    ai_tools = get_ai_tools_for_role(
+        role=role,
+        skill_gaps=skills_analysis['gaps']
+    )
+
+    # 5. Get industry stats
+    industry_stats = get_industry_stats_for_role(role)
+
+    # 6. Get transformation insights
+    transformation_insights = get_transformation_insights_for_role(role)
+
+    # 7. Generate peer comparison message (static percentile estimate)
+    peer_comparison = _generate_peer_comparison(readiness)
+
+    return {
+        'readiness': readiness,
+        'persona': persona_info,
+        'skills': skills_analysis,
+        'ai_tools': ai_tools,
+        'industry_stats': industry_stats,
+        'transformation_insights': transformation_insights,
+        'peer_comparison': peer_comparison
+    }
+
+
+def _generate_peer_comparison(readiness: Dict[str, Any], cohort_size: Optional[int] = None) -> Dict[str, Any]:
     """
     Generate peer comparison messaging
 
+    cohort_size is the measured size of the user's cohort; without it the
+    static estimate for the maturity level is shown.
+
     Returns:
         {
             'percentile': 85,
@@ -216,7 +262,9 @@ def _generate_peer_comparison(readiness: Dict[str, Any]) -> Dict[str, Any]:
         'message': message,
         'comparison_text': comparison_text,
         'badge': badge,
-        'cohort_size': _estimate_cohort_size(readiness['maturity_level'])
+        'cohort_size': (
+            f'{cohort_size:,} professionals' if cohort_size else _estimate_cohort_size(readiness['maturity_level'])
+        )
     }
 
 
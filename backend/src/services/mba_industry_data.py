@@ -1,39 +1,11 @@
 """
 MBA Industry Stats and Transformation Insights
 Pre-loaded data on upskilling ROI and industry transformation
-"""
-from typing import List, Dict, Any
-
-
-def get_industry_stats_for_role(role: str) -> List[Dict[str, Any]]:
-    """
-    Get industry statistics relevant to the role showing why upskilling matters
-    Returns exactly 3 role-specific stats from verified sources (McKinsey, Gartner, PwC, LinkedIn)
-
-    Returns:
-        [
-            {
-                'stat': '67%',
-                'description': 'Description of stat',
-                'source': 'McKinsey 2024',
-                'impact': 'What it means for the user'
-            }
-        ]
-    """
-    # Role-specific stats (returns exactly 3 per role)
-    role_stats_map = {
-        'pm': _pm_stats,
-        'product-manager': _pm_stats,
-        'finance': _finance_stats,
-        'sales': _sales_stats,
-        'marketing': _marketing_stats,
-        'operations': _operations_stats,
-        'founder': _founder_stats
-    }
 
-    role_stats = role_stats_map.get(role, _founder_stats)()  # Default to founder stats if role not found
-
-    return role_stats  # Return exactly 3 stats
+Compiled once at import into immutable records; lookups return shared lists
+that callers must not modify.
+"""
+from typing import List, Dict, Any, NamedTuple, Tuple
 
 
 def _pm_stats() -> List[Dict[str, Any]]:
@@ -180,33 +152,6 @@ def _founder_stats() -> List[Dict[str, Any]]:
     ]
 
 
-def get_transformation_insights_for_role(role: str) -> List[Dict[str, str]]:
-    """
-    Get insights on how companies/industries are being transformed by AI
-
-    Returns:
-        [
-            {
-                'title': 'Transformation title',
-                'description': 'What\'s changing',
-                'example': 'Real company example',
-                'takeaway': 'What it means for career'
-            }
-        ]
-    """
-    role_transformation_map = {
-        'product-manager': _pm_transformation,
-        'finance': _finance_transformation,
-        'sales': _sales_transformation,
-        'marketing': _marketing_transformation,
-        'operations': _operations_transformation,
-        'founder': _founder_transformation
-    }
-
-    transformations = role_transformation_map.get(role, lambda: [])()
-    return transformations[:3]  # Top 3 transformations
-
-
 def _pm_transformation() -> List[Dict[str, str]]:
     """Product transformation insights"""
     return [
@@ -349,3 +294,87 @@ def _founder_transformation() -> List[Dict[str, str]]:
             'takeaway': 'Fastest to iterate wins in the AI era'
         }
     ]
+
+
+class IndustryStatRecord(NamedTuple):
+    stat: str
+    description: str
+    source: str
+    impact: str
+
+
+class TransformationInsightRecord(NamedTuple):
+    title: str
+    description: str
+    example: str
+    takeaway: str
+
+
+# Compiled once at import; every role's answer is a shared list of shared dicts
+INDUSTRY_STATS: Dict[str, Tuple[IndustryStatRecord, ...]] = {
+    role: tuple(IndustryStatRecord(**stat) for stat in factory())
+    for role, factory in (
+        ('pm', _pm_stats),
+        ('product-manager', _pm_stats),
+        ('finance', _finance_stats),
+        ('sales', _sales_stats),
+        ('marketing', _marketing_stats),
+        ('operations', _operations_stats),
+        ('founder', _founder_stats),
+    )
+}
+TRANSFORMATION_INSIGHTS: Dict[str, Tuple[TransformationInsightRecord, ...]] = {
+    role: tuple(TransformationInsightRecord(**insight) for insight in factory()[:3])  # Top 3 transformations
+    for role, factory in (
+        ('product-manager', _pm_transformation),
+        ('finance', _finance_transformation),
+        ('sales', _sales_transformation),
+        ('marketing', _marketing_transformation),
+        ('operations', _operations_transformation),
+        ('founder', _founder_transformation),
+    )
+}
+
+_STATS_BY_ROLE: Dict[str, List[Dict[str, Any]]] = {
+    role: [stat._asdict() for stat in stats] for role, stats in INDUSTRY_STATS.items()
+}
+_INSIGHTS_BY_ROLE: Dict[str, List[Dict[str, str]]] = {
+    role: [insight._asdict() for insight in insights] for role, insights in TRANSFORMATION_INSIGHTS.items()
+}
+_NO_INSIGHTS: List[Dict[str, str]] = []
+
+
+def get_industry_stats_for_role(role: str) -> List[Dict[str, Any]]:
+    """
+    Get industry statistics relevant to the role showing why upskilling matters
+    Returns exactly 3 role-specific stats from verified sources (McKinsey, Gartner, PwC, LinkedIn)
+
+    Returns (shared, do not modify):
+        [
+            {
+                'stat': '67%',
+                'description': 'Description of stat',
+                'source': 'McKinsey 2024',
+                'impact': 'What it means for the user'
+            }
+        ]
+    """
+    # Default to founder stats if role not found
+    return _STATS_BY_ROLE.get(role, _STATS_BY_ROLE['founder'])
+
+
+def get_transformation_insights_for_role(role: str) -> List[Dict[str, str]]:
+    """
+    Get insights on how companies/industries are being transformed by AI
+
+    Returns (shared, do not modify):
+        [
+            {
+                'title': 'Transformation title',
+                'description': 'What\'s changing',
+                'example': 'Real company example',
+                'takeaway': 'What it means for career'
+            }
+        ]
+    """
+    return _INSIGHTS_BY_ROLE.get(role, _NO_INSIGHTS)
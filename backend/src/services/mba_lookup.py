@@ -0,0 +1,359 @@
+"""
+Precomputed lookup file for the deterministic MBA evaluation sections.
+
+Readiness, persona, skills, AI tools, industry stats, transformation
+insights and the (static) peer comparison depend only on the role, the
+experience band and the role's quiz answers. For every quiz role that is
+4^6 answer combinations x 5 experience bands, so the build step evaluates
+all of them once and writes a compact file that the API memory-maps.
+
+File layout (little-endian):
+    magic         b"MBALUT1\\0"
+    header_len    uint32, then a JSON header (roles, answer options, fingerprint)
+    index         uint32[record_count][len(SECTIONS)]  section blob ids per answer vector
+    blob offsets  uint64[blob_count + 1]
+    blobs         compact JSON, deduplicated (most sections repeat across combinations)
+
+A record is found by mixed-radix encoding of (experience, answer codes) on
+top of the role's base offset. Requests outside the precomputed space
+(other roles, unknown or missing answers, answers to questions outside the
+role's quiz) and files built from different scoring code or persona config
+return None so the evaluator computes live.
+
+Build:
+    python -m src.services.mba_lookup build -o data/mba_lookup.bin
+Serve by setting MBA_LOOKUP_PATH to the built file.
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import random
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.config.logging_config import get_logger
+from src.config.registry import config_registry
+from src.config.settings import settings
+from src.services.mba_scoring_orchestrator import COMPILED_ROLE_RULES, DEFAULT_ROLE_RULES, EXPERIENCE_SCORES
+from src.services.mba_skill_inference import ROLE_SCORING_TABLES, ROLE_SKILL_MAPS
+from src.services.mba_skill_scoring_maps import ANSWER_SCORES
+
+logger = get_logger(__name__)
+
+MAGIC = b"MBALUT1\0"
+SECTIONS = (
+    'readiness', 'persona', 'skills', 'ai_tools',
+    'industry_stats', 'transformation_insights', 'peer_comparison',
+)
+_RECORD = struct.Struct(f"<{len(SECTIONS)}I")
+_OFFSET = struct.Struct("<Q")
+
+# Quiz roles (as sent by the frontend) and the prefix of their question keys
+ROLE_QUESTION_PREFIXES = {role: f"{role}-" for role in ROLE_SKILL_MAPS}
+
+# Code that the lookup depends on; a file built from other versions is ignored
+_SOURCE_MODULES = (
+    'mba_evaluator.py', 'mba_scoring_orchestrator.py', 'mba_skill_inference.py',
+    'mba_skill_scoring_maps.py', 'mba_ai_tools.py', 'mba_industry_data.py', 'mba_persona_matcher.py',
+)
+
+
+def source_fingerprint() -> str:
+    """Hash of the scoring modules and persona config the precomputed sections derive from."""
+    digest = hashlib.sha256()
+    services_dir = Path(__file__).parent
+    for name in _SOURCE_MODULES:
+        digest.update((services_dir / name).read_bytes())
+    digest.update(Path(config_registry.entry('mba_personas').path).read_bytes())
+    return digest.hexdigest()
+
+
+def _role_space() -> List[Dict[str, Any]]:
+    """Per role: its quiz questions with answer options, plus questions that must stay unanswered."""
+    experiences = list(EXPERIENCE_SCORES)
+    space = []
+    for role, prefix in ROLE_QUESTION_PREFIXES.items():
+        questions = [
+            [question_key, list(answer_scores)]
+            for question_key, answer_scores in ANSWER_SCORES.items()
+            if question_key.startswith(prefix)
+        ]
+        keyed = {question_key for question_key, _ in questions}
+        rules = COMPILED_ROLE_RULES.get(role, DEFAULT_ROLE_RULES)
+        table = ROLE_SCORING_TABLES.get(role) or ROLE_SCORING_TABLES['pm']
+        relevant = {question_key for question_key, _ in rules.questions}
+        relevant |= {question_key for question_key, _, _ in table.questions}
+        size = len(experiences)
+        for _, options in questions:
+            size *= len(options)
+        space.append({
+            'role': role,
+            'experiences': experiences,
+            'questions': questions,
+            'unkeyed': sorted(relevant - keyed),
+            'size': size,
+        })
+    return space
+
+
+def _iter_responses(role_space: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Every response in a role's space, in record order (last question varies fastest)."""
+    questions = role_space['questions']
+    codes = [0] * len(questions)
+    for experience in role_space['experiences']:
+        while True:
+            response = {'role': role_space['role'], 'experience': experience}
+            for (question_key, options), code in zip(questions, codes):
+                response[question_key] = options[code]
+            yield response
+            position = len(codes) - 1
+            while position >= 0:
+                codes[position] += 1
+                if codes[position] < len(questions[position][1]):
+                    break
+                codes[position] = 0
+                position -= 1
+            if position < 0:
+                break
+
+
+def build_lookup(output_path: str, verify_samples: int = 200) -> Dict[str, Any]:
+    """
+    Evaluate every answer combination and write the lookup file atomically.
+
+    Returns:
+        Build summary (records, distinct blobs, bytes)
+    """
+    from src.services.mba_evaluator import compute_deterministic_sections
+
+    space = _role_space()
+    blob_ids: Dict[bytes, int] = {}
+    blobs: List[bytes] = []
+    records = bytearray()
+    roles = []
+    base = 0
+
+    for role_space in space:
+        for response in _iter_responses(role_space):
+            sections = compute_deterministic_sections(response)
+            ids = []
+            for name in SECTIONS:
+                blob = json.dumps(sections[name], separators=(',', ':'), sort_keys=True).encode('utf-8')
+                blob_id = blob_ids.get(blob)
+                if blob_id is None:
+                    blob_id = blob_ids[blob] = len(blobs)
+                    blobs.append(blob)
+                ids.append(blob_id)
+            records += _RECORD.pack(*ids)
+        roles.append({
+            'role': role_space['role'],
+            'base': base,
+            'experiences': role_space['experiences'],
+            'questions': role_space['questions'],
+            'unkeyed': role_space['unkeyed'],
+        })
+        base += role_space['size']
+        logger.info(f"Precomputed {role_space['size']} MBA answer combinations for role={role_space['role']}")
+
+    header = json.dumps({
+        'fingerprint': source_fingerprint(),
+        'sections': list(SECTIONS),
+        'record_count': base,
+        'blob_count': len(blobs),
+        'roles': roles,
+    }, separators=(',', ':')).encode('utf-8')
+
+    offsets = bytearray()
+    position = 0
+    for blob in blobs:
+        offsets += _OFFSET.pack(position)
+        position += len(blob)
+    offsets += _OFFSET.pack(position)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.write(records)
+        f.write(offsets)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, output_path)
+
+    summary = {
+        'path': output_path,
+        'records': base,
+        'blobs': len(blobs),
+        'bytes': os.path.getsize(output_path),
+    }
+
+    if verify_samples:
+        lookup = MBALookup(output_path)
+        rng = random.Random(0)
+        for _ in range(verify_samples):
+            role_space = rng.choice(space)
+            response = {'role': role_space['role'], 'experience': rng.choice(role_space['experiences'])}
+            for question_key, options in role_space['questions']:
+                response[question_key] = rng.choice(options)
+            expected = json.loads(json.dumps(compute_deterministic_sections(response)))
+            if lookup.get(response) != expected:
+                raise RuntimeError(f"Lookup file mismatch for {response}")
+        lookup.close()
+        summary['verified_samples'] = verify_samples
+
+    return summary
+
+
+class MBALookup:
+    """Read side of the lookup file (memory-mapped, shared by all requests)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an MBA lookup file")
+
+        (header_len,) = struct.unpack_from("<I", self._mm, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(self._mm[header_start:header_start + header_len])
+        if header['sections'] != list(SECTIONS):
+            self.close()
+            raise ValueError(f"{path} was built with different sections")
+
+        self.fingerprint: str = header['fingerprint']
+        self.record_count: int = header['record_count']
+        self._index_start = header_start + header_len
+        self._offsets_start = self._index_start + self.record_count * _RECORD.size
+        self._blobs_start = self._offsets_start + (header['blob_count'] + 1) * _OFFSET.size
+        self._persona_version = config_registry.entry('mba_personas').version
+        # Distinct sections are few (blob_count), so each is decoded at most once
+        self._decoded: Dict[int, Any] = {}
+
+        # role → (base, experience → code, [(question_key, answer → code, radix)], unkeyed questions)
+        self._roles: Dict[str, Tuple[int, Dict[str, int], List[Tuple[str, Dict[str, int], int]], Tuple[str, ...]]] = {}
+        for role in header['roles']:
+            self._roles[role['role']] = (
+                role['base'],
+                {experience: code for code, experience in enumerate(role['experiences'])},
+                [
+                    (question_key, {answer: code for code, answer in enumerate(options)}, len(options))
+                    for question_key, options in role['questions']
+                ],
+                tuple(role['unkeyed']),
+            )
+
+    def record_index(self, quiz_responses: Dict[str, Any]) -> Optional[int]:
+        """Record number for a response, or None if it is outside the precomputed space."""
+        role = quiz_responses.get('role')
+        entry = self._roles.get(role) if isinstance(role, str) else None
+        if entry is None:
+            return None
+        base, experiences, questions, unkeyed = entry
+
+        experience = quiz_responses.get('experience')
+        index = experiences.get(experience) if isinstance(experience, str) else None
+        if index is None:
+            return None
+        for question_key, codes, radix in questions:
+            answer = quiz_responses.get(question_key)
+            code = codes.get(answer) if isinstance(answer, str) else None
+            if code is None:
+                return None
+            index = index * radix + code
+        # Answers to other questions the scoring reads would change the result
+        for question_key in unkeyed:
+            if quiz_responses.get(question_key):
+                return None
+        return base + index
+
+    def _blob(self, blob_id: int) -> Any:
+        value = self._decoded.get(blob_id)
+        if value is not None:
+            return value
+        (start,) = _OFFSET.unpack_from(self._mm, self._offsets_start + blob_id * _OFFSET.size)
+        (end,) = _OFFSET.unpack_from(self._mm, self._offsets_start + (blob_id + 1) * _OFFSET.size)
+        value = self._decoded[blob_id] = json.loads(self._mm[self._blobs_start + start:self._blobs_start + end])
+        return value
+
+    def get(self, quiz_responses: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Precomputed sections, or None. Section objects are shared between
+        requests and must be treated as read-only, except the top level of
+        readiness, which is copied so the evaluator can set the cohort percentile.
+        """
+        if config_registry.entry('mba_personas').version != self._persona_version:
+            return None
+        index = self.record_index(quiz_responses)
+        if index is None:
+            return None
+        blob_ids = _RECORD.unpack_from(self._mm, self._index_start + index * _RECORD.size)
+        sections = {name: self._blob(blob_id) for name, blob_id in zip(SECTIONS, blob_ids)}
+        sections['readiness'] = dict(sections['readiness'])
+        return sections
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+
+class _DisabledLookup:
+    def get(self, quiz_responses: Dict[str, Any]) -> None:
+        return None
+
+
+_lookup: Optional[Any] = None
+_lookup_lock = threading.Lock()
+
+
+def get_mba_lookup():
+    """Lookup for MBA_LOOKUP_PATH, or a no-op when unset, missing or stale."""
+    global _lookup
+    if _lookup is not None:
+        return _lookup
+    with _lookup_lock:
+        if _lookup is None:
+            _lookup = _DisabledLookup()
+            path = settings.mba_lookup_path
+            if path:
+                try:
+                    lookup = MBALookup(path)
+                    if lookup.fingerprint != source_fingerprint():
+                        logger.warning(f"MBA lookup file {path} is stale (built from other scoring code); computing live")
+                        lookup.close()
+                    else:
+                        logger.info(f"Loaded MBA lookup file {path} ({lookup.record_count} records)")
+                        _lookup = lookup
+                except (OSError, ValueError) as exc:
+                    logger.warning(f"MBA lookup file {path} unavailable, computing live: {exc}")
+        return _lookup
+
+
+def main(argv: Optional[list] = None) -> int:
+    from src.config.logging_config import setup_logging
+
+    parser = argparse.ArgumentParser(description="Precompute deterministic MBA evaluation sections")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="Build the lookup file")
+    build.add_argument("-o", "--output", default=settings.mba_lookup_path or "data/mba_lookup.bin")
+    build.add_argument("--verify-samples", type=int, default=200, help="Random combinations to re-check after writing")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    summary = build_lookup(args.output, verify_samples=args.verify_samples)
+    logger.info(
+        f"Wrote {summary['path']}: {summary['records']} records, "
+        f"{summary['blobs']} distinct sections, {summary['bytes']} bytes"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
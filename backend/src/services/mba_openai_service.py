@@ -8,11 +8,13 @@ from openai import OpenAI
 from pydantic import BaseModel
 from src.config.settings import settings
 from src.config.logging_config import get_logger
+from src.services.llm_accounting import ENDPOINT_MBA_EVALUATE, get_llm_accounting
+from src.services.request_timing import stage
 
 logger = get_logger(__name__)
 
 # Initialize OpenAI client
-client = OpenAI(api_key=settings.openai_api_key)
+client = OpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
 
 
 # Pydantic models for structured output
@@ -50,60 +52,86 @@ class MBAOpenAIContent(BaseModel):
     career_paths: List[CareerPath]
 
 
-def generate_mba_openai_content(
-    role: str,
-    experience: str,
-    career_goal: str,
-    skill_gaps: List[str],
-    skills: Dict[str, Any],
-    readiness_score: int,
-    companies: List[Dict[str, str]],
-    tools: List[Dict[str, str]],
-    current_role: str = None
-) -> Dict[str, Any]:
-    """
-    Generate all personalized OpenAI content in one call
-
-    Args:
-        role: User's role (pm, finance, sales, marketing, operations, founder)
-        experience: Years of experience
-        career_goal: Career goal from Q2
-        skill_gaps: List of skill gap keys
-        skills: Full skills analysis with levels
-        readiness_score: Overall readiness score
-        companies: 3 selected companies for transformation stories
-        tools: List of AI tools to personalize
-        current_role: Display name of current role
-
-    Returns:
-        Dictionary with transformation_stories, tool_descriptions, quick_wins, career_paths
-    """
-
-    # Build tight user context JSON
-    user_context = {
-        "role": role,
-        "current_role_name": current_role or role,
-        "experience": experience,
-        "career_goal": career_goal,
-        "readiness_score": readiness_score,
-        "skills": {
-            "strengths": skills.get("strengths", []),
-            "proficient": [
-                skill_data.get("title", skill_name)
-                for skill_name, skill_data in skills.get("skills", {}).items()
-                if skill_data.get("level") == 2
-            ],
-            "gaps": skills.get("gaps", [])
-        },
-        "companies_to_analyze": [{"name": c["name"], "industry": c["industry"]} for c in companies],
-        "tools_to_personalize": [{"name": t["name"], "category": t["category"]} for t in tools]
+MBA_OPENAI_MODEL = "gpt-4o"  # Using GPT-4 for quality
+
+# Structured output schema for MBAOpenAIContent
+MBA_CONTENT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "mba_content",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "transformation_stories": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "company": {"type": "string"},
+                            "before_ai": {"type": "string"},
+                            "after_ai": {"type": "string"},
+                            "relevance_to_user": {"type": "string"}
+                        },
+                        "required": ["company", "before_ai", "after_ai", "relevance_to_user"],
+                        "additionalProperties": False
+                    }
+                },
+                "tool_descriptions": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool_name": {"type": "string"},
+                            "personalized_use_case": {"type": "string"},
+                            "why_it_helps": {"type": "string"}
+                        },
+                        "required": ["tool_name", "personalized_use_case", "why_it_helps"],
+                        "additionalProperties": False
+                    }
+                },
+                "quick_wins": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {"type": "string"},
+                            "description": {"type": "string"},
+                            "timeline": {"type": "string"},
+                            "impact": {"type": "string"},
+                            "priority": {"type": "string"}
+                        },
+                        "required": ["title", "description", "timeline", "impact", "priority"],
+                        "additionalProperties": False
+                    }
+                },
+                "career_paths": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {"type": "string"},
+                            "description": {"type": "string"},
+                            "action_items": {
+                                "type": "array",
+                                "items": {"type": "string"}
+                            }
+                        },
+                        "required": ["title", "description", "action_items"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["transformation_stories", "tool_descriptions", "quick_wins", "career_paths"],
+            "additionalProperties": False
+        }
     }
+}
 
-    # Craft comprehensive prompt
-    prompt = f"""You are an expert MBA career advisor specializing in Business x AI transformation. Generate highly personalized career development content for this user.
 
-USER CONTEXT:
-{json.dumps(user_context, indent=2)}
+# Static instructions: identical for every user so the provider can serve them
+# from its prompt prefix cache. The per-user context is appended, minified.
+MBA_CONTENT_INSTRUCTIONS = """You are an expert MBA career advisor specializing in Business x AI transformation. Generate highly personalized career development content for the user described in USER CONTEXT at the end of this message.
 
 GENERATE THE FOLLOWING:
 
@@ -113,7 +141,7 @@ For each company in companies_to_analyze:
 - after_ai: 2-3 sentences (50-70 words). Explain HOW AI solved the problem and the specific RESULTS/METRICS they achieved. Show the transformation clearly with concrete outcomes (e.g., "reduced costs by 40%", "increased conversion by 3x"). Format as bullet points separated by " | ".
 - relevance_to_user: 2-3 sentences (50-70 words). Explain WHY this story matters for THIS specific user based on their role, experience level, career goal, and quiz responses. Connect the story directly to their situation (e.g., "Since you're a PM struggling with prioritization...", "As a finance professional aiming for senior roles..."). Make it deeply personalized. Format as bullet points separated by " | ".
 
-2. TOOL DESCRIPTIONS ({len(tools)} tools):
+2. TOOL DESCRIPTIONS (one per tool in tools_to_personalize):
 For each tool in tools_to_personalize:
 - personalized_use_case: 1-2 sentences ONLY (max 25 words total). How THIS user should use it to address their gaps/goals.
 - why_it_helps: 1 sentence ONLY (max 15 words). Concrete career impact.
@@ -151,105 +179,97 @@ CRITICAL WORD LIMITS (DO NOT EXCEED):
 
 OUTPUT: Return JSON matching the structure exactly."""
 
-    try:
-        logger.info(f"Calling OpenAI for MBA content generation (role={role}, goal={career_goal})")
 
-        response = client.chat.completions.create(
-            model="gpt-4o",  # Using GPT-4 for quality
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert MBA career advisor specializing in Business x AI. Generate personalized, actionable career guidance."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
+def generate_mba_openai_content(
+    role: str,
+    experience: str,
+    career_goal: str,
+    skill_gaps: List[str],
+    skills: Dict[str, Any],
+    readiness_score: int,
+    companies: List[Dict[str, str]],
+    tools: List[Dict[str, str]],
+    current_role: str = None
+) -> Dict[str, Any]:
+    """
+    Generate all personalized OpenAI content in one call
+
+    Args:
+        role: User's role (pm, finance, sales, marketing, operations, founder)
+        experience: Years of experience
+        career_goal: Career goal from Q2
+        skill_gaps: List of skill gap keys
+        skills: Full skills analysis with levels
+        readiness_score: Overall readiness score
+        companies: 3 selected companies for transformation stories
+        tools: List of AI tools to personalize
+        current_role: Display name of current role
+
+    Returns:
+        Dictionary with transformation_stories, tool_descriptions, quick_wins, career_paths
+    """
+
+    # Build tight user context JSON
+    user_context = {
+        "role": role,
+        "current_role_name": current_role or role,
+        "experience": experience,
+        "career_goal": career_goal,
+        "readiness_score": readiness_score,
+        "skills": {
+            "strengths": skills.get("strengths", []),
+            "proficient": [
+                skill_data.get("title", skill_name)
+                for skill_name, skill_data in skills.get("skills", {}).items()
+                if skill_data.get("level") == 2
             ],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "mba_content",
-                    "strict": True,
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "transformation_stories": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "company": {"type": "string"},
-                                        "before_ai": {"type": "string"},
-                                        "after_ai": {"type": "string"},
-                                        "relevance_to_user": {"type": "string"}
-                                    },
-                                    "required": ["company", "before_ai", "after_ai", "relevance_to_user"],
-                                    "additionalProperties": False
-                                }
-                            },
-                            "tool_descriptions": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "tool_name": {"type": "string"},
-                                        "personalized_use_case": {"type": "string"},
-                                        "why_it_helps": {"type": "string"}
-                                    },
-                                    "required": ["tool_name", "personalized_use_case", "why_it_helps"],
-                                    "additionalProperties": False
-                                }
-                            },
-                            "quick_wins": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "title": {"type": "string"},
-                                        "description": {"type": "string"},
-                                        "timeline": {"type": "string"},
-                                        "impact": {"type": "string"},
-                                        "priority": {"type": "string"}
-                                    },
-                                    "required": ["title", "description", "timeline", "impact", "priority"],
-                                    "additionalProperties": False
-                                }
-                            },
-                            "career_paths": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "title": {"type": "string"},
-                                        "description": {"type": "string"},
-                                        "action_items": {
-                                            "type": "array",
-                                            "items": {"type": "string"}
-                                        }
-                                    },
-                                    "required": ["title", "description", "action_items"],
-                                    "additionalProperties": False
-                                }
-                            }
-                        },
-                        "required": ["transformation_stories", "tool_descriptions", "quick_wins", "career_paths"],
-                        "additionalProperties": False
-                    }
-                }
-            },
-            temperature=0.7,
-            max_tokens=4000
-        )
+            "gaps": skills.get("gaps", [])
+        },
+        "companies_to_analyze": [{"name": c["name"], "industry": c["industry"]} for c in companies],
+        "tools_to_personalize": [{"name": t["name"], "category": t["category"]} for t in tools]
+    }
 
-        # Parse response
-        content = json.loads(response.choices[0].message.content)
+    prompt = (
+        MBA_CONTENT_INSTRUCTIONS
+        + "\n\nUSER CONTEXT:\n"
+        + json.dumps(user_context, separators=(",", ":"), ensure_ascii=False)
+    )
 
-        logger.info(f"OpenAI content generated successfully: {len(content.get('transformation_stories', []))} stories, "
-                   f"{len(content.get('tool_descriptions', []))} tools, {len(content.get('quick_wins', []))} wins, "
-                   f"{len(content.get('career_paths', []))} paths")
+    try:
+        logger.info(f"Calling OpenAI for MBA content generation (role={role}, goal={career_goal})")
 
-        return content
+        with get_llm_accounting().call(ENDPOINT_MBA_EVALUATE, MBA_OPENAI_MODEL) as llm_call:
+            # The client retries transport errors itself; this is one logical attempt
+            llm_call.attempts = 1
+            with stage("openai"):
+                response = client.chat.completions.create(
+                    model=MBA_OPENAI_MODEL,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are an expert MBA career advisor specializing in Business x AI. Generate personalized, actionable career guidance."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    response_format=MBA_CONTENT_RESPONSE_FORMAT,
+                    temperature=0.7,
+                    max_tokens=4000
+                )
+
+            llm_call.add_usage(response.usage)
+
+            # Parse response
+            with stage("validation"):
+                content = json.loads(response.choices[0].message.content)
+
+            logger.info(f"OpenAI content generated successfully: {len(content.get('transformation_stories', []))} stories, "
+                       f"{len(content.get('tool_descriptions', []))} tools, {len(content.get('quick_wins', []))} wins, "
+                       f"{len(content.get('career_paths', []))} paths")
+
+            return content
 
     except Exception as e:
         logger.error(f"OpenAI API call failed: {str(e)}")
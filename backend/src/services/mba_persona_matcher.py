@@ -2,22 +2,16 @@
 MBA Persona Matcher
 Maps quiz role + readiness to persona with maturity-aware content
 """
-import json
-import os
 from typing import Dict, Any
 from src.config.logging_config import get_logger
+from src.config.registry import config_registry
 
 logger = get_logger(__name__)
 
 
 def load_personas() -> Dict[str, Any]:
-    """Load persona definitions from JSON file"""
-    personas_file = os.path.join(
-        os.path.dirname(__file__),
-        '..', 'config', 'mba_personas.json'
-    )
-    with open(personas_file, 'r') as f:
-        return json.load(f)
+    """Persona definitions from mba_personas.json (frozen, loaded once by the config registry)"""
+    return config_registry.get('mba_personas')
 
 
 def match_persona(role: str, readiness: Dict[str, Any]) -> Dict[str, Any]:
@@ -70,8 +64,8 @@ def match_persona(role: str, readiness: Dict[str, Any]) -> Dict[str, Any]:
             'maturity_variant': variant_key,
             'badge_label': variant['badge_label'],
             'variant_description': variant['variant_description'],
-            'persona_tags': variant['persona_tags'],
-            'key_strengths': variant.get('key_strengths', []),
+            'persona_tags': list(variant['persona_tags']),
+            'key_strengths': list(variant.get('key_strengths', [])),
             'mba_fit': variant['mba_fit'],
             'ideal_profile': persona_def.get('ideal_profile', '')
         }
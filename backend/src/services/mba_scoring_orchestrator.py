@@ -2,7 +2,7 @@
 MBA Readiness Scoring Orchestrator
 Pure mapping-based evaluation - no OpenAI calls
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 from enum import Enum
 
 
@@ -33,10 +33,266 @@ SCORING_WEIGHTS = {
 }
 
 
+# ============================================================================
+# SCORING RULES
+# Declarative rule tables, compiled at import into per-role hash lookups
+# ============================================================================
+
+EXPERIENCE_SCORES = {
+    '0-2': 40,
+    '2-5': 60,
+    '5-8': 80,
+    '8-12': 95,
+    '12+': 100
+}
+DEFAULT_EXPERIENCE_SCORE = 50
+
+# Role maturity: base 50, plus points per question for strategic/systems thinking answers
+ROLE_MATURITY_BASE = 50
+ROLE_MATURITY_RULES = {
+    'product-manager': [
+        ('pm-data-conflict', {'revalidate-hypothesis': 15, 'customer-research': 10}),
+        ('pm-roadmap-bloat', {'ruthless-prioritization': 15, 'communicate-tradeoffs': 10}),
+        ('pm-ai-usage', {'predictive-insights': 10, 'automated-decisions': 10}),
+        ('pm-feature-failure', {'systemic-failure': 10, 'misaligned-incentives': 10}),
+    ],
+    'finance': [
+        ('finance-metrics-conflict', {'investigate-methodology': 15, 'segment-analysis': 15}),
+        ('finance-forecast-miss', {'model-assumptions': 15, 'leading-indicators': 15}),
+        ('finance-ai-usage', {'scenario-modeling': 10, 'anomaly-detection': 10}),
+        ('finance-decision-speed', {'directional-confidence': 10, 'build-ranges': 10}),
+    ],
+    'sales': [
+        ('sales-pipeline-reality', {'analyze-winloss': 15, 'tighten-qualification': 15}),
+        ('sales-ai-usage', {'deal-risk': 10, 'pricing-optimization': 10}),
+        ('sales-forecasting', {'predictive-models': 15, 'historical-patterns': 15}),
+        ('sales-ownership', {'region-business': 10, 'team-number': 10}),
+    ],
+    'marketing': [
+        ('marketing-conflicting-signals', {'ltv-cac-cohort': 15, 'revenue-attribution': 15}),
+        ('marketing-ai-application', {'automated-optimization': 10, 'audience-prediction': 10}),
+        ('marketing-leadership-metric', {'revenue-contribution': 15, 'ltv': 15}),
+    ],
+    'operations': [
+        ('operations-scale-stress', {'data-visibility': 15, 'process-design': 15}),
+        ('operations-ai-leverage', {'decision-optimization': 10, 'automation': 10}),
+        ('operations-strategic-role', {'competitive-advantage': 15, 'enable-scale': 15}),
+    ],
+    'founder': [
+        ('founder-mvp-failure', {'reframe-problem': 15, 'pivot-icp': 15}),
+        ('founder-scale-pain', {'data-blindness': 10, 'customer-mix': 10}),
+        ('founder-ai-advantage', {'insight': 15, 'differentiation': 15}),
+    ]
+}
+
+# AI fluency: base 30 (everyone has some AI exposure); roles with an AI question
+# get +50 for strategic usage, +30 for tactical usage, +10 otherwise
+AI_FLUENCY_BASE = 30
+AI_FLUENCY_QUESTIONS = {
+    'product-manager': 'pm-ai-usage',
+    'finance': 'finance-ai-usage',
+    'sales': 'sales-ai-usage',
+    'marketing': 'marketing-ai-application',
+    'operations': 'operations-ai-leverage',
+    'founder': 'founder-ai-advantage'
+}
+AI_FLUENCY_POINTS = {'advanced': 50, 'tactical': 30, 'other': 10}
+AI_ADVANCED_ANSWERS = frozenset([
+    'predictive-insights', 'automated-decisions',  # PM
+    'scenario-modeling', 'anomaly-detection',  # Finance
+    'deal-risk', 'pricing-optimization',  # Sales
+    'automated-optimization', 'audience-prediction',  # Marketing
+    'decision-optimization', 'automation',  # Operations
+    'insight', 'differentiation'  # Founder
+])
+AI_TACTICAL_ANSWERS = frozenset([
+    'user-research', 'ab-testing',  # PM
+    'forecasting', 'reporting',  # Finance
+    'call-summaries', 'email-drafts',  # Sales
+    'creative-testing', 'content-generation',  # Marketing
+    'forecasting', 'reporting',  # Operations
+    'speed', 'cost'  # Founder
+])
+
+# Ownership: base 50; roles with an ownership question get +40 for high ownership, +20 otherwise
+OWNERSHIP_BASE = 50
+OWNERSHIP_QUESTIONS = {
+    'product-manager': 'pm-ownership',
+    'finance': 'finance-leadership-weight',
+    'sales': 'sales-ownership',
+    'marketing': 'marketing-leadership-metric',
+    'operations': 'operations-ownership',
+    'founder': 'founder-resource-constraint'
+}
+OWNERSHIP_POINTS = {'high': 40, 'other': 20}
+HIGH_OWNERSHIP_ANSWERS = frozenset([
+    'product-line', 'business-unit',  # PM
+    'strategic-allocation', 'board-reporting',  # Finance
+    'region-business', 'team-number',  # Sales
+    'revenue-contribution', 'ltv',  # Marketing
+    'margin', 'sla-adherence',  # Operations
+    'learning', 'profitability'  # Founder
+])
+
+# Response-specific readiness tags, in display order
+READINESS_TAG_RULES = {
+    'product-manager': [
+        ('pm-retention-problem', ['resegment-cohorts'], "Data-Driven"),
+        ('pm-roadmap-tradeoff', ['incremental'], "Metrics-Focused"),
+        ('pm-ai-leverage', ['prioritization', 'impact-prediction'], "AI-Powered PM"),
+        ('pm-failure-reflection', ['wrong-assumptions'], "Self-Aware"),
+        ('pm-metrics-conflict', ['unit-economics'], "Business-Minded"),
+    ],
+    'finance': [
+        ('finance-metrics-conflict', ['scenarios'], "Strategic Communicator"),
+        ('finance-forecast-miss', ['scenario-modeling', 'predictive-models'], "Advanced Modeler"),
+        ('finance-decision-speed', ['confidence-intervals', 'ai-anomalies'], "Data Scientist"),
+        ('finance-leadership-weight', ['me'], "Accountable Leader"),
+    ],
+    'sales': [
+        ('sales-pipeline-reality', ['tighten-qualification', 'analyze-winloss'], "Process-Oriented"),
+        ('sales-ai-usage', ['deal-risk', 'pricing-optimization'], "AI-Powered Sales"),
+        ('sales-target-miss', ['icp-mismatch', 'sales-motion'], "Strategic Thinker"),
+        ('sales-ownership', ['region-business', 'team-number'], "Leader"),
+    ],
+    'marketing': [
+        ('marketing-conflicting-signals', ['ltv-cac-cohort', 'revenue-attribution'], "Unit Economics"),
+        ('marketing-ai-application', ['automated-optimization', 'audience-prediction'], "AI-Native Marketer"),
+        ('marketing-defend-metric', ['revenue-contribution', 'ltv'], "Revenue-Focused"),
+        ('marketing-scale-failure', ['funnel-leakage'], "Growth Hacker"),
+    ],
+    'operations': [
+        ('operations-scale-stress', ['process-design', 'data-visibility'], "Systems Thinker"),
+        ('operations-ai-leverage', ['automation', 'decision-optimization'], "AI-Leveraged Ops"),
+        ('operations-purpose', ['enable-scale', 'competitive-advantage'], "Strategic Partner"),
+    ],
+    'founder': [
+        ('founder-mvp-failure', ['reframe-problem', 'pivot-icp'], "Product Thinker"),
+        ('founder-scale-pain', ['pricing', 'customer-mix'], "Business Fundamentals"),
+        ('founder-ai-advantage', ['insight', 'differentiation'], "AI-First Founder"),
+    ]
+}
+
+# Shown only when fewer than 2 specific tags were earned
+ROLE_IDENTIFIER_TAGS = {
+    'product-manager': 'Product Manager',
+    'finance': 'Finance Professional',
+    'sales': 'Sales Professional',
+    'marketing': 'Marketer',
+    'operations': 'Operations Professional',
+    'founder': 'Founder'
+}
+MAX_READINESS_TAGS = 4
+
+# Overall score: the raw 0-100 weighted score mapped onto the 40-80 band
+# (nobody is "perfect", everyone has room to grow)
+OVERALL_SCORE_FLOOR = 40
+OVERALL_SCORE_CEILING = 80
+OVERALL_SCORE_SCALE = 0.40
+
+# AI maturity: (level, minimum ai_fluency, minimum raw score or None), first match wins
+AI_MATURITY_THRESHOLDS: Tuple[Tuple[AIMaturityLevel, int, Optional[float]], ...] = (
+    (AIMaturityLevel.AI_NATIVE, 80, 75),
+    (AIMaturityLevel.AI_STRATEGIC, 65, None),
+    (AIMaturityLevel.AI_CAPABLE, 45, None),
+    (AIMaturityLevel.AI_CURIOUS, 30, None),
+)
+AI_MATURITY_FLOOR = AIMaturityLevel.AI_UNAWARE
+
+# Percentile by overall score: (minimum overall score, percentile), highest first
+PERCENTILE_STEPS: Tuple[Tuple[int, int], ...] = (
+    (75, 85),  # Top tier (75-80%)
+    (70, 75),
+    (65, 65),
+    (60, 55),
+    (55, 50),
+    (50, 40),
+    (45, 30),
+)
+PERCENTILE_FLOOR = 20  # 40-44%
+
+
+class AnswerEffect(NamedTuple):
+    """Combined contribution of one answer to one question."""
+    role_maturity: int
+    ai_fluency: int
+    ownership: int
+    tag: Optional[str]
+
+
+class CompiledRoleRules(NamedTuple):
+    """Everything calculate_mba_readiness_score needs for one role."""
+    # Scores before any answer-specific points (includes the "other answer" points)
+    role_maturity_base: int
+    ai_fluency_base: int
+    ownership_base: int
+    # (question_key, answer → effect), ordered so tags come out in READINESS_TAG_RULES order
+    questions: Tuple[Tuple[str, Dict[str, AnswerEffect]], ...]
+    role_tag: Optional[str]
+
+
+def _compile_role_rules(role: Optional[str]) -> CompiledRoleRules:
+    effects: Dict[str, Dict[str, List[Any]]] = {}
+
+    def effect(question_key: str, answer: str) -> List[Any]:
+        return effects.setdefault(question_key, {}).setdefault(answer, [0, 0, 0, None])
+
+    # Tag rules first so question order follows tag display order
+    for question_key, answers, tag in READINESS_TAG_RULES.get(role, []):
+        for answer in answers:
+            current = effect(question_key, answer)
+            if current[3] is not None:
+                raise RuntimeError(f"Multiple readiness tags for {role}:{question_key}={answer}")
+            current[3] = tag
+
+    for question_key, answer_points in ROLE_MATURITY_RULES.get(role, []):
+        for answer, points in answer_points.items():
+            effect(question_key, answer)[0] += points
+
+    ai_fluency_base = AI_FLUENCY_BASE
+    ai_key = AI_FLUENCY_QUESTIONS.get(role)
+    if ai_key:
+        ai_fluency_base += AI_FLUENCY_POINTS['other']
+        for answer in AI_TACTICAL_ANSWERS - AI_ADVANCED_ANSWERS:
+            effect(ai_key, answer)[1] += AI_FLUENCY_POINTS['tactical'] - AI_FLUENCY_POINTS['other']
+        for answer in AI_ADVANCED_ANSWERS:
+            effect(ai_key, answer)[1] += AI_FLUENCY_POINTS['advanced'] - AI_FLUENCY_POINTS['other']
+
+    ownership_base = OWNERSHIP_BASE
+    ownership_key = OWNERSHIP_QUESTIONS.get(role)
+    if ownership_key:
+        ownership_base += OWNERSHIP_POINTS['other']
+        for answer in HIGH_OWNERSHIP_ANSWERS:
+            effect(ownership_key, answer)[2] += OWNERSHIP_POINTS['high'] - OWNERSHIP_POINTS['other']
+
+    return CompiledRoleRules(
+        role_maturity_base=ROLE_MATURITY_BASE,
+        ai_fluency_base=ai_fluency_base,
+        ownership_base=ownership_base,
+        questions=tuple(
+            (question_key, {answer: AnswerEffect(*values) for answer, values in answers.items()})
+            for question_key, answers in effects.items()
+        ),
+        role_tag=ROLE_IDENTIFIER_TAGS.get(role)
+    )
+
+
+COMPILED_ROLE_RULES: Dict[str, CompiledRoleRules] = {
+    role: _compile_role_rules(role)
+    for role in set(ROLE_MATURITY_RULES) | set(AI_FLUENCY_QUESTIONS) | set(OWNERSHIP_QUESTIONS)
+    | set(READINESS_TAG_RULES) | set(ROLE_IDENTIFIER_TAGS)
+}
+# Student/other and unknown roles: base scores only
+DEFAULT_ROLE_RULES = _compile_role_rules(None)
+
+
 def calculate_mba_readiness_score(responses: Dict[str, Any]) -> Dict[str, Any]:
     """
     Calculate MBA Readiness Score based on quiz responses
 
+    All category scores and response-specific tags come from a single pass
+    over the role's compiled rules.
+
     Returns:
         {
             'overall_score': int (0-100),
@@ -47,12 +303,30 @@ def calculate_mba_readiness_score(responses: Dict[str, Any]) -> Dict[str, Any]:
     """
     role = responses.get('role')
     experience = responses.get('experience')
+    rules = COMPILED_ROLE_RULES.get(role, DEFAULT_ROLE_RULES) if isinstance(role, str) else DEFAULT_ROLE_RULES
 
-    # Calculate component scores
-    experience_score = _calculate_experience_score(experience)
-    role_maturity_score = _calculate_role_maturity(role, responses)
-    ai_fluency_score = _calculate_ai_fluency(role, responses)
-    ownership_score = _calculate_ownership(role, responses)
+    role_maturity_score = rules.role_maturity_base
+    ai_fluency_score = rules.ai_fluency_base
+    ownership_score = rules.ownership_base
+    tags = []
+    for question_key, answer_effects in rules.questions:
+        answer = responses.get(question_key)
+        if not isinstance(answer, str):
+            continue
+        answer_effect = answer_effects.get(answer)
+        if answer_effect is None:
+            continue
+        role_maturity_score += answer_effect.role_maturity
+        ai_fluency_score += answer_effect.ai_fluency
+        ownership_score += answer_effect.ownership
+        if answer_effect.tag:
+            tags.append(answer_effect.tag)
+
+    experience_score = EXPERIENCE_SCORES.get(experience, DEFAULT_EXPERIENCE_SCORE) if isinstance(experience, str) \
+        else DEFAULT_EXPERIENCE_SCORE
+    role_maturity_score = min(role_maturity_score, 100)
+    ai_fluency_score = min(ai_fluency_score, 100)
+    ownership_score = min(ownership_score, 100)
 
     # Calculate raw weighted score (0-100)
     raw_score = (
@@ -62,10 +336,9 @@ def calculate_mba_readiness_score(responses: Dict[str, Any]) -> Dict[str, Any]:
         ownership_score * SCORING_WEIGHTS['ownership']
     )
 
-    # Cap score at 40-80% range (nobody is "perfect", everyone has room to grow)
-    # Map raw 0-100 score to 40-80 range
-    overall_score = int(40 + (raw_score * 0.40))
-    overall_score = max(40, min(80, overall_score))  # Ensure bounds
+    # Map raw 0-100 score to the 40-80 range
+    overall_score = int(OVERALL_SCORE_FLOOR + (raw_score * OVERALL_SCORE_SCALE))
+    overall_score = max(OVERALL_SCORE_FLOOR, min(OVERALL_SCORE_CEILING, overall_score))  # Ensure bounds
 
     # Determine AI maturity level (use raw score for better differentiation)
     maturity_level = _determine_ai_maturity(ai_fluency_score, raw_score)
@@ -73,6 +346,16 @@ def calculate_mba_readiness_score(responses: Dict[str, Any]) -> Dict[str, Any]:
     # Calculate percentile (simplified - in production, query database)
     percentile = _calculate_percentile(overall_score)
 
+    # Add AI maturity tag if high
+    if maturity_level == AIMaturityLevel.AI_NATIVE:
+        tags.append("AI Native")
+    elif maturity_level == AIMaturityLevel.AI_STRATEGIC:
+        tags.append("AI Strategic")
+
+    # Add role identifier only if we don't have enough specific tags
+    if len(tags) < 2 and rules.role_tag:
+        tags.append(rules.role_tag)
+
     return {
         'overall_score': overall_score,
         'category_scores': {
@@ -83,256 +366,16 @@ def calculate_mba_readiness_score(responses: Dict[str, Any]) -> Dict[str, Any]:
         },
         'maturity_level': maturity_level,
         'percentile': percentile,
-        'readiness_tags': _generate_readiness_tags(overall_score, maturity_level, role, responses)
+        'readiness_tags': tags[:MAX_READINESS_TAGS]
     }
 
 
-def _calculate_experience_score(experience: str) -> int:
-    """Map experience to score (0-100)"""
-    experience_map = {
-        '0-2': 40,
-        '2-5': 60,
-        '5-8': 80,
-        '8-12': 95,
-        '12+': 100
-    }
-    return experience_map.get(experience, 50)
-
-
-def _calculate_role_maturity(role: str, responses: Dict[str, Any]) -> int:
-    """
-    Calculate role-specific maturity based on answer patterns
-    Higher scores for strategic/systems thinking answers
-    """
-    if role == 'product-manager':
-        return _score_pm_maturity(responses)
-    elif role == 'finance':
-        return _score_finance_maturity(responses)
-    elif role == 'sales':
-        return _score_sales_maturity(responses)
-    elif role == 'marketing':
-        return _score_marketing_maturity(responses)
-    elif role == 'operations':
-        return _score_operations_maturity(responses)
-    elif role == 'founder':
-        return _score_founder_maturity(responses)
-    else:
-        return 50  # Default for student/other
-
-
-def _score_pm_maturity(responses: Dict[str, Any]) -> int:
-    """Score PM based on strategic depth"""
-    score = 50  # Base score
-
-    # Question: Data conflict priority
-    if responses.get('pm-data-conflict') == 'revalidate-hypothesis':
-        score += 15  # Strategic thinking
-    elif responses.get('pm-data-conflict') == 'customer-research':
-        score += 10
-
-    # Question: Roadmap bloat
-    if responses.get('pm-roadmap-bloat') == 'ruthless-prioritization':
-        score += 15
-    elif responses.get('pm-roadmap-bloat') == 'communicate-tradeoffs':
-        score += 10
-
-    # Question: AI usage
-    if responses.get('pm-ai-usage') in ['predictive-insights', 'automated-decisions']:
-        score += 10
-
-    # Question: Feature failure
-    if responses.get('pm-feature-failure') in ['systemic-failure', 'misaligned-incentives']:
-        score += 10  # Systems thinking
-
-    return min(score, 100)
-
-
-def _score_finance_maturity(responses: Dict[str, Any]) -> int:
-    """Score Finance based on strategic depth"""
-    score = 50
-
-    if responses.get('finance-metrics-conflict') in ['investigate-methodology', 'segment-analysis']:
-        score += 15
-
-    if responses.get('finance-forecast-miss') in ['model-assumptions', 'leading-indicators']:
-        score += 15
-
-    if responses.get('finance-ai-usage') in ['scenario-modeling', 'anomaly-detection']:
-        score += 10
-
-    if responses.get('finance-decision-speed') in ['directional-confidence', 'build-ranges']:
-        score += 10
-
-    return min(score, 100)
-
-
-def _score_sales_maturity(responses: Dict[str, Any]) -> int:
-    """Score Sales based on strategic depth"""
-    score = 50
-
-    if responses.get('sales-pipeline-reality') in ['analyze-winloss', 'tighten-qualification']:
-        score += 15
-
-    if responses.get('sales-ai-usage') in ['deal-risk', 'pricing-optimization']:
-        score += 10
-
-    if responses.get('sales-forecasting') in ['predictive-models', 'historical-patterns']:
-        score += 15
-
-    if responses.get('sales-ownership') in ['region-business', 'team-number']:
-        score += 10
-
-    return min(score, 100)
-
-
-def _score_marketing_maturity(responses: Dict[str, Any]) -> int:
-    """Score Marketing based on strategic depth"""
-    score = 50
-
-    if responses.get('marketing-conflicting-signals') in ['ltv-cac-cohort', 'revenue-attribution']:
-        score += 15
-
-    if responses.get('marketing-ai-application') in ['automated-optimization', 'audience-prediction']:
-        score += 10
-
-    if responses.get('marketing-leadership-metric') in ['revenue-contribution', 'ltv']:
-        score += 15
-
-    return min(score, 100)
-
-
-def _score_operations_maturity(responses: Dict[str, Any]) -> int:
-    """Score Operations based on strategic depth"""
-    score = 50
-
-    if responses.get('operations-scale-stress') in ['data-visibility', 'process-design']:
-        score += 15
-
-    if responses.get('operations-ai-leverage') in ['decision-optimization', 'automation']:
-        score += 10
-
-    if responses.get('operations-strategic-role') in ['competitive-advantage', 'enable-scale']:
-        score += 15
-
-    return min(score, 100)
-
-
-def _score_founder_maturity(responses: Dict[str, Any]) -> int:
-    """Score Founder based on strategic depth"""
-    score = 50
-
-    if responses.get('founder-mvp-failure') in ['reframe-problem', 'pivot-icp']:
-        score += 15
-
-    if responses.get('founder-scale-pain') in ['data-blindness', 'customer-mix']:
-        score += 10
-
-    if responses.get('founder-ai-advantage') in ['insight', 'differentiation']:
-        score += 15
-
-    return min(score, 100)
-
-
-def _calculate_ai_fluency(role: str, responses: Dict[str, Any]) -> int:
-    """Calculate AI fluency score based on AI-related answers"""
-    score = 30  # Base score (everyone has some AI exposure)
-
-    # Map AI usage patterns to scores
-    ai_question_keys = {
-        'product-manager': 'pm-ai-usage',
-        'finance': 'finance-ai-usage',
-        'sales': 'sales-ai-usage',
-        'marketing': 'marketing-ai-application',
-        'operations': 'operations-ai-leverage',
-        'founder': 'founder-ai-advantage'
-    }
-
-    ai_key = ai_question_keys.get(role)
-    if not ai_key:
-        return score
-
-    ai_answer = responses.get(ai_key)
-
-    # Strategic/Advanced AI usage
-    advanced_answers = [
-        'predictive-insights', 'automated-decisions',  # PM
-        'scenario-modeling', 'anomaly-detection',  # Finance
-        'deal-risk', 'pricing-optimization',  # Sales
-        'automated-optimization', 'audience-prediction',  # Marketing
-        'decision-optimization', 'automation',  # Operations
-        'insight', 'differentiation'  # Founder
-    ]
-
-    # Tactical AI usage
-    tactical_answers = [
-        'user-research', 'ab-testing',  # PM
-        'forecasting', 'reporting',  # Finance
-        'call-summaries', 'email-drafts',  # Sales
-        'creative-testing', 'content-generation',  # Marketing
-        'forecasting', 'reporting',  # Operations
-        'speed', 'cost'  # Founder
-    ]
-
-    if ai_answer in advanced_answers:
-        score += 50  # AI-Strategic or AI-Native
-    elif ai_answer in tactical_answers:
-        score += 30  # AI-Capable
-    else:
-        score += 10  # AI-Curious
-
-    return min(score, 100)
-
-
-def _calculate_ownership(role: str, responses: Dict[str, Any]) -> int:
-    """Calculate ownership/leadership score"""
-    score = 50  # Base score
-
-    # Role-specific ownership indicators
-    ownership_keys = {
-        'product-manager': 'pm-ownership',
-        'finance': 'finance-leadership-weight',
-        'sales': 'sales-ownership',
-        'marketing': 'marketing-leadership-metric',
-        'operations': 'operations-ownership',
-        'founder': 'founder-resource-constraint'
-    }
-
-    ownership_key = ownership_keys.get(role)
-    if not ownership_key:
-        return score
-
-    ownership_answer = responses.get(ownership_key)
-
-    # High ownership answers
-    high_ownership = [
-        'product-line', 'business-unit',  # PM
-        'strategic-allocation', 'board-reporting',  # Finance
-        'region-business', 'team-number',  # Sales
-        'revenue-contribution', 'ltv',  # Marketing
-        'margin', 'sla-adherence',  # Operations
-        'learning', 'profitability'  # Founder
-    ]
-
-    if ownership_answer in high_ownership:
-        score += 40
-    else:
-        score += 20
-
-    return min(score, 100)
-
-
 def _determine_ai_maturity(ai_fluency: int, overall_score: int) -> str:
     """Determine AI maturity level"""
-    if ai_fluency >= 80 and overall_score >= 75:
-        return AIMaturityLevel.AI_NATIVE
-    elif ai_fluency >= 65:
-        return AIMaturityLevel.AI_STRATEGIC
-    elif ai_fluency >= 45:
-        return AIMaturityLevel.AI_CAPABLE
-    elif ai_fluency >= 30:
-        return AIMaturityLevel.AI_CURIOUS
-    else:
-        return AIMaturityLevel.AI_UNAWARE
+    for level, min_ai_fluency, min_score in AI_MATURITY_THRESHOLDS:
+        if ai_fluency >= min_ai_fluency and (min_score is None or overall_score >= min_score):
+            return level
+    return AI_MATURITY_FLOOR
 
 
 def _calculate_percentile(overall_score: int) -> int:
@@ -341,107 +384,7 @@ def _calculate_percentile(overall_score: int) -> int:
     In production, this would query actual user data
     """
     # Adjusted for 40-80% score range
-    if overall_score >= 75:  # Top tier (75-80%)
-        return 85
-    elif overall_score >= 70:
-        return 75
-    elif overall_score >= 65:
-        return 65
-    elif overall_score >= 60:
-        return 55
-    elif overall_score >= 55:
-        return 50
-    elif overall_score >= 50:
-        return 40
-    elif overall_score >= 45:
-        return 30
-    else:  # 40-44%
-        return 20
-
-
-def _generate_readiness_tags(score: int, maturity: str, role: str, responses: Dict[str, Any]) -> List[str]:
-    """
-    Generate descriptive tags based on actual quiz responses
-    Tags should reflect user's specific strengths, not generic role labels
-    """
-    tags = []
-
-    # Response-specific tags (max 2-3 based on answer patterns)
-    if role == 'product-manager':
-        if responses.get('pm-retention-problem') == 'resegment-cohorts':
-            tags.append("Data-Driven")
-        if responses.get('pm-roadmap-tradeoff') == 'incremental':
-            tags.append("Metrics-Focused")
-        if responses.get('pm-ai-leverage') in ['prioritization', 'impact-prediction']:
-            tags.append("AI-Powered PM")
-        if responses.get('pm-failure-reflection') == 'wrong-assumptions':
-            tags.append("Self-Aware")
-        if responses.get('pm-metrics-conflict') == 'unit-economics':
-            tags.append("Business-Minded")
-
-    elif role == 'finance':
-        if responses.get('finance-metrics-conflict') == 'scenarios':
-            tags.append("Strategic Communicator")
-        if responses.get('finance-forecast-miss') in ['scenario-modeling', 'predictive-models']:
-            tags.append("Advanced Modeler")
-        if responses.get('finance-decision-speed') in ['confidence-intervals', 'ai-anomalies']:
-            tags.append("Data Scientist")
-        if responses.get('finance-leadership-weight') == 'me':
-            tags.append("Accountable Leader")
-
-    elif role == 'sales':
-        if responses.get('sales-pipeline-reality') in ['tighten-qualification', 'analyze-winloss']:
-            tags.append("Process-Oriented")
-        if responses.get('sales-ai-usage') in ['deal-risk', 'pricing-optimization']:
-            tags.append("AI-Powered Sales")
-        if responses.get('sales-target-miss') in ['icp-mismatch', 'sales-motion']:
-            tags.append("Strategic Thinker")
-        if responses.get('sales-ownership') in ['region-business', 'team-number']:
-            tags.append("Leader")
-
-    elif role == 'marketing':
-        if responses.get('marketing-conflicting-signals') in ['ltv-cac-cohort', 'revenue-attribution']:
-            tags.append("Unit Economics")
-        if responses.get('marketing-ai-application') in ['automated-optimization', 'audience-prediction']:
-            tags.append("AI-Native Marketer")
-        if responses.get('marketing-defend-metric') in ['revenue-contribution', 'ltv']:
-            tags.append("Revenue-Focused")
-        if responses.get('marketing-scale-failure') == 'funnel-leakage':
-            tags.append("Growth Hacker")
-
-    elif role == 'operations':
-        if responses.get('operations-scale-stress') in ['process-design', 'data-visibility']:
-            tags.append("Systems Thinker")
-        if responses.get('operations-ai-leverage') in ['automation', 'decision-optimization']:
-            tags.append("AI-Leveraged Ops")
-        if responses.get('operations-purpose') in ['enable-scale', 'competitive-advantage']:
-            tags.append("Strategic Partner")
-
-    elif role == 'founder':
-        if responses.get('founder-mvp-failure') in ['reframe-problem', 'pivot-icp']:
-            tags.append("Product Thinker")
-        if responses.get('founder-scale-pain') in ['pricing', 'customer-mix']:
-            tags.append("Business Fundamentals")
-        if responses.get('founder-ai-advantage') in ['insight', 'differentiation']:
-            tags.append("AI-First Founder")
-
-    # Add AI maturity tag if high
-    if maturity == AIMaturityLevel.AI_NATIVE:
-        tags.append("AI Native")
-    elif maturity == AIMaturityLevel.AI_STRATEGIC:
-        tags.append("AI Strategic")
-
-    # Add role identifier only if we don't have enough specific tags
-    if len(tags) < 2:
-        role_identifiers = {
-            'product-manager': 'Product Manager',
-            'finance': 'Finance Professional',
-            'sales': 'Sales Professional',
-            'marketing': 'Marketer',
-            'operations': 'Operations Professional',
-            'founder': 'Founder'
-        }
-        if role in role_identifiers:
-            tags.append(role_identifiers[role])
-
-    return tags[:4]  # Max 4 tags
+    for min_score, percentile in PERCENTILE_STEPS:
+        if overall_score >= min_score:
+            return percentile
+    return PERCENTILE_FLOOR
@@ -7,7 +7,7 @@ NEW APPROACH: Direct answer → score mapping
 - Skill levels calculated as average of all relevant question scores
 - No more "default to 3" nonsense
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple, Tuple
 from enum import Enum
 from src.services.mba_skill_scoring_maps import QUESTION_SKILL_MAP, ANSWER_SCORES
 
@@ -176,6 +176,68 @@ SKILL_METADATA = {
 }
 
 
+# ============================================================================
+# COMPILED SCORING TABLES
+# Built once at import from QUESTION_SKILL_MAP / ANSWER_SCORES so inference
+# is a single pass over each role's relevant questions
+# ============================================================================
+
+class RoleScoringTable(NamedTuple):
+    """Per-role scoring structures."""
+    # (skill_name, title, description) in display order
+    skills: Tuple[Tuple[str, str, str], ...]
+    # (question_key, answer → score, indices into skills the question feeds)
+    questions: Tuple[Tuple[str, Dict[str, int], Tuple[int, ...]], ...]
+
+
+def _compile_role_table(skill_names: List[str]) -> RoleScoringTable:
+    skill_index = {skill: index for index, skill in enumerate(skill_names)}
+    skills = tuple(
+        (
+            skill,
+            SKILL_METADATA.get(skill, {}).get('title', skill.replace('_', ' ').title()),
+            SKILL_METADATA.get(skill, {}).get('description', '')
+        )
+        for skill in skill_names
+    )
+    questions = []
+    for question_key, tested_skills in QUESTION_SKILL_MAP.items():
+        indices = tuple(skill_index[skill] for skill in tested_skills if skill in skill_index)
+        # Questions without an answer table never contribute a score
+        if indices and question_key in ANSWER_SCORES:
+            questions.append((question_key, dict(ANSWER_SCORES[question_key]), indices))
+    return RoleScoringTable(skills=skills, questions=tuple(questions))
+
+
+def _verify_role_table(role: str, table: RoleScoringTable) -> None:
+    """Check a compiled table against the source maps it was built from."""
+    skill_names = ROLE_SKILL_MAPS[role]
+    if [skill for skill, _, _ in table.skills] != skill_names:
+        raise RuntimeError(f"Compiled skill table for '{role}' does not match ROLE_SKILL_MAPS")
+
+    compiled = {skill: set() for skill in skill_names}
+    for question_key, answer_scores, skill_indices in table.questions:
+        if answer_scores != ANSWER_SCORES.get(question_key):
+            raise RuntimeError(f"Compiled answer scores for '{question_key}' do not match ANSWER_SCORES")
+        for index in skill_indices:
+            compiled[skill_names[index]].add(question_key)
+
+    for skill in skill_names:
+        expected = {
+            question_key for question_key, tested_skills in QUESTION_SKILL_MAP.items()
+            if skill in tested_skills and question_key in ANSWER_SCORES
+        }
+        if compiled[skill] != expected:
+            raise RuntimeError(f"Compiled questions for '{role}.{skill}' do not match QUESTION_SKILL_MAP")
+
+
+ROLE_SCORING_TABLES: Dict[str, RoleScoringTable] = {
+    role: _compile_role_table(skill_names) for role, skill_names in ROLE_SKILL_MAPS.items()
+}
+for _role, _table in ROLE_SCORING_TABLES.items():
+    _verify_role_table(_role, _table)
+
+
 def infer_skills_from_responses(role: str, responses: Dict[str, Any]) -> Dict[str, Any]:
     """
     Infer role-specific skill levels based on quiz responses
@@ -201,35 +263,27 @@ def infer_skills_from_responses(role: str, responses: Dict[str, Any]) -> Dict[st
             'gaps': ['skill3', 'skill4']
         }
     """
-    # Get skill list for this role (fallback to 'pm' if role not found)
-    skill_names = ROLE_SKILL_MAPS.get(role, ROLE_SKILL_MAPS['pm'])
-
-    # Build reverse index: skill → [questions that test it]
-    skill_to_questions = {skill: [] for skill in skill_names}
-    for question_key, tested_skills in QUESTION_SKILL_MAP.items():
-        for skill in tested_skills:
-            if skill in skill_to_questions:
-                skill_to_questions[skill].append(question_key)
+    table = ROLE_SCORING_TABLES.get(role) or ROLE_SCORING_TABLES['pm']
+    skill_count = len(table.skills)
+    totals = [0] * skill_count
+    counts = [0] * skill_count
+
+    # Single pass over the role's relevant questions
+    for question_key, answer_scores, skill_indices in table.questions:
+        user_answer = responses.get(question_key)
+        if user_answer:
+            score = answer_scores.get(user_answer)
+            if score:
+                for index in skill_indices:
+                    totals[index] += score
+                    counts[index] += 1
 
     # Calculate skill levels
     skills = {}
-    for skill_name in skill_names:
-        # Find all questions that test this skill
-        relevant_questions = skill_to_questions[skill_name]
-
-        # Collect scores from answered questions
-        scores = []
-        for question_key in relevant_questions:
-            user_answer = responses.get(question_key)
-            if user_answer and question_key in ANSWER_SCORES:
-                score = ANSWER_SCORES[question_key].get(user_answer)
-                if score:
-                    scores.append(score)
-
-        # Calculate skill level
-        if scores:
+    for index, (skill_name, title, description) in enumerate(table.skills):
+        if counts[index]:
             # Average of all relevant question scores
-            avg_score = sum(scores) / len(scores)
+            avg_score = totals[index] / counts[index]
             internal_score = round(avg_score)  # Round to nearest integer (1-5)
             internal_score = max(1, min(5, internal_score))  # Clamp to 1-5
 
@@ -239,13 +293,11 @@ def infer_skills_from_responses(role: str, responses: Dict[str, Any]) -> Dict[st
             # Default to 2 (Proficient) ONLY if no relevant questions answered
             level = 2
 
-        # Attach metadata for frontend
-        metadata = SKILL_METADATA.get(skill_name, {})
         skills[skill_name] = {
             'level': level,
             'label': SKILL_LEVEL_LABELS[level],
-            'title': metadata.get('title', skill_name.replace('_', ' ').title()),
-            'description': metadata.get('description', '')
+            'title': title,
+            'description': description
         }
 
     # Identify strengths (level >= 3) and gaps (level <= 1)
@@ -0,0 +1,439 @@
+"""
+Prometheus metrics for GET /metrics (enabled by ENABLE_METRICS).
+
+Each uvicorn worker keeps its own metrics:
+- route latency histograms and evaluations by role, recorded here;
+- response cache counters (cache_stats), DB pool usage (pool_stats), and
+  OpenAI latency, failures and in-flight calls (llm_accounting). These are
+  read from the modules' existing per-worker counters at snapshot time, so
+  the request path only pays for one histogram update under a lock.
+
+A background thread writes the worker's snapshot to
+METRICS_DIR/<generation>/<pid>.json every METRICS_FLUSH_INTERVAL_SECONDS
+(atomic rename). The generation names one server start: the PID and start
+time of the uvicorn/gunicorn master that started the workers, or of the
+serving process itself when it runs without one. A scrape can land on any
+worker. That worker writes its own snapshot and then merges its generation's
+files: counters and histograms are summed over all workers, including exited
+ones, so totals never go backwards, while gauges only count live workers
+(PID plus start time, so a reused PID is not mistaken for a live worker).
+
+Each worker deletes the generations of server starts that are no longer
+running when it starts writing, so earlier runs are neither summed in nor
+left on disk. Start times come from /proc; elsewhere only PIDs are compared.
+Other workers' values can be up to one flush interval old.
+"""
+import atexit
+import bisect
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+from src.repositories.cache_stats import LatencyHistogram, cache_counters
+from src.repositories.pool_stats import pool_usage_export
+from src.services.llm_accounting import get_llm_accounting
+
+logger = get_logger(__name__)
+
+PREFIX = "fpe_"
+
+REQUEST_BUCKETS_SECONDS: List[float] = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+# Label sets kept per metric before new ones are folded into "other" (guards free-form quiz values)
+MAX_LABEL_SETS = 200
+
+LabelValues = Tuple[str, ...]
+
+GENERATION_PATTERN = re.compile(r"^(\d+)-(\d+)$")
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Family:
+    """One metric family: label names plus a value (or histogram) per label set."""
+
+    def __init__(self, name: str, kind: str, help_text: str, labels: Sequence[str], buckets: Sequence[float] = ()):
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.values: Dict[LabelValues, Any] = {}
+
+    def _key(self, label_values: LabelValues) -> LabelValues:
+        if label_values in self.values or len(self.values) < MAX_LABEL_SETS:
+            return label_values
+        return tuple("other" for _ in label_values)
+
+    def inc(self, label_values: LabelValues, amount: float = 1) -> None:
+        key = self._key(label_values)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def observe(self, label_values: LabelValues, value: float) -> None:
+        key = self._key(label_values)
+        histogram = self.values.get(key)
+        if histogram is None:
+            histogram = self.values[key] = _Histogram(self.buckets)
+        histogram.counts[bisect.bisect_left(self.buckets, value)] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+
+def _family_dict(name: str, kind: str, help_text: str, labels: Sequence[str], buckets: Sequence[float] = ()) -> Dict[str, Any]:
+    return {"name": name, "type": kind, "help": help_text, "labels": list(labels), "buckets": list(buckets), "samples": []}
+
+
+def _sample(family: Dict[str, Any], label_values: Iterable[Any], value: Any) -> None:
+    labels = [str(label) for label in label_values]
+    if isinstance(value, _Histogram):
+        family["samples"].append({"labels": labels, "counts": list(value.counts), "sum": value.sum, "count": value.count})
+    else:
+        family["samples"].append({"labels": labels, "value": value})
+
+
+def _latency_sample(family: Dict[str, Any], label_values: Iterable[Any], histogram: LatencyHistogram) -> None:
+    """Add a millisecond LatencyHistogram to a seconds histogram family with the same bucket bounds."""
+    family["samples"].append({
+        "labels": [str(label) for label in label_values],
+        "counts": list(histogram.counts),
+        "sum": histogram.total_ms / 1000,
+        "count": histogram.count,
+    })
+
+
+def _seconds(buckets_ms: Sequence[float]) -> List[float]:
+    return [bucket / 1000 for bucket in buckets_ms]
+
+
+class Metrics:
+    """This worker's metrics plus the per-pid snapshot files shared by all workers."""
+
+    def __init__(self, directory: Optional[str] = None, flush_interval: Optional[float] = None):
+        self._root = directory or settings.metrics_dir or os.path.join(tempfile.gettempdir(), "fpe-metrics")
+        self._flush_interval = (
+            settings.metrics_flush_interval_seconds if flush_interval is None else flush_interval
+        )
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._started = _process_start(self._pid)
+        self._generation = _server_generation()
+        self._directory = os.path.join(self._root, self._generation)
+        self._requests = _Family(
+            "http_request_duration_seconds", "histogram", "Request latency by route",
+            ("method", "route", "status"), REQUEST_BUCKETS_SECONDS,
+        )
+        self._evaluations = _Family(
+            "evaluations_total", "counter", "Completed evaluations by endpoint and role", ("endpoint", "role"),
+        )
+
+    def observe_request(self, method: str, route: str, status_code: int, seconds: float) -> None:
+        with self._lock:
+            self._ensure_started()
+            self._requests.observe((method, route, str(status_code)), seconds)
+
+    def count_evaluation(self, endpoint: str, role: Optional[str]) -> None:
+        with self._lock:
+            self._ensure_started()
+            self._evaluations.inc((endpoint, role or "unknown"))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Every family this worker reports, in the snapshot file format."""
+        families: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for family in (self._requests, self._evaluations):
+                exported = families[family.name] = _family_dict(
+                    family.name, family.kind, family.help, family.labels, family.buckets
+                )
+                for label_values, value in family.values.items():
+                    _sample(exported, label_values, value)
+
+        cache = cache_counters.export()
+        lookups = families["response_cache_lookups_total"] = _family_dict(
+            "response_cache_lookups_total", "counter", "Response cache reads by result", ("result",)
+        )
+        for result, value in (("hit", cache["hits"]), ("miss", cache["misses"]), ("error", cache["read_errors"])):
+            _sample(lookups, (result,), value)
+        writes = families["response_cache_writes_total"] = _family_dict(
+            "response_cache_writes_total", "counter", "Response cache writes by result", ("result",)
+        )
+        for result, value in (("ok", cache["writes"]), ("error", cache["write_errors"])):
+            _sample(writes, (result,), value)
+        cache_bytes = families["response_cache_bytes_total"] = _family_dict(
+            "response_cache_bytes_total", "counter", "Response cache payload bytes", ("direction",)
+        )
+        for direction, value in (("read", cache["bytes_read"]), ("written", cache["bytes_written"])):
+            _sample(cache_bytes, (direction,), value)
+        for operation in ("read", "write"):
+            histogram = cache[f"{operation}_latency"]
+            name = f"response_cache_{operation}_duration_seconds"
+            families[name] = _family_dict(
+                name, "histogram", f"Response cache {operation} latency", (), _seconds(histogram.buckets_ms)
+            )
+            _latency_sample(families[name], (), histogram)
+
+        llm_labels = ("endpoint", "model")
+        llm_families = {
+            "llm_calls_total": ("counter", "LLM calls (all attempts of one evaluation count once)"),
+            "llm_call_failures_total": ("counter", "LLM calls that failed after their last attempt"),
+            "llm_attempts_total": ("counter", "LLM request attempts, including retries and schema corrections"),
+            "llm_tokens_total": ("counter", "LLM tokens billed by kind"),
+            "llm_cost_usd_total": ("counter", "LLM cost in USD from llm_pricing.json"),
+            "llm_calls_in_flight": ("gauge", "LLM calls waiting on the provider"),
+        }
+        for name, (kind, help_text) in llm_families.items():
+            labels = llm_labels + (("kind",) if name == "llm_tokens_total" else ())
+            families[name] = _family_dict(name, kind, help_text, labels)
+        llm_rows = get_llm_accounting().export()
+        llm_buckets = llm_rows[0]["latency"].buckets_ms if llm_rows else ()
+        families["llm_call_duration_seconds"] = _family_dict(
+            "llm_call_duration_seconds", "histogram", "LLM call latency including retries", llm_labels,
+            _seconds(llm_buckets),
+        )
+        for row in llm_rows:
+            key = (row["endpoint"], row["model"])
+            _sample(families["llm_calls_total"], key, row["calls"])
+            _sample(families["llm_call_failures_total"], key, row["failures"])
+            _sample(families["llm_attempts_total"], key, row["attempts"])
+            _sample(families["llm_cost_usd_total"], key, row["cost_usd"])
+            _sample(families["llm_calls_in_flight"], key, row["in_flight"])
+            for kind in ("prompt", "cached_prompt", "completion"):
+                _sample(families["llm_tokens_total"], key + (kind,), row[f"{kind}_tokens"])
+            _latency_sample(families["llm_call_duration_seconds"], key, row["latency"])
+
+        pool_families = {
+            "db_pool_connections_in_use": ("gauge", "Pooled connections checked out"),
+            "db_pool_max_connections": ("gauge", "Pool size limit"),
+            "db_pool_acquisitions_total": ("counter", "Connections handed out by the pool"),
+            "db_pool_exhausted_total": ("counter", "Acquisitions refused because the pool was full"),
+        }
+        for name, (kind, help_text) in pool_families.items():
+            families[name] = _family_dict(name, kind, help_text, ("pool",))
+        pools = pool_usage_export()
+        pool_buckets = pools[0]["acquire_latency"].buckets_ms if pools else ()
+        families["db_pool_acquire_duration_seconds"] = _family_dict(
+            "db_pool_acquire_duration_seconds", "histogram", "Time to get a connection from the pool", ("pool",),
+            _seconds(pool_buckets),
+        )
+        for pool in pools:
+            key = (pool["name"],)
+            _sample(families["db_pool_connections_in_use"], key, pool["in_use"])
+            _sample(families["db_pool_max_connections"], key, pool["max_size"])
+            _sample(families["db_pool_acquisitions_total"], key, pool["acquisitions"])
+            _sample(families["db_pool_exhausted_total"], key, pool["exhausted"])
+            _latency_sample(families["db_pool_acquire_duration_seconds"], key, pool["acquire_latency"])
+
+        return {"pid": os.getpid(), "started": self._started, "written_at": time.time(), "families": families}
+
+    def write_snapshot(self) -> None:
+        """Atomically replace this worker's snapshot file."""
+        os.makedirs(self._directory, exist_ok=True)
+        path = os.path.join(self._directory, f"{os.getpid()}.json")
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(self.snapshot(), handle, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    def _read_snapshots(self) -> List[Dict[str, Any]]:
+        snapshots = []
+        for filename in sorted(os.listdir(self._directory)):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self._directory, filename), encoding="utf-8") as handle:
+                    snapshots.append(json.load(handle))
+            except (OSError, ValueError) as exc:
+                logger.warning(f"Skipping unreadable metrics snapshot {filename}: {exc}")
+        return snapshots
+
+    def render(self) -> str:
+        """All workers' metrics in the Prometheus text exposition format."""
+        try:
+            self.write_snapshot()
+            snapshots = self._read_snapshots()
+        except OSError as exc:
+            logger.error(f"Metrics directory {self._directory} unavailable, reporting this worker only: {exc}")
+            snapshots = [self.snapshot()]
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        live_workers = 0
+        for snapshot in snapshots:
+            alive = _pid_alive(snapshot["pid"], snapshot.get("started"))
+            live_workers += alive
+            for name, family in snapshot["families"].items():
+                target = merged.get(name)
+                if target is None:
+                    target = merged[name] = {**family, "samples": {}}
+                elif not target["buckets"] and family["buckets"]:
+                    target["buckets"] = family["buckets"]
+                if family["type"] == "gauge" and not alive:
+                    continue
+                for sample in family["samples"]:
+                    key = tuple(sample["labels"])
+                    current = target["samples"].get(key)
+                    if "counts" in sample:
+                        if current is None:
+                            target["samples"][key] = {
+                                "counts": list(sample["counts"]), "sum": sample["sum"], "count": sample["count"]
+                            }
+                        elif len(current["counts"]) == len(sample["counts"]):
+                            current["counts"] = [a + b for a, b in zip(current["counts"], sample["counts"])]
+                            current["sum"] += sample["sum"]
+                            current["count"] += sample["count"]
+                    else:
+                        target["samples"][key] = (current or 0) + sample["value"]
+
+        merged["workers"] = {
+            "type": "gauge", "help": "Live workers reporting metrics", "labels": [], "buckets": [],
+            "samples": {(): live_workers},
+        }
+        lines: List[str] = []
+        for name, family in sorted(merged.items()):
+            full_name = PREFIX + name
+            lines.append(f"# HELP {full_name} {family['help']}")
+            lines.append(f"# TYPE {full_name} {family['type']}")
+            for label_values, value in sorted(family["samples"].items()):
+                labels = list(zip(family["labels"], label_values))
+                if family["type"] != "histogram":
+                    lines.append(f"{full_name}{_labels(labels)} {_number(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(family["buckets"] + ["+Inf"], value["counts"]):
+                    cumulative += count
+                    le = bound if bound == "+Inf" else _number(bound)
+                    lines.append(f"{full_name}_bucket{_labels(labels + [('le', le)])} {cumulative}")
+                lines.append(f"{full_name}_sum{_labels(labels)} {_number(value['sum'])}")
+                lines.append(f"{full_name}_count{_labels(labels)} {value['count']}")
+        return "\n".join(lines) + "\n"
+
+    def _ensure_started(self) -> None:
+        """Start the snapshot writer (call with the lock held); a forked worker starts over with empty values."""
+        if self._pid != os.getpid():
+            self._reset()
+            self._thread = None
+        if self._thread is None or not self._thread.is_alive():
+            if self._thread is None:
+                atexit.register(self.close)
+                self._prune_generations()
+            self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            self._write_quietly()
+
+    def _write_quietly(self) -> None:
+        try:
+            self.write_snapshot()
+        except Exception as exc:
+            logger.warning(f"Failed to write metrics snapshot to {self._directory}: {exc}")
+
+    def _prune_generations(self) -> None:
+        """Delete snapshot directories of server starts that are no longer running."""
+        try:
+            entries = os.listdir(self._root)
+        except OSError:
+            return
+        for entry in entries:
+            match = GENERATION_PATTERN.match(entry)
+            if entry == self._generation or not match:
+                continue
+            owner, started = match.groups()
+            if _process_start(int(owner)) == started or (started == "0" and _pid_alive(int(owner))):
+                continue
+            logger.info(f"Removing metrics snapshots of finished server run {entry}")
+            shutil.rmtree(os.path.join(self._root, entry), ignore_errors=True)
+
+    def close(self) -> None:
+        """Stop the writer and leave a final snapshot so this worker's counters outlive it."""
+        self._stop.set()
+        self._write_quietly()
+
+
+def _process_start(pid: int) -> Optional[str]:
+    """Start time of pid in clock ticks since boot (None if it is not running or /proc is unavailable)."""
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as handle:
+            stat = handle.read()
+    except OSError:
+        return None
+    # Fields after "pid (comm)"; starttime is field 22 of the whole line
+    return stat.rsplit(")", 1)[1].split()[19]
+
+
+def _supervisor_pid() -> Optional[int]:
+    """PID of the master that started this worker, or None when this process serves on its own."""
+    # uvicorn --workers/--reload start workers with multiprocessing (spawn)
+    parent = multiprocessing.parent_process()
+    if parent is not None:
+        return parent.pid
+    # gunicorn forks its workers from the arbiter
+    if "gunicorn.arbiter" in sys.modules:
+        return os.getppid()
+    return None
+
+
+def _server_generation() -> str:
+    """'<pid>-<start>' of the process that owns this server run."""
+    owner = _supervisor_pid() or os.getpid()
+    return f"{owner}-{_process_start(owner) or 0}"
+
+
+def _pid_alive(pid: int, started: Optional[str] = None) -> bool:
+    if pid == os.getpid():
+        return True
+    if started is not None:
+        return _process_start(pid) == started
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels) + "}"
+
+
+_metrics: Optional[Metrics] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> Metrics:
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = Metrics()
+        return _metrics
@@ -0,0 +1,467 @@
+"""
+OpenAI-compatible stand-in server for offline load and latency testing.
+
+Implements POST /v1/chat/completions (plain and streaming) and GET /v1/models.
+Structured-output requests get back an instance of the json_schema they sent,
+so both evaluation paths parse and validate the replies:
+- mba_content (MBAOpenAIContent) is filled from the mba_openai_mock templates
+  for the role in the prompt's USER CONTEXT
+- any other schema (FullProfileEvaluationResponseRaw for /evaluate) is filled
+  generically, respecting enums, bounds and minItems
+
+Latency is a sampled time to first token plus a per-output-token delay. Token
+counts are estimated at ~4 characters per token. Prompt prefixes shared with
+earlier requests are reported as usage.prompt_tokens_details.cached_tokens,
+in 128-token blocks once at least 1024 tokens match, as OpenAI's prefix cache
+does. Server errors, 429s and invalid JSON can be injected at configurable rates.
+
+Run it and point the API at it (OPENAI_BASE_URL is read by both LLM services):
+    python -m src.services.openai_stub --port 8099 --latency-ms 1200 --ms-per-token 8
+    OPENAI_BASE_URL=http://127.0.0.1:8099/v1 uvicorn main:app
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CHARS_PER_TOKEN = 4
+PREFIX_CACHE_BLOCK_TOKENS = 128
+PREFIX_CACHE_MIN_TOKENS = 1024
+# Distinct prompt prefix blocks remembered for cached_tokens
+PREFIX_CACHE_MAX_BLOCKS = 100000
+STREAM_CHUNK_TOKENS = 16
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+_WORDS = (
+    "build", "ship", "measure", "focus", "practice", "improve", "scale", "design", "review", "learn",
+    "systems", "projects", "interviews", "metrics", "skills", "roadmap", "impact", "weekly", "portfolio", "depth",
+)
+
+
+@dataclass(frozen=True)
+class StubConfig:
+    latency_dist: str = "lognormal"
+    latency_ms: float = 800.0  # median (lognormal) or mean time to first token
+    latency_spread: float = 0.4  # sigma for lognormal, ms for normal/uniform
+    ms_per_token: float = 10.0  # added per completion token
+    prompt_tokens: Optional[int] = None  # fixed count instead of the estimate
+    completion_tokens: Optional[int] = None
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    invalid_json_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    text_words: int = 12
+    seed: Optional[int] = None
+
+
+def sample_latency_ms(config: StubConfig, rng: random.Random) -> float:
+    """Time to first token in ms, drawn from the configured distribution."""
+    center, spread = config.latency_ms, config.latency_spread
+    if config.latency_dist == "fixed":
+        value = center
+    elif config.latency_dist == "uniform":
+        value = rng.uniform(center - spread, center + spread)
+    elif config.latency_dist == "normal":
+        value = rng.gauss(center, spread)
+    elif config.latency_dist == "lognormal":
+        value = center * math.exp(rng.gauss(0.0, spread))
+    elif config.latency_dist == "exponential":
+        value = rng.expovariate(1.0 / center) if center > 0 else 0.0
+    else:
+        raise ValueError(f"Unknown latency distribution: {config.latency_dist}")
+    return max(0.0, value)
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+class SchemaFiller:
+    """Builds an instance of a JSON schema (strict-mode subset used by structured outputs)."""
+
+    def __init__(self, schema: Dict[str, Any], rng: random.Random, text_words: int = 12):
+        self._defs = {**schema.get("definitions", {}), **schema.get("$defs", {})}
+        self._rng = rng
+        self._text_words = text_words
+
+    def fill(self, node: Dict[str, Any], name: str = "value") -> Any:
+        if "$ref" in node:
+            return self.fill(self._defs[node["$ref"].rsplit("/", 1)[-1]], name)
+        if "const" in node:
+            return node["const"]
+        if "enum" in node:
+            return self._rng.choice(node["enum"])
+        for key in ("anyOf", "oneOf"):
+            if key in node:
+                options = [option for option in node[key] if option.get("type") != "null"] or node[key]
+                return self.fill(options[0], name)
+        if "allOf" in node:
+            return self.fill(node["allOf"][0], name)
+
+        node_type = node.get("type", "object" if "properties" in node else "string")
+        if isinstance(node_type, list):
+            node_type = next((value for value in node_type if value != "null"), "null")
+
+        if node_type == "object":
+            return {key: self.fill(child, key) for key, child in node.get("properties", {}).items()}
+        if node_type == "array":
+            # An explicit minItems of 0 marks lists the backend fills in (opportunities_you_qualify_for)
+            count = 0 if node.get("minItems") == 0 else min(node.get("maxItems", 3), 3)
+            count = max(node.get("minItems", 0), count)
+            return [self.fill(node.get("items", {}), name) for _ in range(count)]
+        if node_type == "integer":
+            low = node.get("minimum", node.get("exclusiveMinimum", -1) + 1)
+            high = node.get("maximum", node.get("exclusiveMaximum", 101) - 1)
+            return self._rng.randint(int(low), int(max(low, high)))
+        if node_type == "number":
+            return round(self._rng.uniform(node.get("minimum", 0), node.get("maximum", 100)), 2)
+        if node_type == "boolean":
+            return self._rng.random() < 0.5
+        if node_type == "null":
+            return None
+        if node.get("examples"):
+            return str(self._rng.choice(node["examples"]))
+        return self.text(name)
+
+    def text(self, name: str) -> str:
+        words = [self._rng.choice(_WORDS) for _ in range(self._text_words)]
+        return f"{name.replace('_', ' ').capitalize()}: {' '.join(words)}."
+
+
+def _user_context(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """The minified USER CONTEXT JSON appended to the MBA prompt, if present."""
+    for message in reversed(messages):
+        content = message.get("content")
+        if isinstance(content, str) and "USER CONTEXT:" in content:
+            try:
+                return json.loads(content.rsplit("USER CONTEXT:", 1)[1])
+            except ValueError:
+                return {}
+    return {}
+
+
+def mba_content(context: Dict[str, Any], rng: random.Random) -> Dict[str, Any]:
+    """MBAOpenAIContent for the user context, built from the mba_openai_mock templates."""
+    from src.services.mba_openai_mock import generate_mock_openai_content
+
+    role = context.get("role") or "pm"
+    gaps = (context.get("skills") or {}).get("gaps") or []
+    mock = generate_mock_openai_content(role, {}, gaps, context.get("readiness_score") or 50)
+    companies = context.get("companies_to_analyze") or [
+        {"name": story.company, "industry": story.industry} for story in mock.transformation_stories
+    ]
+    stories = []
+    for company, story in zip(companies, mock.transformation_stories * len(companies)):
+        stories.append({
+            "company": company["name"],
+            "before_ai": f"{company['name']} ran key {company.get('industry', 'business')} workflows by hand | "
+                         "Reporting lagged decisions by weeks",
+            "after_ai": story.transformation_narrative,
+            "relevance_to_user": story.relevance_to_user,
+        })
+    mock_tools = {tool.name: tool for tool in mock.tool_descriptions}
+    tool_descriptions = []
+    for tool in context.get("tools_to_personalize") or [{"name": tool.name} for tool in mock.tool_descriptions]:
+        mock_tool = mock_tools.get(tool["name"])
+        tool_descriptions.append({
+            "tool_name": tool["name"],
+            "personalized_use_case": mock_tool.personalized_use_case if mock_tool
+            else f"Use {tool['name']} weekly on your highest-impact {role} work.",
+            "why_it_helps": mock_tool.personalized_impact if mock_tool
+            else f"{tool['name']} frees hours for strategic work.",
+        })
+    priorities = ("must-have", "recommended", "nice-to-have")
+    quick_wins = [
+        {
+            "title": win.title,
+            "description": f"{win.description}. {win.reasoning}",
+            "timeline": win.timeframe,
+            "impact": win.impact,
+            "priority": priorities[min(index // 2, 2)],
+        }
+        for index, win in enumerate(mock.quick_wins)
+    ]
+    current = context.get("current_role_name") or role
+    career_paths = [
+        {
+            "title": title,
+            "description": f"Grow from {current} into {title.split(' (')[0]} with AI-first execution.",
+            "action_items": [
+                "Ship one AI-assisted project this quarter",
+                "Present measurable results to leadership",
+                "Mentor a peer on AI workflows",
+            ],
+        }
+        for title in (f"Senior {current} (Transition Goal)", f"{current} - AI Strategy", "Business Operations Lead")
+    ]
+    rng.shuffle(stories)
+    return {
+        "transformation_stories": stories,
+        "tool_descriptions": tool_descriptions,
+        "quick_wins": quick_wins,
+        "career_paths": career_paths,
+    }
+
+
+class PrefixCache:
+    """Remembers prompt prefixes in 128-token blocks, like OpenAI's automatic prompt caching."""
+
+    def __init__(self, max_blocks: int = PREFIX_CACHE_MAX_BLOCKS):
+        self._blocks: "OrderedDict[bytes, None]" = OrderedDict()
+        self._max_blocks = max_blocks
+
+    def cached_tokens(self, prompt: str) -> int:
+        block_chars = PREFIX_CACHE_BLOCK_TOKENS * CHARS_PER_TOKEN
+        digest = hashlib.sha256()
+        hits = 0
+        missed = False
+        for start in range(0, len(prompt) - block_chars + 1, block_chars):
+            digest.update(prompt[start:start + block_chars].encode("utf-8"))
+            key = digest.digest()
+            if not missed and key in self._blocks:
+                hits += 1
+                self._blocks.move_to_end(key)
+            else:
+                missed = True
+                self._blocks[key] = None
+        while len(self._blocks) > self._max_blocks:
+            self._blocks.popitem(last=False)
+        cached = hits * PREFIX_CACHE_BLOCK_TOKENS
+        return cached if cached >= PREFIX_CACHE_MIN_TOKENS else 0
+
+
+def _error(status: int, message: str, error_type: str, code: Optional[str] = None,
+           headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    return JSONResponse(
+        status_code=status,
+        content={"error": {"message": message, "type": error_type, "param": None, "code": code}},
+        headers=headers,
+    )
+
+
+def create_stub_app(config: Optional[StubConfig] = None) -> FastAPI:
+    """FastAPI app serving the stand-in endpoints (usable in-process or via uvicorn)."""
+    config = config or StubConfig()
+    if config.latency_dist not in LATENCY_DISTRIBUTIONS:
+        raise ValueError(f"latency_dist must be one of {LATENCY_DISTRIBUTIONS}")
+    rng = random.Random(config.seed)
+    prefix_cache = PrefixCache()
+    stats: Dict[str, int] = {
+        "requests": 0, "streamed": 0, "server_errors": 0, "rate_limited": 0, "invalid_json": 0,
+        "prompt_tokens": 0, "cached_prompt_tokens": 0, "completion_tokens": 0,
+    }
+    started_at = time.time()
+    app = FastAPI(title="OpenAI stand-in", docs_url=None, redoc_url=None)
+
+    def _content(body: Dict[str, Any]) -> str:
+        response_format = body.get("response_format") or {}
+        if response_format.get("type") != "json_schema":
+            return "This is a stand-in completion."
+        if rng.random() < config.invalid_json_rate:
+            stats["invalid_json"] += 1
+            return '{"truncated": '
+        json_schema = response_format.get("json_schema") or {}
+        if json_schema.get("name") == "mba_content":
+            value = mba_content(_user_context(body.get("messages") or []), rng)
+        else:
+            schema = json_schema.get("schema") or {}
+            value = SchemaFiller(schema, rng, config.text_words).fill(schema)
+        return json.dumps(value)
+
+    def _usage(body: Dict[str, Any], content: str) -> Dict[str, Any]:
+        prompt = json.dumps(body.get("response_format") or {}, sort_keys=True) + "".join(
+            str(message.get("content") or "") for message in body.get("messages") or []
+        )
+        prompt_tokens = config.prompt_tokens if config.prompt_tokens is not None else estimate_tokens(prompt)
+        cached_tokens = min(prompt_tokens, prefix_cache.cached_tokens(prompt))
+        completion_tokens = (
+            config.completion_tokens if config.completion_tokens is not None else estimate_tokens(content)
+        )
+        stats["prompt_tokens"] += prompt_tokens
+        stats["cached_prompt_tokens"] += cached_tokens
+        stats["completion_tokens"] += completion_tokens
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": cached_tokens, "audio_tokens": 0},
+            "completion_tokens_details": {"reasoning_tokens": 0, "audio_tokens": 0},
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        stats["requests"] += 1
+        draw = rng.random()
+        if draw < config.rate_limit_rate:
+            stats["rate_limited"] += 1
+            return _error(
+                429, "Rate limit reached (stand-in)", "requests", "rate_limit_exceeded",
+                headers={
+                    "retry-after": str(math.ceil(config.retry_after_seconds)),
+                    "retry-after-ms": str(int(config.retry_after_seconds * 1000)),
+                },
+            )
+        if draw < config.rate_limit_rate + config.error_rate:
+            stats["server_errors"] += 1
+            await asyncio.sleep(sample_latency_ms(config, rng) / 1000)
+            return _error(500, "The server had an error while processing your request (stand-in)", "server_error")
+
+        model = body.get("model", "gpt-4o")
+        content = _content(body)
+        usage = _usage(body, content)
+        completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        first_token_ms = sample_latency_ms(config, rng)
+
+        if body.get("stream"):
+            stats["streamed"] += 1
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            return StreamingResponse(
+                _stream(completion_id, created, model, content, usage, include_usage, first_token_ms),
+                media_type="text/event-stream",
+            )
+
+        await asyncio.sleep((first_token_ms + usage["completion_tokens"] * config.ms_per_token) / 1000)
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content, "refusal": None},
+                "logprobs": None,
+                "finish_reason": "stop",
+            }],
+            "usage": usage,
+            "system_fingerprint": "fp_stub",
+        }
+
+    async def _stream(completion_id: str, created: int, model: str, content: str, usage: Dict[str, Any],
+                      include_usage: bool, first_token_ms: float) -> AsyncIterator[str]:
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None, **extra: Any) -> str:
+            payload = {
+                "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                "choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": finish_reason}],
+                **extra,
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        await asyncio.sleep(first_token_ms / 1000)
+        yield chunk({"role": "assistant", "content": ""})
+        step = STREAM_CHUNK_TOKENS * CHARS_PER_TOKEN
+        per_chunk = STREAM_CHUNK_TOKENS * config.ms_per_token / 1000
+        for start in range(0, len(content), step):
+            await asyncio.sleep(per_chunk)
+            yield chunk({"content": content[start:start + step]})
+        yield chunk({}, "stop")
+        if include_usage:
+            yield f"data: {json.dumps({'id': completion_id, 'object': 'chat.completion.chunk', 'created': created, 'model': model, 'choices': [], 'usage': usage})}\n\n"
+        yield "data: [DONE]\n\n"
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {
+            "object": "list",
+            "data": [
+                {"id": model, "object": "model", "created": 0, "owned_by": "stand-in"}
+                for model in ("gpt-4o", "gpt-4o-mini")
+            ],
+        }
+
+    @app.get("/stub/stats")
+    async def stub_stats():
+        return {
+            "since": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(started_at)),
+            "config": asdict(config),
+            **stats,
+        }
+
+    return app
+
+
+def self_check(config: StubConfig) -> List[str]:
+    """Validate generated replies against both services' response models; returns the checked names."""
+    from src.models import enrich_full_profile_evaluation
+    from src.models.models_raw import FullProfileEvaluationResponseRaw
+    from src.services.mba_openai_service import MBA_CONTENT_RESPONSE_FORMAT, MBAOpenAIContent
+    from src.services.run_poc import _strict_response_schema
+
+    rng = random.Random(config.seed)
+    schema = _strict_response_schema()
+    raw = FullProfileEvaluationResponseRaw.model_validate(SchemaFiller(schema, rng, config.text_words).fill(schema))
+    enrich_full_profile_evaluation(raw)
+    context = {"role": "finance", "companies_to_analyze": [{"name": "Stripe", "industry": "Fintech"}],
+               "tools_to_personalize": [{"name": "Causal", "category": "Business Modeling"}]}
+    MBAOpenAIContent.model_validate(mba_content(context, rng))
+    return ["FullProfileEvaluationResponseRaw", MBA_CONTENT_RESPONSE_FORMAT["json_schema"]["name"]]
+
+
+def parse_args(argv: Optional[list] = None) -> Tuple[argparse.Namespace, StubConfig]:
+    defaults = StubConfig()
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stand-in server for offline testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default=defaults.latency_dist)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms,
+                        help="Time to first token: median (lognormal) or mean")
+    parser.add_argument("--latency-spread", type=float, default=defaults.latency_spread,
+                        help="Sigma for lognormal, ms for normal/uniform")
+    parser.add_argument("--ms-per-token", type=float, default=defaults.ms_per_token)
+    parser.add_argument("--prompt-tokens", type=int, help="Report a fixed prompt token count")
+    parser.add_argument("--completion-tokens", type=int, help="Report a fixed completion token count")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with HTTP 429")
+    parser.add_argument("--invalid-json-rate", type=float, default=0.0,
+                        help="Share of structured replies that are not valid JSON (exercises correction retries)")
+    parser.add_argument("--retry-after", type=float, default=defaults.retry_after_seconds, dest="retry_after_seconds")
+    parser.add_argument("--text-words", type=int, default=defaults.text_words)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    config = StubConfig(
+        latency_dist=args.latency_dist,
+        latency_ms=args.latency_ms,
+        latency_spread=args.latency_spread,
+        ms_per_token=args.ms_per_token,
+        prompt_tokens=args.prompt_tokens,
+        completion_tokens=args.completion_tokens,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        invalid_json_rate=args.invalid_json_rate,
+        retry_after_seconds=args.retry_after_seconds,
+        text_words=args.text_words,
+        seed=args.seed,
+    )
+    return args, config
+
+
+def main(argv: Optional[list] = None) -> int:
+    import uvicorn
+
+    from src.config.logging_config import setup_logging
+
+    setup_logging()
+    args, config = parse_args(argv)
+    checked = self_check(config)
+    logger.info(f"OpenAI stand-in replies validate against: {', '.join(checked)}")
+    uvicorn.run(create_stub_app(config), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+"""
+Partition maintenance for the created_at-partitioned tables (migration 002).
+Creates monthly partitions ahead of time and enforces retention by detaching
+and dropping whole partitions instead of running DELETEs.
+
+Run daily from cron / a scheduled task:
+    python -m src.services.partition_maintenance
+"""
+import argparse
+import re
+from datetime import date
+from typing import Dict, List, Optional
+
+from database import get_db_connection
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+
+logger = get_logger(__name__)
+
+PARTITIONED_TABLES = ("response_cache", "crt_quiz_responses")
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _retention_months(table: str) -> Optional[int]:
+    return {
+        "response_cache": settings.cache_retention_months,
+        "crt_quiz_responses": settings.crt_retention_months,
+    }.get(table)
+
+
+def ensure_future_partitions(table: str, months_ahead: Optional[int] = None) -> int:
+    """
+    Create any missing monthly partitions from the current month through
+    months_ahead months from now.
+
+    Returns:
+        Number of partitions created
+    """
+    months_ahead = settings.partition_premake_months if months_ahead is None else months_ahead
+    this_month = date.today().replace(day=1)
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT create_monthly_partitions(%s, %s, %s)",
+                (table, this_month, _add_months(this_month, months_ahead))
+            )
+            created = cur.fetchone()[0]
+
+    if created:
+        logger.info(f"Created {created} future partitions for {table}")
+    return created
+
+
+def list_partitions(table: str) -> List[Dict[str, object]]:
+    """Monthly partitions of a table with the first day of the month each one covers."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = %s::regclass
+                """,
+                (table,)
+            )
+            names = [row[0] for row in cur.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = _PARTITION_SUFFIX.search(name)
+        if match:
+            partitions.append({
+                "name": name,
+                "month": date(int(match.group(1)), int(match.group(2)), 1),
+            })
+    return sorted(partitions, key=lambda partition: partition["month"])
+
+
+def enforce_retention(table: str, retain_months: Optional[int] = None, drop: bool = True) -> List[str]:
+    """
+    Detach (and by default drop) partitions whose whole month is older than
+    the retention window. The current month always counts as retained.
+
+    Args:
+        table: Partitioned table name
+        retain_months: Months to keep; None means keep everything
+        drop: Drop detached partitions; False leaves them as standalone tables for archiving
+
+    Returns:
+        Names of the partitions that were detached
+    """
+    retain_months = _retention_months(table) if retain_months is None else retain_months
+    if not retain_months:
+        return []
+
+    cutoff = _add_months(date.today().replace(day=1), -(retain_months - 1))
+    expired = [p["name"] for p in list_partitions(table) if p["month"] < cutoff]
+
+    for name in expired:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"')
+                if drop:
+                    cur.execute(f'DROP TABLE "{name}"')
+        logger.info(f"{'Dropped' if drop else 'Detached'} expired partition {name} of {table}")
+
+    return expired
+
+
+def run_maintenance(drop: bool = True) -> Dict[str, Dict[str, object]]:
+    """Create future partitions and apply retention for every partitioned table."""
+    summary: Dict[str, Dict[str, object]] = {}
+    for table in PARTITIONED_TABLES:
+        summary[table] = {
+            "created": ensure_future_partitions(table),
+            "expired": enforce_retention(table, drop=drop),
+        }
+    return summary
+
+
+def main(argv: Optional[list] = None) -> int:
+    from src.config.logging_config import setup_logging
+
+    parser = argparse.ArgumentParser(description="Create future partitions and enforce retention")
+    parser.add_argument(
+        "--detach-only",
+        action="store_true",
+        help="Detach expired partitions but keep them as standalone tables",
+    )
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    summary = run_maintenance(drop=not args.detach_only)
+    for table, result in summary.items():
+        logger.info(f"{table}: created={result['created']} expired={result['expired']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
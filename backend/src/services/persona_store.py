@@ -0,0 +1,140 @@
+"""
+Shared, pre-indexed view of personas.json for the 25-persona tech system.
+
+personas.json is read through the config registry and compiled once per
+config version into:
+- an index from the normalized quiz tuple
+  (background, currentRole, experience bucket, targetRole, codeComfort)
+  to persona id, covering every answer combination (unknown answers
+  normalize to the same defaults the matcher always used)
+- per-persona alternative role tables
+- per-(persona, card type) card configs
+
+so persona matching and card lookups are single dict lookups.
+"""
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from src.config.registry import config_registry
+
+# Tech: currentRole × experience bucket
+TECH_ROLE_PREFIXES = {
+    "swe-product": "swe_product",
+    "swe-service": "swe_service",
+    "devops": "devops",
+    "qa-support": "qa_support",
+}
+TECH_EXPERIENCE_LEVELS = {
+    "0-2": "junior",
+    "2-3": "mid1",
+    "3-5": "mid2",
+    "5-8": "senior",
+    "8+": "expert",
+}
+DEFAULT_TECH_ROLE_PREFIX = "swe_product"
+DEFAULT_TECH_EXPERIENCE_LEVEL = "mid2"
+DEFAULT_TECH_PERSONA = "swe_product_mid2"
+
+# Non-tech: targetRole only (experience is applied inside the persona)
+NONTECH_ROLE_KEYS = {
+    "frontend": "frontend",
+    "backend": "backend",
+    "fullstack": "fullstack",
+    "data-ml": "dataml",
+    "not-sure": "exploring",
+    "exploring": "exploring",
+}
+DEFAULT_NONTECH_ROLE_KEY = "exploring"
+DEFAULT_NONTECH_PERSONA = "nontech_exploring"
+
+PersonaKey = Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]]
+
+
+def normalize_persona_key(
+    background: Optional[str],
+    currentRole: Optional[str] = None,
+    experience: Optional[str] = None,
+    targetRole: Optional[str] = None,
+    codeComfort: Optional[str] = None,
+) -> PersonaKey:
+    """
+    Reduce quiz answers to the tuple that decides the persona.
+
+    Fields a background does not split on are collapsed to None (non-tech
+    personas ignore currentRole, experience and codeComfort; tech personas
+    ignore targetRole and codeComfort), and unknown answers map to the
+    matcher defaults.
+    """
+    if background == "tech":
+        return (
+            "tech",
+            TECH_ROLE_PREFIXES.get(currentRole, DEFAULT_TECH_ROLE_PREFIX),
+            TECH_EXPERIENCE_LEVELS.get(experience, DEFAULT_TECH_EXPERIENCE_LEVEL),
+            None,
+            None,
+        )
+    return ("non-tech", None, None, NONTECH_ROLE_KEYS.get(targetRole, DEFAULT_NONTECH_ROLE_KEY), None)
+
+
+class PersonaStore:
+    """Personas for one personas.json version, with precomputed lookup tables."""
+
+    def __init__(self, personas: Mapping[str, Any], version: int = 0):
+        self.version = version
+        self.personas = personas
+        self.index: Dict[PersonaKey, str] = {}
+        self.alternative_roles: Dict[str, Mapping[str, str]] = {}
+        self.cards: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+
+        for prefix in set(TECH_ROLE_PREFIXES.values()):
+            for level in set(TECH_EXPERIENCE_LEVELS.values()):
+                persona_id = f"{prefix}_{level}"
+                if persona_id not in personas:
+                    persona_id = DEFAULT_TECH_PERSONA
+                self.index[("tech", prefix, level, None, None)] = persona_id
+
+        for role_key in set(NONTECH_ROLE_KEYS.values()):
+            persona_id = f"nontech_{role_key}"
+            if persona_id not in personas:
+                persona_id = DEFAULT_NONTECH_PERSONA
+            self.index[("non-tech", None, None, role_key, None)] = persona_id
+
+        for persona_id, persona in personas.items():
+            if persona_id.startswith("_"):
+                continue
+            recommendations = persona.get("role_recommendations", {})
+            self.alternative_roles[persona_id] = recommendations.get("target_to_alternative_role", {})
+            for card_type, card_config in persona.get("cards", {}).items():
+                self.cards[(persona_id, card_type)] = card_config
+
+    def match(self, key: PersonaKey) -> Tuple[str, Optional[Mapping[str, Any]]]:
+        """(persona_id, persona) for a normalized key."""
+        persona_id = self.index[key]
+        return persona_id, self.personas.get(persona_id)
+
+    def get(self, persona_id: str) -> Optional[Mapping[str, Any]]:
+        return self.personas.get(persona_id)
+
+    def card(self, persona_id: str, card_type: str) -> Optional[Mapping[str, Any]]:
+        return self.cards.get((persona_id, card_type))
+
+    def alternative_role(self, persona_id: str, target_role: str) -> Optional[str]:
+        return self.alternative_roles.get(persona_id, {}).get(target_role)
+
+
+_store: Optional[PersonaStore] = None
+_store_lock = threading.Lock()
+
+
+def get_persona_store() -> PersonaStore:
+    """Store for the current personas.json version (rebuilt after a hot reload)."""
+    global _store
+    entry = config_registry.entry("personas")
+    store = _store
+    if store is None or store.version != entry.version:
+        with _store_lock:
+            store = _store
+            if store is None or store.version != entry.version:
+                store = PersonaStore(entry.data["personas"], entry.version)
+                _store = store
+    return store
@@ -0,0 +1,315 @@
+"""
+Deterministic enrichment stage for tech/non-tech profile evaluations.
+
+After the LLM call, run_poc overwrites most of the profile evaluation with
+rule-based sections. Those rules only read a handful of enum quiz answers, so
+the whole stage is memoized on the canonical tuple of exactly those answers
+(ENRICHMENT_KEY_FIELDS) in a bounded LRU. The cache is per worker process,
+cleared whenever personas.json is reloaded, and can optionally be filled from
+the quiz option grid at startup (ENRICHMENT_PRECOMPUTE).
+
+Profile strength notes and the current profile summary also echo free-text
+fields (currentCompany and the display labels), so they are rebuilt per call
+on top of the memoized sections.
+"""
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+from src.services.current_profile_summary import generate_current_profile_summary
+from src.services.interview_readiness_logic import calculate_interview_readiness
+from src.services.job_descriptions import card_cache_info, generate_career_cards
+from src.services.peer_comparison_logic import generate_peer_group_description
+from src.services.persona_store import get_persona_store
+from src.services.profile_notes_logic import generate_profile_strength_notes
+from src.services.quick_wins_logic import generate_quick_wins
+from src.services.scoring_logic import calculate_profile_strength
+from src.services.tools_logic import generate_tool_recommendations
+
+logger = get_logger(__name__)
+
+# Every quiz field read by the memoized rule functions (and their helpers)
+ENRICHMENT_KEY_FIELDS: Tuple[str, ...] = (
+    "currentRole",
+    "experience",
+    "currentSkill",
+    "targetRole",
+    "targetCompany",
+    "problemSolving",
+    "systemDesign",
+    "portfolio",
+    "codeComfort",
+    "stepsTaken",
+    "timePerWeek",
+)
+
+# Absent fields and explicit None hit different defaults in the rule functions
+_MISSING = object()
+
+# Answer sets sent by the frontend (QUIZ_QUESTIONS_AND_OPTIONS.md), used for precomputation
+TECH_CURRENT_SKILLS: Dict[str, Tuple[str, ...]] = {
+    "swe-product": ("backend", "frontend", "fullstack", "system-design"),
+    "swe-service": ("enterprise", "web", "database", "learning-product"),
+    "devops": ("cloud", "containers", "cicd", "iac"),
+    "qa-support": ("automation", "sysadmin", "learning-dev", "infrastructure"),
+}
+TECH_EXPERIENCE = ("0-2", "2-3", "3-5", "5-8", "8+")
+TECH_TARGET_ROLES = ("senior-backend", "senior-fullstack", "backend-sde", "fullstack-sde", "data-ml", "tech-lead")
+TECH_TARGET_COMPANIES = ("faang", "unicorns", "startups", "better-service", "evaluating")
+TECH_PROBLEM_SOLVING = ("100+", "51-100", "11-50", "0-10")
+TECH_SYSTEM_DESIGN = ("multiple", "once", "learning", "not-yet")
+TECH_PORTFOLIO = ("active-5+", "limited-1-5", "inactive", "none")
+
+NONTECH_BACKGROUNDS = ("sales-marketing", "operations", "design", "finance", "other")
+NONTECH_EXPERIENCE = ("0", "0-2", "2-3", "3-5", "5+")
+NONTECH_TARGET_ROLES = ("backend", "fullstack", "data-ml", "frontend", "not-sure")
+NONTECH_TARGET_COMPANIES = ("any-tech", "product", "service", "faang-longterm", "not-sure")
+# codeComfort is mapped client-side to (problemSolving, portfolio)
+NONTECH_CODING_LEVELS = (("51-100", "limited-1-5"), ("11-50", "inactive"), ("0-10", "none"))
+
+
+class EnrichedSections(NamedTuple):
+    """Rule-based sections of a profile evaluation (shared between requests; read-only)."""
+    profile_strength: Dict[str, Any]
+    interview_readiness: Dict[str, Any]
+    quick_wins: List[Dict[str, str]]
+    job_opportunities: List[Any]
+    tool_recommendations: List[str]
+    peer_group_description: str
+    recommended_roles: List[Dict[str, Any]]
+    profile_strength_notes: str
+    current_profile: Dict[str, Any]
+
+
+class _CoreSections(NamedTuple):
+    profile_strength: Dict[str, Any]
+    interview_readiness: Dict[str, Any]
+    quick_wins: List[Dict[str, str]]
+    job_opportunities: List[Any]
+    tool_recommendations: List[str]
+    peer_group_description: str
+    recommended_roles: List[Dict[str, Any]]
+
+
+EnrichmentKey = Tuple[Any, ...]
+
+
+def enrichment_key(background: str, quiz_responses: Dict[str, Any]) -> EnrichmentKey:
+    """Canonical tuple of the answers the memoized rules read."""
+    return (background, *(quiz_responses.get(field, _MISSING) for field in ENRICHMENT_KEY_FIELDS))
+
+
+def _compute_core(background: str, quiz_responses: Dict[str, Any]) -> _CoreSections:
+    job_opportunities, recommended_roles = generate_career_cards(background, quiz_responses)
+    return _CoreSections(
+        profile_strength=calculate_profile_strength(background, quiz_responses),
+        interview_readiness=calculate_interview_readiness(background, quiz_responses),
+        quick_wins=generate_quick_wins(background, quiz_responses),
+        job_opportunities=job_opportunities,
+        tool_recommendations=generate_tool_recommendations(background, quiz_responses),
+        peer_group_description=generate_peer_group_description(background, quiz_responses),
+        recommended_roles=[role.model_dump() for role in recommended_roles],
+    )
+
+
+def iter_option_grid() -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(background, quiz_responses) for every answer combination the quiz can send, non-tech first."""
+    for current_role, experience, target_role, target_company, (problem_solving, portfolio) in itertools.product(
+        NONTECH_BACKGROUNDS, NONTECH_EXPERIENCE, NONTECH_TARGET_ROLES, NONTECH_TARGET_COMPANIES, NONTECH_CODING_LEVELS
+    ):
+        yield "non-tech", {
+            "currentRole": current_role,
+            "experience": experience,
+            "currentSkill": problem_solving,
+            "targetRole": target_role,
+            "targetCompany": target_company,
+            "problemSolving": problem_solving,
+            "systemDesign": "not-yet",
+            "portfolio": portfolio,
+        }
+
+    for current_role, current_skills in TECH_CURRENT_SKILLS.items():
+        for current_skill, experience, target_role, target_company, problem_solving, system_design, portfolio in itertools.product(
+            current_skills, TECH_EXPERIENCE, TECH_TARGET_ROLES, TECH_TARGET_COMPANIES,
+            TECH_PROBLEM_SOLVING, TECH_SYSTEM_DESIGN, TECH_PORTFOLIO,
+        ):
+            # systemDesign is only asked when problemSolving != '0-10'
+            if problem_solving == "0-10" and system_design != "not-yet":
+                continue
+            yield "tech", {
+                "currentRole": current_role,
+                "experience": experience,
+                "currentSkill": current_skill,
+                "targetRole": target_role,
+                "targetCompany": target_company,
+                "problemSolving": problem_solving,
+                "systemDesign": system_design,
+                "portfolio": portfolio,
+            }
+
+
+def option_grid_size() -> int:
+    nontech = (
+        len(NONTECH_BACKGROUNDS) * len(NONTECH_EXPERIENCE) * len(NONTECH_TARGET_ROLES)
+        * len(NONTECH_TARGET_COMPANIES) * len(NONTECH_CODING_LEVELS)
+    )
+    design_answers = (len(TECH_PROBLEM_SOLVING) - 1) * len(TECH_SYSTEM_DESIGN) + 1
+    tech = (
+        sum(len(skills) for skills in TECH_CURRENT_SKILLS.values()) * len(TECH_EXPERIENCE)
+        * len(TECH_TARGET_ROLES) * len(TECH_TARGET_COMPANIES) * design_answers * len(TECH_PORTFOLIO)
+    )
+    return nontech + tech
+
+
+class ProfileEnrichment:
+    """Bounded LRU memo of the deterministic sections, with hit statistics."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = settings.enrichment_cache_size if max_entries is None else max_entries
+        self._entries: "OrderedDict[EnrichmentKey, _CoreSections]" = OrderedDict()
+        self._persona_version: Optional[int] = None
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.precomputed = 0
+        self._compute_ms = 0.0
+
+    def _check_version(self) -> None:
+        # Cards and timelines come from personas.json; drop everything after a hot reload
+        version = get_persona_store().version
+        if version != self._persona_version:
+            with self._lock:
+                if version != self._persona_version:
+                    if self._entries:
+                        self.invalidations += 1
+                    self._entries.clear()
+                    self._persona_version = version
+
+    def _core(self, background: str, quiz_responses: Dict[str, Any], count: bool = True) -> _CoreSections:
+        key = enrichment_key(background, quiz_responses)
+        try:
+            hash(key)
+        except TypeError:
+            # Non-string answers (e.g. lists from a hand-written payload) bypass the memo
+            with self._lock:
+                self.uncacheable += 1
+            return _compute_core(background, quiz_responses)
+
+        self._check_version()
+        with self._lock:
+            core = self._entries.get(key)
+            if core is not None:
+                self._entries.move_to_end(key)
+                if count:
+                    self.hits += 1
+                return core
+
+        started = time.perf_counter()
+        core = _compute_core(background, quiz_responses)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        with self._lock:
+            if count:
+                self.misses += 1
+                self._compute_ms += elapsed_ms
+            if self.max_entries > 0:
+                self._entries[key] = core
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return core
+
+    def enrich(self, background: str, quiz_responses: Dict[str, Any]) -> EnrichedSections:
+        """All rule-based sections for one evaluation."""
+        core = self._core(background, quiz_responses)
+        return EnrichedSections(
+            profile_strength=core.profile_strength,
+            interview_readiness=core.interview_readiness,
+            quick_wins=core.quick_wins,
+            job_opportunities=core.job_opportunities,
+            tool_recommendations=core.tool_recommendations,
+            peer_group_description=core.peer_group_description,
+            recommended_roles=core.recommended_roles,
+            profile_strength_notes=generate_profile_strength_notes(
+                background, quiz_responses, core.profile_strength["score"]
+            ),
+            current_profile=generate_current_profile_summary(background, quiz_responses),
+        )
+
+    def precompute(self) -> int:
+        """
+        Fill the memo from the quiz option grid (non-tech first), stopping at
+        ENRICHMENT_CACHE_SIZE. Returns the number of entries computed.
+        """
+        started = time.perf_counter()
+        grid_size = option_grid_size()
+        computed = 0
+        for background, quiz_responses in itertools.islice(iter_option_grid(), self.max_entries):
+            self._core(background, quiz_responses, count=False)
+            computed += 1
+        with self._lock:
+            self.precomputed += computed
+
+        message = (
+            f"Precomputed {computed:,} of {grid_size:,} enrichment combinations "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+        if computed < grid_size:
+            logger.warning(f"{message} (raise ENRICHMENT_CACHE_SIZE to cover the full grid)")
+        else:
+            logger.info(message)
+        return computed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "since": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self._started_at)),
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "option_grid_size": option_grid_size(),
+                "persona_version": self._persona_version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "uncacheable": self.uncacheable,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "precomputed": self.precomputed,
+                "avg_miss_ms": round(self._compute_ms / self.misses, 3) if self.misses else 0.0,
+                "cards": card_cache_info(),
+            }
+
+
+_enrichment: Optional[ProfileEnrichment] = None
+_enrichment_lock = threading.Lock()
+
+
+def get_profile_enrichment() -> ProfileEnrichment:
+    global _enrichment
+    with _enrichment_lock:
+        if _enrichment is None:
+            _enrichment = ProfileEnrichment()
+        return _enrichment
+
+
+def start_precompute() -> threading.Thread:
+    """Precompute the memo in a background thread (startup hook for ENRICHMENT_PRECOMPUTE)."""
+    thread = threading.Thread(
+        target=get_profile_enrichment().precompute, name="profile-enrichment-precompute", daemon=True
+    )
+    thread.start()
+    return thread
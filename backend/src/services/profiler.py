@@ -0,0 +1,385 @@
+"""
+Time-boxed CPU and heap profiling of a running worker (admin /admin/profile endpoints).
+
+A session runs in the worker that received the start request. For the length
+of the time box it can:
+- sample the stack of every thread (sys._current_frames) every
+  PROFILING_SAMPLE_INTERVAL_MS, skipping threads parked on a lock, queue,
+  selector or pipe unless idle=True;
+- take a tracemalloc snapshot at the start and at the end.
+
+When the time box ends, it writes these to PROFILING_DIR/<session_id>/:
+- cpu.collapsed: folded stacks ("thread;outer;...;inner count"), for
+  flamegraph.pl, speedscope or inferno
+- heap_top.txt: the allocation sites whose memory grew most over the session
+- session.json: status, settings, sample counts and measured overhead
+
+Overhead is guarded:
+- Sessions last at most PROFILING_MAX_SECONDS.
+- The sampler doubles its interval whenever one sample takes more than
+  PROFILING_MAX_OVERHEAD_PERCENT of the interval.
+- tracemalloc, which slows every allocation, only runs when asked for. It is
+  stopped afterwards unless something else had already started it.
+- Only one session runs at a time across all workers, enforced by an
+  exclusive lock file in PROFILING_DIR.
+
+Artifacts are files, so any worker can serve the download.
+"""
+import json
+import os
+import re
+import shutil
+import sys
+import sysconfig
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from src.config.exceptions import ConflictError, NotFoundError, ValidationError
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+
+logger = get_logger(__name__)
+
+ARTIFACT_CPU = "cpu.collapsed"
+ARTIFACT_HEAP = "heap_top.txt"
+SESSION_FILE = "session.json"
+LOCK_FILE = "active.lock"
+
+TOP_ALLOCATIONS = 50
+MIN_SAMPLE_INTERVAL_MS = 1.0
+MAX_SAMPLE_INTERVAL_MS = 1000.0
+# The first samples fill the frame label cache and are slower; do not back off on them
+WARMUP_SAMPLES = 10
+# Leaf frames of threads parked on a lock, queue, selector or pipe (skipped unless idle=True)
+IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("connection.py", "_recv"),
+}
+# A lock left by a worker that died mid-session is ignored this long after its time box
+LOCK_GRACE_SECONDS = 60
+
+_SESSION_ID = re.compile(r"^[0-9a-f]{12}$")
+
+
+def _timestamp(epoch: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _StackSampler:
+    """Counts the folded stack of every other thread at a fixed (self-adjusting) interval."""
+
+    def __init__(self, interval_ms: float, max_overhead_percent: float, include_idle: bool = False):
+        self.interval_ms = interval_ms
+        self._include_idle = include_idle
+        self.initial_interval_ms = interval_ms
+        self._max_overhead = max_overhead_percent / 100
+        self.samples = 0
+        self.busy_seconds = 0.0
+        self.interval_increases = 0
+        self.idle_samples = 0
+        self.stacks: Counter = Counter()
+        self._labels: Dict[Any, str] = {}
+        self._root = os.getcwd() + os.sep
+        self._stdlib = sysconfig.get_paths()["stdlib"] + os.sep
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(self._root):
+                filename = filename[len(self._root):]
+            elif filename.startswith(self._stdlib):
+                filename = filename[len(self._stdlib):]
+            elif "site-packages" + os.sep in filename:
+                filename = filename.split("site-packages" + os.sep, 1)[1]
+            name = getattr(code, "co_qualname", code.co_name)
+            label = self._labels[code] = f"{name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+        return label
+
+    def run(self, stop: threading.Event) -> None:
+        own_ident = threading.get_ident()
+        while not stop.wait(self.interval_ms / 1000):
+            started = time.perf_counter()
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if not self._include_idle and self._is_idle(frame.f_code):
+                    self.idle_samples += 1
+                    continue
+                stack: List[str] = []
+                while frame is not None:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(thread_names.get(ident, f"thread-{ident}"))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+            busy = time.perf_counter() - started
+            self.busy_seconds += busy
+            if (self.samples > WARMUP_SAMPLES and busy * 1000 > self.interval_ms * self._max_overhead
+                    and self.interval_ms < MAX_SAMPLE_INTERVAL_MS):
+                self.interval_ms = min(self.interval_ms * 2, MAX_SAMPLE_INTERVAL_MS)
+                self.interval_increases += 1
+
+    @staticmethod
+    def _is_idle(code) -> bool:
+        return (os.path.basename(code.co_filename), code.co_name) in IDLE_LEAVES
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class Profiler:
+    """Starts profiling sessions in this worker and serves any worker's session files."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self._directory = directory or settings.profiling_dir or os.path.join(tempfile.gettempdir(), "fpe-profiles")
+
+    def start(self, duration_seconds: float, cpu: bool = True, heap: bool = True,
+              interval_ms: Optional[float] = None, idle: bool = False) -> Dict[str, Any]:
+        """Start a session in a background thread; raises ConflictError while another one runs."""
+        if not cpu and not heap:
+            raise ValidationError("Enable at least one of cpu or heap")
+        if not 0 < duration_seconds <= settings.profiling_max_seconds:
+            raise ValidationError(f"duration_seconds must be between 1 and {settings.profiling_max_seconds}")
+        interval_ms = settings.profiling_sample_interval_ms if interval_ms is None else interval_ms
+        if not MIN_SAMPLE_INTERVAL_MS <= interval_ms <= MAX_SAMPLE_INTERVAL_MS:
+            raise ValidationError(
+                f"interval_ms must be between {MIN_SAMPLE_INTERVAL_MS:g} and {MAX_SAMPLE_INTERVAL_MS:g}"
+            )
+
+        os.makedirs(self._directory, exist_ok=True)
+        session_id = uuid.uuid4().hex[:12]
+        started_at = time.time()
+        self._acquire_lock(session_id, started_at + duration_seconds)
+        try:
+            self._prune()
+            session_dir = os.path.join(self._directory, session_id)
+            os.makedirs(session_dir)
+            state: Dict[str, Any] = {
+                "session_id": session_id,
+                "pid": os.getpid(),
+                "status": "running",
+                "started_at": _timestamp(started_at),
+                "ends_at": _timestamp(started_at + duration_seconds),
+                "finished_at": None,
+                "duration_seconds": duration_seconds,
+                "cpu": {"interval_ms": interval_ms, "idle": idle} if cpu else None,
+                "heap": {"frames": settings.profiling_tracemalloc_frames} if heap else None,
+                "artifacts": [],
+                "error": None,
+            }
+            self._write_state(session_dir, state)
+        except Exception:
+            self._release_lock(session_id)
+            raise
+
+        thread = threading.Thread(
+            target=self._run, args=(session_dir, state, duration_seconds, cpu, heap, interval_ms, idle),
+            name=f"profiler-{session_id}", daemon=True,
+        )
+        thread.start()
+        logger.info(f"Profiling session {session_id} started (cpu={cpu}, heap={heap}, {duration_seconds}s)")
+        return dict(state)
+
+    def session(self, session_id: str) -> Dict[str, Any]:
+        path = os.path.join(self._session_dir(session_id), SESSION_FILE)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError as exc:
+            raise NotFoundError(f"Profiling session not found: {session_id}") from exc
+
+    def artifact_path(self, session_id: str, artifact: str) -> str:
+        if artifact not in (ARTIFACT_CPU, ARTIFACT_HEAP):
+            raise NotFoundError(f"Unknown artifact: {artifact} (expected {ARTIFACT_CPU} or {ARTIFACT_HEAP})")
+        path = os.path.join(self._session_dir(session_id), artifact)
+        if not os.path.exists(path):
+            raise NotFoundError(f"Artifact {artifact} is not available for session {session_id}")
+        return path
+
+    def _session_dir(self, session_id: str) -> str:
+        if not _SESSION_ID.match(session_id):
+            raise NotFoundError(f"Profiling session not found: {session_id}")
+        return os.path.join(self._directory, session_id)
+
+    def _run(self, session_dir: str, state: Dict[str, Any], duration_seconds: float,
+             cpu: bool, heap: bool, interval_ms: float, idle: bool) -> None:
+        stop = threading.Event()
+        timer = threading.Timer(duration_seconds, stop.set)
+        started_tracing = False
+        try:
+            before = None
+            if heap:
+                started_tracing = not tracemalloc.is_tracing()
+                if started_tracing:
+                    tracemalloc.start(settings.profiling_tracemalloc_frames)
+                before = tracemalloc.take_snapshot()
+
+            started = time.perf_counter()
+            timer.start()
+            sampler = None
+            if cpu:
+                sampler = _StackSampler(interval_ms, settings.profiling_max_overhead_percent, include_idle=idle)
+                sampler.run(stop)
+            else:
+                stop.wait()
+            elapsed = time.perf_counter() - started
+
+            if sampler is not None:
+                with open(os.path.join(session_dir, ARTIFACT_CPU), "w", encoding="utf-8") as handle:
+                    handle.write(sampler.collapsed())
+                state["cpu"] = {
+                    "interval_ms": sampler.initial_interval_ms,
+                    "idle": idle,
+                    "final_interval_ms": sampler.interval_ms,
+                    "interval_increases": sampler.interval_increases,
+                    "samples": sampler.samples,
+                    "idle_thread_samples_skipped": sampler.idle_samples,
+                    "distinct_stacks": len(sampler.stacks),
+                    "overhead_percent": round(100 * sampler.busy_seconds / elapsed, 3) if elapsed else 0.0,
+                }
+                state["artifacts"].append(ARTIFACT_CPU)
+
+            if before is not None:
+                after = tracemalloc.take_snapshot()
+                current, peak = tracemalloc.get_traced_memory()
+                state["heap"] = {
+                    "frames": tracemalloc.get_traceback_limit(),
+                    "traced_current_bytes": current,
+                    "traced_peak_bytes": peak,
+                    "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+                    "top": self._write_heap_diff(session_dir, before, after, elapsed),
+                }
+                state["artifacts"].append(ARTIFACT_HEAP)
+            state["status"] = "finished"
+        except Exception as exc:
+            logger.exception(f"Profiling session {state['session_id']} failed: {exc}")
+            state["status"] = "failed"
+            state["error"] = str(exc)
+        finally:
+            timer.cancel()
+            if started_tracing:
+                tracemalloc.stop()
+            state["finished_at"] = _timestamp(time.time())
+            try:
+                self._write_state(session_dir, state)
+            finally:
+                self._release_lock(state["session_id"])
+        logger.info(f"Profiling session {state['session_id']} {state['status']}")
+
+    def _write_heap_diff(self, session_dir: str, before, after, elapsed: float) -> List[Dict[str, Any]]:
+        """Write the top allocation sites by growth and return a short summary of the first ten."""
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ]
+        stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "traceback")
+        top = stats[:TOP_ALLOCATIONS]
+        lines = [
+            f"# tracemalloc diff over {elapsed:.1f}s, top {len(top)} allocation sites by size change "
+            f"({tracemalloc.get_traceback_limit()} frames, most recent call last)",
+            "",
+        ]
+        for stat in top:
+            lines.append(
+                f"{stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d} blocks), "
+                f"now {stat.size / 1024:.1f} KiB in {stat.count} blocks"
+            )
+            lines.extend(stat.traceback.format())
+            lines.append("")
+        with open(os.path.join(session_dir, ARTIFACT_HEAP), "w", encoding="utf-8") as handle:
+            handle.write("\n".join(lines))
+        return [
+            {
+                "site": f"{stat.traceback[-1].filename}:{stat.traceback[-1].lineno}",
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in top[:10]
+        ]
+
+    def _write_state(self, session_dir: str, state: Dict[str, Any]) -> None:
+        path = os.path.join(session_dir, SESSION_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as handle:
+            json.dump(state, handle, indent=2)
+        os.replace(f"{path}.tmp", path)
+
+    def _acquire_lock(self, session_id: str, ends_at: float) -> None:
+        path = os.path.join(self._directory, LOCK_FILE)
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                try:
+                    with open(path, encoding="utf-8") as handle:
+                        holder = json.load(handle)
+                except (OSError, ValueError):
+                    holder = None
+                if holder and _pid_alive(holder["pid"]) and time.time() < holder["ends_at"] + LOCK_GRACE_SECONDS:
+                    raise ConflictError(
+                        f"Profiling session {holder['session_id']} is already running in worker {holder['pid']} "
+                        f"until {_timestamp(holder['ends_at'])}"
+                    )
+                logger.warning(f"Removing stale profiling lock: {holder}")
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"session_id": session_id, "pid": os.getpid(), "ends_at": ends_at}, handle)
+            return
+        raise ConflictError("Another profiling session is starting")
+
+    def _release_lock(self, session_id: str) -> None:
+        path = os.path.join(self._directory, LOCK_FILE)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                holder = json.load(handle)
+            # Only remove our own lock; a stale one may already have been taken over
+            if holder.get("session_id") == session_id:
+                os.remove(path)
+        except (OSError, ValueError):
+            pass
+
+    def _prune(self) -> None:
+        """Keep the newest PROFILING_KEEP_SESSIONS - 1 session directories (the new one makes up the rest)."""
+        sessions = [
+            entry for entry in os.scandir(self._directory)
+            if entry.is_dir() and _SESSION_ID.match(entry.name)
+        ]
+        sessions.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in sessions[max(0, settings.profiling_keep_sessions - 1):]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+_profiler: Optional[Profiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> Profiler:
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = Profiler()
+        return _profiler
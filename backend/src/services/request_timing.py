@@ -0,0 +1,113 @@
+"""
+Per-stage timing spans for API requests.
+
+The HTTP middleware in src/api/main.py opens a RequestTimings for every request
+and keeps it in a context variable. run_poc and evaluate_mba_readiness wrap each
+step in stage() (cache read, scoring, every OpenAI attempt, validation, enrichment,
+cache write), so one evaluation is broken down by where its time went.
+
+The middleware returns the breakdown in a Server-Timing response header and logs
+it under "timings" in the JSON logs. Requests slower than SLOW_REQUEST_THRESHOLD_MS
+are also logged as warnings to the "src.services.request_timing.slow" logger with
+the full stage breakdown. Outside a request (CLI runs, benchmarks) stage() only
+costs a context variable lookup.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from src.config.logging_config import get_logger
+from src.config.settings import settings
+
+logger = get_logger(__name__)
+slow_logger = get_logger(f"{__name__}.slow")
+
+
+class Span(NamedTuple):
+    name: str
+    duration_ms: float
+    desc: Optional[str]
+
+
+class RequestTimings:
+    """Ordered stage spans of one request (stages are flat; do not nest stage() calls)."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.spans: List[Span] = []
+
+    def add(self, name: str, duration_ms: float, desc: Optional[str] = None) -> None:
+        self.spans.append(Span(name, duration_ms, desc))
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def breakdown(self, total_ms: float) -> Dict[str, Any]:
+        """Stages in execution order plus the time not covered by any stage."""
+        staged_ms = sum(span.duration_ms for span in self.spans)
+        return {
+            "total_ms": round(total_ms, 3),
+            "unaccounted_ms": round(max(0.0, total_ms - staged_ms), 3),
+            "stages": [
+                {"name": span.name, "ms": round(span.duration_ms, 3), **({"desc": span.desc} if span.desc else {})}
+                for span in self.spans
+            ],
+        }
+
+    def server_timing(self, total_ms: float) -> str:
+        """Server-Timing header value: one metric per span, then the total."""
+        metrics = []
+        for span in self.spans:
+            metric = span.name
+            if span.desc:
+                metric += f';desc="{span.desc}"'
+            metrics.append(f"{metric};dur={span.duration_ms:.1f}")
+        metrics.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(metrics)
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> RequestTimings:
+    """Begin collecting spans for the current request (called by the HTTP middleware)."""
+    timings = RequestTimings()
+    _current.set(timings)
+    return timings
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+@contextmanager
+def stage(name: str, desc: Optional[str] = None) -> Iterator[None]:
+    """Time the enclosed block as one span of the current request, if there is one."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, (time.perf_counter() - started) * 1000, desc)
+
+
+def log_request_timings(timings: RequestTimings, method: str, path: str, status_code: int, total_ms: float) -> None:
+    """Log the breakdown of an instrumented request; flag it in the slow log when over the threshold."""
+    slow = total_ms >= settings.slow_request_threshold_ms
+    if not timings.spans and not slow:
+        return
+
+    breakdown = {"method": method, "path": path, "status": status_code, **timings.breakdown(total_ms)}
+    summary = " ".join(f"{span.name}={span.duration_ms:.1f}" for span in timings.spans)
+    if timings.spans:
+        logger.info(f"{method} {path} {status_code} in {total_ms:.1f} ms ({summary})", extra={"timings": breakdown})
+    if slow:
+        slow_logger.warning(
+            f"Slow request: {method} {path} {status_code} took {total_ms:.1f} ms "
+            f"(threshold {settings.slow_request_threshold_ms:.0f} ms): {summary or 'no stages recorded'}",
+            extra={"timings": breakdown},
+        )
@@ -3,23 +3,21 @@ import json
 import logging
 import os
 import sys
+from functools import lru_cache
 from time import sleep
 from typing import Any, Dict, Optional
 
 from dotenv import load_dotenv
 from openai import OpenAI
 from pydantic import ValidationError
+from src.config.settings import settings
 from src.repositories.cache_repository import CacheRepository
 from src.models import FullProfileEvaluationResponse, enrich_full_profile_evaluation
 from src.models.models_raw import FullProfileEvaluationResponseRaw
-from src.services.quick_wins_logic import generate_quick_wins
-from src.services.job_descriptions import generate_job_opportunities, generate_recommended_roles
-from src.services.scoring_logic import calculate_profile_strength
-from src.services.interview_readiness_logic import calculate_interview_readiness
-from src.services.tools_logic import generate_tool_recommendations
-from src.services.profile_notes_logic import generate_profile_strength_notes
-from src.services.current_profile_summary import generate_current_profile_summary
-from src.services.peer_comparison_logic import generate_peer_group_description, calculate_potential_percentile
+from src.services.llm_accounting import ENDPOINT_EVALUATE, get_llm_accounting
+from src.services.peer_comparison_logic import calculate_potential_percentile
+from src.services.profile_enrichment import get_profile_enrichment
+from src.services.request_timing import stage
 from src.utils.label_mappings import get_role_label, get_company_label
 
 load_dotenv()
@@ -54,128 +52,64 @@ def _normalise_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
     return json.loads(json.dumps(payload, sort_keys=True))
 
 
-def _filter_and_rerank_roles(
-    recommended_roles: list,
-    current_role: str,
-    target_role: str,
-    experience: str
-) -> list:
-    """
-    Filter and rerank recommended roles based on:
-    1. Current role domain (DevOps users should see DevOps-relevant roles)
-    2. Target role (Data Analytics users should see data-focused roles)
-    3. Experience level (8+ years should see Staff/Principal/EM roles)
-    """
-    if not recommended_roles:
-        return recommended_roles
-
-    # Score each role based on how well it matches user profile
-    scored_roles = []
-
-    for role in recommended_roles:
-        score = 0
-        title_lower = role.get("title", "").lower()
-        seniority_raw = role.get("seniority", "")
-        # Convert Enum to string if needed
-        seniority = str(seniority_raw).lower() if seniority_raw else ""
-
-        # 1. TARGET ROLE MATCHING (HIGHEST PRIORITY - user's explicit choice)
-        if target_role:
-            target_lower = target_role.lower()
-
-            # Data Analytics/ML target → Data Engineer, Data Analyst, ML Engineer (NOT generic engineer roles)
-            if "data" in target_lower or "ml" in target_lower or "analytics" in target_lower:
-                if any(x in title_lower for x in ["data engineer", "data analyst", "ml engineer", "machine learning", "analytics engineer"]):
-                    score += 30  # HIGHEST - user's explicit target
-
-            # Backend target → Backend, Full-Stack, Senior Backend
-            if "backend" in target_lower:
-                if any(x in title_lower for x in ["backend", "api", "full-stack"]):
-                    score += 25  # HIGHEST - user's explicit target
-
-            # Frontend target → Frontend, Full-Stack
-            if "frontend" in target_lower:
-                if any(x in title_lower for x in ["frontend", "full-stack", "react", "angular", "vue"]):
-                    score += 25  # HIGHEST - user's explicit target
-
-            # DevOps/SRE target → DevOps, SRE, Cloud, Infrastructure
-            if "devops" in target_lower or "sre" in target_lower or "infrastructure" in target_lower:
-                if any(x in title_lower for x in ["devops", "sre", "cloud", "infrastructure", "platform", "reliability engineer", "site reliability"]):
-                    score += 30  # HIGHEST - user's explicit target
-
-            # Tech Lead/Manager target → Tech Lead, Manager, Director
-            if "tech-lead" in target_lower or "lead" in target_lower or "manager" in target_lower:
-                if any(x in title_lower for x in ["tech lead", "engineering manager", "director", "manager"]):
-                    score += 30  # HIGHEST - user's explicit target
-
-            # Staff/Principal target → Staff, Principal, Architect
-            if "staff" in target_lower or "principal" in target_lower or "architect" in target_lower:
-                if any(x in title_lower for x in ["staff", "principal", "architect"]):
-                    score += 30  # HIGHEST - user's explicit target
-
-        # 2. CURRENT ROLE DOMAIN MATCHING (secondary priority)
-        if current_role:
-            current_lower = current_role.lower()
-
-            # DevOps users → DevOps/SRE/Platform/Infrastructure roles
-            if "devops" in current_lower or "infra" in current_lower or "cloud" in current_lower:
-                if any(x in title_lower for x in ["devops", "sre", "cloud", "infrastructure", "platform", "reliability engineer", "site reliability"]):
-                    score += 15  # Good match (but lower than target role)
-
-            # QA/Support users → QA Automation, Test Engineer, Backend roles
-            if "qa" in current_lower or "support" in current_lower:
-                if any(x in title_lower for x in ["qa", "automation", "test", "backend", "engineer"]):
-                    score += 12  # Good match
-
-            # SWE-Product users → Backend, Full-Stack, Senior roles (stay in product world)
-            if "product" in current_lower:
-                if any(x in title_lower for x in ["backend", "fullstack", "full-stack", "senior", "staff"]):
-                    score += 12  # Good match
-
-            # SWE-Service users → can transition to Product roles
-            if "service" in current_lower:
-                if any(x in title_lower for x in ["backend", "fullstack", "senior"]):
-                    score += 10  # Moderate match
-
-        # 3. EXPERIENCE LEVEL MATCHING (third priority)
-        if experience:
-            # 8+ years → Staff, Principal, Engineering Manager, Architect, Tech Lead
-            if experience == "8+":
-                if any(x in title_lower for x in ["staff", "principal", "engineering manager", "architect", "tech lead", "director"]) or \
-                   any(x in seniority for x in ["staff", "principal", "principal engineer", "engineering manager", "director"]):
-                    score += 18  # Strong match for senior roles
-                # Regular engineer roles should be lower priority
-                elif any(x in title_lower for x in ["senior", "lead"]) or \
-                     "senior" in seniority or "principal" in seniority:
-                    score += 10
-
-            # 5-8 years → Senior, Tech Lead, Staff (if strong coding)
-            elif experience == "5-8":
-                if any(x in title_lower for x in ["senior", "tech lead", "staff", "architect"]) or \
-                   any(x in seniority for x in ["senior", "staff", "architect", "tech lead"]):
-                    score += 15
-
-            # 3-5 years → Mid-level, Senior (lower-bound)
-            elif experience == "3-5":
-                if any(x in title_lower for x in ["senior", "mid-level", "sde-2"]) or \
-                   any(x in seniority for x in ["mid-senior", "senior", "mid-level"]):
-                    score += 10
-
-            # 0-2 years → Junior, Entry-level, SDE-1
-            elif experience in ["0-2", "0"]:
-                if any(x in title_lower for x in ["junior", "entry", "sde-1", "graduate", "intern"]) or \
-                   any(x in seniority for x in ["junior", "entry-level"]):
-                    score += 12
-
-        # 4. GENERAL RELEVANCE BOOST (baseline for all roles)
-        if any(x in title_lower for x in ["engineer", "developer", "architect", "lead"]):
-            score += 5  # All technical roles get small boost
-
-        scored_roles.append((role, score))
-
-    # Sort by score (descending) and return just the roles
-    sorted_roles = sorted(scored_roles, key=lambda x: x[1], reverse=True)
-    return [role for role, score in sorted_roles]
+def _calculated_baselines(
+    calculated_profile_score: int,
+    calculated_interview_readiness: Dict[str, Any],
+    target_company_label: str,
+) -> str:
+    """Per-user values referenced by the static SCORE CONSISTENCY and TARGET COMPANY rules."""
+    return (
+        "CALCULATED BASELINES:\n"
+        f"- profile_strength_score: {calculated_profile_score}/100\n"
+        f"- technical_interview_percent: {calculated_interview_readiness['technical_interview_percent']}\n"
+        f"- hr_behavioral_percent: {calculated_interview_readiness['hr_behavioral_percent']}\n"
+        f"- peer_comparison.percentile: {max(0, calculated_profile_score - 5)} to {min(100, calculated_profile_score + 5)}\n"
+        f"- success_likelihood.score_percent: {max(0, calculated_profile_score - 10)} to {min(100, calculated_profile_score + 5)}\n"
+        f"- target_company_label: '{target_company_label}'"
+    )
+
+
+@lru_cache(maxsize=1)
+def _strict_response_schema() -> Dict[str, Any]:
+    """JSON schema for FullProfileEvaluationResponseRaw in OpenAI strict mode (built once; treat as read-only)."""
+    schema = FullProfileEvaluationResponseRaw.model_json_schema()
+
+    def _apply_json_schema_normalizers(node: Any) -> None:
+        if isinstance(node, dict):
+            # Ensure $ref nodes have no sibling keywords; OpenAI rejects any extras.
+            if "$ref" in node and len(node) > 1:
+                ref_value = node["$ref"]
+                node.clear()
+                node["$ref"] = ref_value
+
+            if node.get("type") == "object":
+                props = node.setdefault("properties", {})
+                if not isinstance(props, dict):
+                    raise TypeError("Object schema 'properties' must be a mapping")
+
+                node["additionalProperties"] = False
+                node["required"] = list(props.keys())
+
+                for child in props.values():
+                    _apply_json_schema_normalizers(child)
+            if "items" in node:
+                _apply_json_schema_normalizers(node["items"])
+            for key in ("oneOf", "anyOf", "allOf"):
+                if key in node and isinstance(node[key], list):
+                    for child in node[key]:
+                        _apply_json_schema_normalizers(child)
+            if "$defs" in node and isinstance(node["$defs"], dict):
+                for child in node["$defs"].values():
+                    _apply_json_schema_normalizers(child)
+            if "definitions" in node and isinstance(node["definitions"], dict):
+                for child in node["definitions"].values():
+                    _apply_json_schema_normalizers(child)
+        elif isinstance(node, list):
+            for child in node:
+                _apply_json_schema_normalizers(child)
+
+    _apply_json_schema_normalizers(schema)
+    return schema
 
 
 def call_openai_structured(
@@ -186,41 +120,46 @@ def call_openai_structured(
     calculated_profile_score: int,
     calculated_interview_readiness: Dict[str, Any],
     target_company_label: str,
+    evaluation_id: Optional[str] = None,
 ) -> FullProfileEvaluationResponse:
-    client = OpenAI(api_key=api_key) if api_key else OpenAI()
+    with stage("openai_client"):
+        client = OpenAI(api_key=api_key or None, base_url=settings.openai_base_url)
 
+    # Static for every user so the provider can serve it from its prompt prefix
+    # cache; per-user values go at the end of the user message.
     system_instruction = (
         "You are a career advisor specializing in the Indian tech market. Given the candidate's background, quiz responses, and goals, "
         "produce a structured FullProfileEvaluationResponse focusing on prospects, role fit, gaps, and a roadmap.\n\n"
         "CONTEXT: The user is based in India and looking for opportunities in the Indian tech ecosystem (Bangalore, Hyderabad, Pune, NCR) "
         "or remote roles with Indian/global companies. Tailor all recommendations to be realistic and relevant for the Indian market.\n\n"
-        f"CRITICAL: SCORE CONSISTENCY RULES\n"
-        f"The user's profile_strength_score has been calculated as {calculated_profile_score}/100.\n"
-        f"The user's interview readiness has been independently calculated based on their practice, experience, and preparation.\n"
-        f"ALL percentage scores MUST be consistent with these calculated baselines:\n\n"
-        f"1. peer_comparison.metrics.profile_strength_percent: MUST be {calculated_profile_score} (exact match)\n"
-        f"2. interview_readiness.technical_interview_percent: MUST be {calculated_interview_readiness['technical_interview_percent']} (calculated independently, NOT dependent on profile_strength_score)\n"
-        f"3. interview_readiness.hr_behavioral_percent: MUST be {calculated_interview_readiness['hr_behavioral_percent']} (based on soft skills and experience)\n"
-        f"   NOTE: Interview readiness is based on quiz responses (problemSolving, systemDesign, portfolio, experience)\n"
-        f"   It can be higher or lower than profile_strength_score - they measure different things!\n\n"
-        f"4. peer_comparison.percentile: {max(0, calculated_profile_score - 5)} to {min(100, calculated_profile_score + 5)}\n"
-        f"5. success_likelihood.score_percent: {max(0, calculated_profile_score - 10)} to {min(100, calculated_profile_score + 5)}\n"
-        f"   - Should be reasonable given profile_strength_score\n\n"
-        f"IMPORTANT DISTINCTION:\n"
-        f"- profile_strength_score ({calculated_profile_score}%): Overall career strength (experience, skills, track record)\n"
-        f"- interview_readiness ({calculated_interview_readiness['technical_interview_percent']}%): Specifically how prepared they are for technical interviews\n"
-        f"- A person can have high interview readiness but lower profile strength (new grad who practices hard)\n"
-        f"- A person can have strong profile but lower interview readiness (experienced but not interview-prepped)\n\n"
-        f"CRITICAL: USE ACTUAL TARGET COMPANY IN ALL TEXT\n"
-        f"The user selected target company: '{target_company_label}'\n\n"
-        f"When generating ANY text field (areas_to_develop, technical_notes, success_likelihood.notes, peer_comparison.summary):\n"
-        f"- Use the ACTUAL company label: '{target_company_label}'\n"
-        f"- DO NOT default to 'FAANG' or 'Big Tech' unless that's what they selected\n\n"
-        f"Examples:\n"
-        f"- If target is 'High Growth Startups' → 'startup interview preparation' NOT 'FAANG interview preparation'\n"
-        f"- If target is 'Product Unicorns' → 'product company interview preparation'\n"
-        f"- If target is 'Service Companies' → 'service company interview preparation'\n"
-        f"- If target is 'FAANG / Big Tech' → 'FAANG / Big Tech interview preparation' (only if selected!)\n\n"
+        "CRITICAL: SCORE CONSISTENCY RULES\n"
+        "The user's profile_strength_score and interview readiness have been calculated independently of you; "
+        "the exact values are listed under CALCULATED BASELINES at the end of the user message.\n"
+        "Interview readiness is based on their practice, experience, and preparation.\n"
+        "ALL percentage scores MUST be consistent with these calculated baselines:\n\n"
+        "1. peer_comparison.metrics.profile_strength_percent: MUST equal the baseline profile_strength_score (exact match)\n"
+        "2. interview_readiness.technical_interview_percent: MUST equal the baseline technical_interview_percent (calculated independently, NOT dependent on profile_strength_score)\n"
+        "3. interview_readiness.hr_behavioral_percent: MUST equal the baseline hr_behavioral_percent (based on soft skills and experience)\n"
+        "   NOTE: Interview readiness is based on quiz responses (problemSolving, systemDesign, portfolio, experience)\n"
+        "   It can be higher or lower than profile_strength_score - they measure different things!\n\n"
+        "4. peer_comparison.percentile: within the baseline peer_comparison.percentile range\n"
+        "5. success_likelihood.score_percent: within the baseline success_likelihood.score_percent range\n"
+        "   - Should be reasonable given profile_strength_score\n\n"
+        "IMPORTANT DISTINCTION:\n"
+        "- profile_strength_score: Overall career strength (experience, skills, track record)\n"
+        "- interview_readiness: Specifically how prepared they are for technical interviews\n"
+        "- A person can have high interview readiness but lower profile strength (new grad who practices hard)\n"
+        "- A person can have strong profile but lower interview readiness (experienced but not interview-prepped)\n\n"
+        "CRITICAL: USE ACTUAL TARGET COMPANY IN ALL TEXT\n"
+        "The user's selected target company is the target_company_label under CALCULATED BASELINES.\n\n"
+        "When generating ANY text field (areas_to_develop, technical_notes, success_likelihood.notes, peer_comparison.summary):\n"
+        "- Use the ACTUAL company label given as target_company_label\n"
+        "- DO NOT default to 'FAANG' or 'Big Tech' unless that's what they selected\n\n"
+        "Examples:\n"
+        "- If target is 'High Growth Startups' → 'startup interview preparation' NOT 'FAANG interview preparation'\n"
+        "- If target is 'Product Unicorns' → 'product company interview preparation'\n"
+        "- If target is 'Service Companies' → 'service company interview preparation'\n"
+        "- If target is 'FAANG / Big Tech' → 'FAANG / Big Tech interview preparation' (only if selected!)\n\n"
         "Field guide for the input JSON:\n"
         "- background: 'tech' = already works/studies in software; 'non-tech' = transitioning from another domain\n"
         "- quizResponses.currentRole:\n"
@@ -477,43 +416,7 @@ def call_openai_structured(
         "In your advice, acknowledge when values show limited exposure (e.g., not-yet, none, never) and tailor guidance for the user's background pivot."
     )
 
-    schema = FullProfileEvaluationResponseRaw.model_json_schema()
-
-    def _apply_json_schema_normalizers(node: Any) -> None:
-        if isinstance(node, dict):
-            # Ensure $ref nodes have no sibling keywords; OpenAI rejects any extras.
-            if "$ref" in node and len(node) > 1:
-                ref_value = node["$ref"]
-                node.clear()
-                node["$ref"] = ref_value
-
-            if node.get("type") == "object":
-                props = node.setdefault("properties", {})
-                if not isinstance(props, dict):
-                    raise TypeError("Object schema 'properties' must be a mapping")
-
-                node["additionalProperties"] = False
-                node["required"] = list(props.keys())
-
-                for child in props.values():
-                    _apply_json_schema_normalizers(child)
-            if "items" in node:
-                _apply_json_schema_normalizers(node["items"])
-            for key in ("oneOf", "anyOf", "allOf"):
-                if key in node and isinstance(node[key], list):
-                    for child in node[key]:
-                        _apply_json_schema_normalizers(child)
-            if "$defs" in node and isinstance(node["$defs"], dict):
-                for child in node["$defs"].values():
-                    _apply_json_schema_normalizers(child)
-            if "definitions" in node and isinstance(node["definitions"], dict):
-                for child in node["definitions"].values():
-                    _apply_json_schema_normalizers(child)
-        elif isinstance(node, list):
-            for child in node:
-                _apply_json_schema_normalizers(child)
-
-    _apply_json_schema_normalizers(schema)
+    schema = _strict_response_schema()
 
     base_messages = [
         {"role": "system", "content": system_instruction},
@@ -521,77 +424,91 @@ def call_openai_structured(
             "role": "user",
             "content": (
                 "Using this input JSON, return only a JSON object that matches FullProfileEvaluationResponse.\n\n"
-                + json.dumps(input_payload)
+                + json.dumps(input_payload, separators=(",", ":"))
+                + "\n\n"
+                + _calculated_baselines(calculated_profile_score, calculated_interview_readiness, target_company_label)
             ),
         },
     ]
 
     messages = list(base_messages)
 
-    for attempt in range(1, 4):
-        completion = None
-        try:
-            completion = client.chat.completions.create(
-                model=openai_model,
-                messages=messages,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "FullProfileEvaluationResponse",
-                        "schema": schema,
-                        "strict": True,
-                    },
-                },
-            )
-        except Exception as exc:  # pragma: no cover - network/service errors
-            if attempt == 3:
-                raise
-            sleep(1.5 * attempt)
-            continue
-
-        if completion is None:
-            if attempt == 3:
-                raise RuntimeError("OpenAI completion failed without raising an exception")
-            sleep(1.5 * attempt)
-            continue
-
-        content = completion.choices[0].message.content or ""
-        if not content:
-            error_text = "Empty response from OpenAI chat.completions"
-        else:
+    # Tokens, latency, attempts and corrections for the whole exchange (see llm_accounting)
+    with get_llm_accounting().call(ENDPOINT_EVALUATE, openai_model, evaluation_id) as llm_call:
+        for attempt in range(1, 4):
+            completion = None
+            llm_call.attempts = attempt
             try:
-                raw_obj = json.loads(content)
-            except json.JSONDecodeError as exc:
-                error_text = (
-                    "Model response is not valid JSON: "
-                    f"{exc}\nResponse text: {content}"
-                )
-            else:
-                try:
-                    raw_instance = FullProfileEvaluationResponseRaw.model_validate(raw_obj)
-                except ValidationError as exc:
-                    error_text = (
-                        "Model response failed validation against FullProfileEvaluationResponse: "
-                        f"{exc}"
+                with stage("openai", desc=f"attempt {attempt}"):
+                    completion = client.chat.completions.create(
+                        model=openai_model,
+                        messages=messages,
+                        response_format={
+                            "type": "json_schema",
+                            "json_schema": {
+                                "name": "FullProfileEvaluationResponse",
+                                "schema": schema,
+                                "strict": True,
+                            },
+                        },
                     )
+            except Exception as exc:  # pragma: no cover - network/service errors
+                if attempt == 3:
+                    raise
+                with stage("retry_backoff", desc=f"attempt {attempt}"):
+                    sleep(1.5 * attempt)
+                continue
+
+            if completion is None:
+                if attempt == 3:
+                    raise RuntimeError("OpenAI completion failed without raising an exception")
+                with stage("retry_backoff", desc=f"attempt {attempt}"):
+                    sleep(1.5 * attempt)
+                continue
+
+            llm_call.add_usage(completion.usage)
+            content = completion.choices[0].message.content or ""
+            raw_instance = None
+            with stage("validation", desc=f"attempt {attempt}"):
+                if not content:
+                    error_text = "Empty response from OpenAI chat.completions"
                 else:
+                    try:
+                        raw_obj = json.loads(content)
+                    except json.JSONDecodeError as exc:
+                        error_text = (
+                            "Model response is not valid JSON: "
+                            f"{exc}\nResponse text: {content}"
+                        )
+                    else:
+                        try:
+                            raw_instance = FullProfileEvaluationResponseRaw.model_validate(raw_obj)
+                        except ValidationError as exc:
+                            error_text = (
+                                "Model response failed validation against FullProfileEvaluationResponse: "
+                                f"{exc}"
+                            )
+            if raw_instance is not None:
+                with stage("enrich"):
                     return enrich_full_profile_evaluation(raw_instance)
 
-        if attempt == 3:
-            raise RuntimeError(error_text)
+            if attempt == 3:
+                raise RuntimeError(error_text)
 
-        correction_prompt = (
-            "The previous response did not satisfy the required schema. "
-            f"Error details:\n{error_text}\n\n"
-            "Please respond again with only a JSON object that strictly matches the schema."
-        )
-        messages = base_messages + [
-            {"role": "assistant", "content": content or ""},
-            {"role": "user", "content": correction_prompt},
-        ]
-        sleep(1.5 * attempt)
+            correction_prompt = (
+                "The previous response did not satisfy the required schema. "
+                f"Error details:\n{error_text}\n\n"
+                "Please respond again with only a JSON object that strictly matches the schema."
+            )
+            llm_call.corrected = True
+            messages = base_messages + [
+                {"role": "assistant", "content": content or ""},
+                {"role": "user", "content": correction_prompt},
+            ]
+            with stage("retry_backoff", desc=f"attempt {attempt}"):
+                sleep(1.5 * attempt)
 
-    raise RuntimeError("Exhausted attempts without valid response")
+        raise RuntimeError("Exhausted attempts without valid response")
 
 def run_poc(
     *,
@@ -599,7 +516,8 @@ def run_poc(
 ) -> FullProfileEvaluationResponse:
 
     payload_input = input_payload if input_payload is not None else DEFAULT_INPUT
-    payload = _normalise_payload(payload_input)
+    with stage("normalize"):
+        payload = _normalise_payload(payload_input)
     
     # Store original payload for user_input column (includes questionsAndAnswers)
     original_payload = payload.copy()
@@ -613,13 +531,18 @@ def run_poc(
 
     cache_repo = CacheRepository()
 
-    cache_key = cache_repo.generate_cache_key(payload_for_cache, model_name)
-    cached_json = cache_repo.get(cache_key, model_name)
+    with stage("cache_key"):
+        cache_key = cache_repo.generate_cache_key(payload_for_cache, model_name)
+    with stage("cache_read"):
+        cached_json = cache_repo.get(cache_key, model_name)
 
     if cached_json:
         logger.info("✅ CACHE HIT - Returning cached response (no OpenAI API call, instant response!)")
-        cache_repo.backfill_user_input(cache_key, model_name, original_payload)
-        result = FullProfileEvaluationResponse.model_validate_json(cached_json)
+        with stage("cache_backfill"):
+            cache_repo.backfill_user_input(cache_key, model_name, original_payload)
+        get_llm_accounting().record_cache_hit(ENDPOINT_EVALUATE, model_name, cache_key)
+        with stage("deserialize"):
+            result = FullProfileEvaluationResponse.model_validate_json(cached_json)
         result.response_id = cache_key
         return result
 
@@ -632,11 +555,14 @@ def run_poc(
     background = payload_for_cache.get("background", "")
     quiz_responses = payload_for_cache.get("quizResponses", {})
 
-    scoring_result = calculate_profile_strength(background, quiz_responses)
+    # Rule-based sections, memoized on the quiz answers they read
+    with stage("scoring"):
+        enriched = get_profile_enrichment().enrich(background, quiz_responses)
+    scoring_result = enriched.profile_strength
     calculated_score = scoring_result["score"]
 
-    # Calculate interview readiness independently (not dependent on profile strength score)
-    interview_readiness_result = calculate_interview_readiness(background, quiz_responses)
+    # Interview readiness is independent of the profile strength score
+    interview_readiness_result = enriched.interview_readiness
 
     from src.utils.label_mappings import get_company_label
     target_company = quiz_responses.get("targetCompany", "")
@@ -649,11 +575,12 @@ def run_poc(
         calculated_profile_score=calculated_score,
         calculated_interview_readiness=interview_readiness_result,
         target_company_label=target_company_label,
+        evaluation_id=cache_key,
     )
 
-    hardcoded_quick_wins = generate_quick_wins(background, quiz_responses)
-    hardcoded_opportunities = generate_job_opportunities(background, quiz_responses)
-    hardcoded_tools = generate_tool_recommendations(background, quiz_responses)
+    hardcoded_quick_wins = enriched.quick_wins
+    hardcoded_opportunities = enriched.job_opportunities
+    hardcoded_tools = enriched.tool_recommendations
     result_dict = result.model_dump()
     result_dict["profile_evaluation"]["profile_strength_score"] = scoring_result["score"]
 
@@ -662,7 +589,7 @@ def run_poc(
     interview_readiness["technical_interview_percent"] = interview_readiness_result["technical_interview_percent"]
     interview_readiness["hr_behavioral_percent"] = interview_readiness_result["hr_behavioral_percent"]
 
-    personalized_notes = generate_profile_strength_notes(background, quiz_responses, scoring_result["score"])
+    personalized_notes = enriched.profile_strength_notes
 
     # Check if there are contradictions in the profile (optional feature)
     if scoring_result.get("has_contradictions", False):
@@ -676,13 +603,13 @@ def run_poc(
     result_dict["profile_evaluation"]["opportunities_you_qualify_for"] = hardcoded_opportunities
     result_dict["profile_evaluation"]["recommended_tools"] = hardcoded_tools
 
-    current_profile_summary = generate_current_profile_summary(background, quiz_responses)
+    current_profile_summary = enriched.current_profile
     result_dict["profile_evaluation"]["current_profile"] = current_profile_summary
 
     peer_comparison = result_dict["profile_evaluation"]["peer_comparison"]
     current_percentile = peer_comparison.get("percentile", 50)
 
-    peer_group_desc = generate_peer_group_description(background, quiz_responses)
+    peer_group_desc = enriched.peer_group_description
     potential_percentile = calculate_potential_percentile(
         current_percentile, background, quiz_responses, scoring_result["score"]
     )
@@ -690,38 +617,19 @@ def run_poc(
     peer_comparison["peer_group_description"] = peer_group_desc
     peer_comparison["potential_percentile"] = potential_percentile
 
-    target_role = quiz_responses.get("targetRole", "")
-    target_company = quiz_responses.get("targetCompany", "")
-    current_role = quiz_responses.get("currentRole", "")
-    experience = quiz_responses.get("experience", "")
-    recommended_roles = result_dict["profile_evaluation"]["recommended_roles_based_on_interests"]
-
-    # Filter and rerank roles based on current role, target role, and experience
-    recommended_roles = _filter_and_rerank_roles(
-        recommended_roles,
-        current_role,
-        target_role,
-        experience
-    )
-
-    # Use v3 system: Generate recommended roles with timeline, copy, goals, and action items
-    recommended_roles_v3 = generate_recommended_roles(
-        background=background,
-        quiz_responses=quiz_responses
-    )
-
-    # Convert to dict format for result_dict
-    recommended_roles_dicts = [role.model_dump() for role in recommended_roles_v3]
-
-    result_dict["profile_evaluation"]["recommended_roles_based_on_interests"] = recommended_roles_dicts[:3]
+    # Use v3 system: recommended roles with timeline, copy, goals, and action items
+    result_dict["profile_evaluation"]["recommended_roles_based_on_interests"] = enriched.recommended_roles[:3]
 
-    result = FullProfileEvaluationResponse.model_validate(result_dict)
+    with stage("serialize"):
+        result = FullProfileEvaluationResponse.model_validate(result_dict)
+        result_json = result.model_dump_json()
 
-    result_json = result.model_dump_json()
-    cache_repo.set(cache_key, model_name, result_json, user_input=original_payload)  # Store original payload with questionsAndAnswers
+    with stage("cache_write"):
+        cache_repo.set(cache_key, model_name, result_json, user_input=original_payload)  # Store original payload with questionsAndAnswers
     logger.info("💾 Response cached successfully - next identical request will be instant!")
 
-    final_result = FullProfileEvaluationResponse.model_validate_json(result_json)
+    with stage("deserialize"):
+        final_result = FullProfileEvaluationResponse.model_validate_json(result_json)
     final_result.response_id = cache_key
     return final_result
 
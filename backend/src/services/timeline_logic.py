@@ -5,25 +5,14 @@ Hybrid approach: Uses persona-based timeline as baseline + gap adjustments.
 No caps, no convoluted multipliers. Just simple addition of gap months.
 """
 
-import json
 from typing import Dict, Any, Optional
-from pathlib import Path
 
-
-def load_personas():
-    """Load personas from config file."""
-    personas_path = Path(__file__).parent.parent / "config" / "personas.json"
-    with open(personas_path, "r") as f:
-        data = json.load(f)
-    return data["personas"]
-
-
-PERSONAS = load_personas()
+from src.services.persona_store import get_persona_store
 
 
 def get_persona(persona_id: str) -> Optional[Dict[str, Any]]:
     """Get persona config by ID."""
-    return PERSONAS.get(persona_id)
+    return get_persona_store().get(persona_id)
 
 
 def calculate_gap_months(
@@ -78,37 +67,18 @@ def apply_experience_adjustment_nontech(
     return max(2, base_months + adjustment)  # Never go below 2 months
 
 
-def calculate_timeline_for_card(
-    persona_id: str,
-    card_type: str,
-    quiz_responses: Dict[str, Any],
-    target_company: Optional[str] = None
-) -> Dict[str, Any]:
+def calculate_timeline_adjustment(persona_id: str, quiz_responses: Dict[str, Any]) -> int:
     """
-    Calculate timeline for a specific card (target or alternative).
-
-    Args:
-        persona_id: e.g., "swe_product_junior" or "nontech_backend"
-        card_type: "target", "alternative_1_easier_company", or "alternative_2_different_role"
-        quiz_responses: User's quiz answers
-        target_company: (optional) For handling company-specific adjustments
+    Months added to every card of a persona for this user.
 
-    Returns:
-        Dictionary with min_months, max_months, timeline_text, copy, goal, action_items, milestones
+    Tech personas add gap months for problem solving, system design and
+    portfolio; non-tech personas add their experience adjustment. The
+    result does not depend on the card, so the three cards share it.
     """
-
     persona = get_persona(persona_id)
     if not persona:
         raise ValueError(f"Persona not found: {persona_id}")
 
-    # Get base timeline from persona
-    base_months = persona.get("base_timeline_months", 4)
-
-    # Get card-specific config
-    card_config = persona["cards"].get(card_type)
-    if not card_config:
-        raise ValueError(f"Card type not found: {card_type}")
-
     # Calculate gap adjustments (only for tech users with quiz responses)
     gap_months = 0
     if persona["domain"] == "tech":
@@ -119,17 +89,38 @@ def calculate_timeline_for_card(
             persona_id=persona_id
         )
 
-    # Apply card-specific timeline adjustment
-    card_adjustment = card_config.get("timeline_adjustment", 0)
-
     # Apply experience adjustment for non-tech users
     experience_adjustment = 0
     if persona["domain"] == "non-tech":
         experience = quiz_responses.get("experience", "0-2")
         experience_adjustment = persona.get("experience_adjustments", {}).get(experience, 0)
 
+    return gap_months + experience_adjustment
+
+
+def build_card_timeline(persona_id: str, card_type: str, adjustment: int) -> Dict[str, Any]:
+    """
+    Timeline and copy for one card, given the user's adjustment from
+    calculate_timeline_adjustment().
+    """
+    store = get_persona_store()
+    persona = store.get(persona_id)
+    if not persona:
+        raise ValueError(f"Persona not found: {persona_id}")
+
+    # Get base timeline from persona
+    base_months = persona.get("base_timeline_months", 4)
+
+    # Get card-specific config
+    card_config = store.card(persona_id, card_type)
+    if not card_config:
+        raise ValueError(f"Card type not found: {card_type}")
+
+    # Apply card-specific timeline adjustment
+    card_adjustment = card_config.get("timeline_adjustment", 0)
+
     # Calculate final timeline
-    total_adjustment = gap_months + card_adjustment + experience_adjustment
+    total_adjustment = adjustment + card_adjustment
     min_months = max(2, base_months + total_adjustment)  # Never below 2 months
     max_months = min_months + 2  # Always add 2-month buffer for max
 
@@ -141,12 +132,34 @@ def calculate_timeline_for_card(
         "timeline_text": f"{min_months}-{max_months} months",
         "copy": card_config.get("copy", ""),
         "goal": card_config.get("goal", ""),
-        "action_items": card_config.get("action_items", []),
-        "milestones": card_config.get("milestones", []),
+        "action_items": list(card_config.get("action_items", [])),
+        "milestones": list(card_config.get("milestones", [])),
         "card_type": card_type
     }
 
 
+def calculate_timeline_for_card(
+    persona_id: str,
+    card_type: str,
+    quiz_responses: Dict[str, Any],
+    target_company: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Calculate timeline for a specific card (target or alternative).
+
+    Args:
+        persona_id: e.g., "swe_product_junior" or "nontech_backend"
+        card_type: "target", "alternative_1_easier_company", or "alternative_2_different_role"
+        quiz_responses: User's quiz answers
+        target_company: (optional) For handling company-specific adjustments
+
+    Returns:
+        Dictionary with min_months, max_months, timeline_text, copy, goal, action_items, milestones
+    """
+    adjustment = calculate_timeline_adjustment(persona_id, quiz_responses)
+    return build_card_timeline(persona_id, card_type, adjustment)
+
+
 # Backwards compatibility (if needed)
 def calculate_timeline_to_role(target_role: str, quiz_responses: Dict[str, Any]) -> Dict[str, Any]:
     """
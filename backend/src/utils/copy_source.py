@@ -0,0 +1,49 @@
+"""
+File-like adapter that feeds rows to psycopg2 copy_expert() as CSV.
+Rows are encoded lazily, so COPY input never has to be materialised in memory.
+"""
+import csv
+import io
+from typing import Any, Iterable, Iterator, Sequence
+
+
+class CsvCopySource(io.RawIOBase):
+    """
+    Readable stream of CSV lines for COPY ... FROM STDIN WITH (FORMAT csv).
+    None is written as an unquoted empty field, which COPY reads as NULL.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._rows: Iterator[Sequence[Any]] = iter(rows)
+        self._line = io.StringIO()
+        self._writer = csv.writer(self._line, lineterminator="\n")
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_line(self) -> bytes:
+        row = next(self._rows, None)
+        if row is None:
+            return b""
+        self._line.seek(0)
+        self._line.truncate()
+        self._writer.writerow(row)
+        return self._line.getvalue().encode("utf-8")
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = [self._pending]
+        length = len(self._pending)
+        while size < 0 or length < size:
+            line = self._next_line()
+            if not line:
+                break
+            chunks.append(line)
+            length += len(line)
+
+        data = b"".join(chunks)
+        if size < 0:
+            self._pending = b""
+            return data
+        self._pending = data[size:]
+        return data[:size]
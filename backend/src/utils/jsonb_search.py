@@ -0,0 +1,73 @@
+"""
+Helpers for admin JSONB search.
+Turns dotted-path filters into a containment document (served by the GIN
+jsonb_path_ops indexes) and encodes keyset pagination cursors.
+"""
+import base64
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.config.exceptions import ValidationError
+
+MAX_FILTERS = 10
+MAX_PATH_DEPTH = 4
+
+
+def parse_filters(raw_filters: Iterable[str]) -> Dict[str, str]:
+    """
+    Parse "path=value" strings into a {path: value} mapping.
+
+    Example: ["quizResponses.targetCompany=faang", "quizResponses.experience=8+"]
+    """
+    filters: Dict[str, str] = {}
+    for raw in raw_filters:
+        path, sep, value = raw.partition("=")
+        path = path.strip()
+        if not sep or not path:
+            raise ValidationError(f"Invalid filter '{raw}', expected 'field.path=value'")
+        filters[path] = value.strip()
+
+    if len(filters) > MAX_FILTERS:
+        raise ValidationError(f"At most {MAX_FILTERS} filters are allowed")
+    return filters
+
+
+def build_containment(filters: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Build a nested JSON document for a JSONB @> containment query.
+
+    {"quizResponses.targetCompany": "faang"} -> {"quizResponses": {"targetCompany": "faang"}}
+    """
+    document: Dict[str, Any] = {}
+    for path, value in filters.items():
+        keys = path.split(".")
+        if len(keys) > MAX_PATH_DEPTH or any(not key for key in keys):
+            raise ValidationError(f"Invalid filter path '{path}'")
+
+        node = document
+        for key in keys[:-1]:
+            child = node.setdefault(key, {})
+            if not isinstance(child, dict):
+                raise ValidationError(f"Conflicting filter paths at '{key}'")
+            node = child
+        if isinstance(node.get(keys[-1]), dict):
+            raise ValidationError(f"Conflicting filter paths at '{keys[-1]}'")
+        node[keys[-1]] = value
+    return document
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode the (created_at, id) of the last row on a page."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeError) as exc:
+        raise ValidationError(f"Invalid cursor: {cursor}") from exc
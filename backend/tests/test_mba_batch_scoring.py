@@ -0,0 +1,66 @@
+"""
+The NumPy batch scorer must agree with the scalar scoring functions on every input.
+"""
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.services.mba_batch_scoring import score_mba_batch, get_batch_scorer  # noqa: E402
+from src.services.mba_scoring_orchestrator import calculate_mba_readiness_score  # noqa: E402
+from src.services.mba_skill_inference import ROLE_SCORING_TABLES, infer_skills_from_responses  # noqa: E402
+from tests.test_mba_scoring import EXPERIENCE_OPTIONS, _answer_grid, _grid_roles  # noqa: E402
+
+RANDOM_SAMPLE_SIZE = 20000
+
+
+def _random_responses(count: int, seed: int = 35) -> List[Dict[str, Any]]:
+    """Responses mixing readiness and skill roles with answers drawn from every known question."""
+    rng = random.Random(seed)
+    answer_codes = get_batch_scorer().encoder.answer_codes
+    questions = sorted(answer_codes)
+    roles = _grid_roles() + sorted(ROLE_SCORING_TABLES)
+    responses = []
+    for _ in range(count):
+        response: Dict[str, Any] = {'role': rng.choice(roles)}
+        experience = rng.choice(EXPERIENCE_OPTIONS)
+        if isinstance(experience, str):
+            response['experience'] = experience
+        for question_key in rng.sample(questions, rng.randint(0, len(questions))):
+            response[question_key] = rng.choice(sorted(answer_codes[question_key]) + ['something-else', ''])
+        responses.append(response)
+    return responses
+
+
+def _assert_matches_scalar(responses: List[Dict[str, Any]]) -> None:
+    batch = score_mba_batch(responses)
+    scorer = get_batch_scorer()
+    for row, response in enumerate(responses):
+        expected = calculate_mba_readiness_score(response)
+        actual = {
+            'overall_score': int(batch['overall_score'][row]),
+            'category_scores': {
+                category: int(batch[category][row])
+                for category in ('experience', 'role_maturity', 'ai_fluency', 'ownership')
+            },
+            'maturity_level': batch['maturity_level'][row],
+            'percentile': int(batch['percentile'][row]),
+        }
+        assert actual == {key: expected[key] for key in actual}, response
+
+        skills = infer_skills_from_responses(response.get('role'), response)['skills']
+        skill_names = scorer.skill_names[batch['skill_role'][row]]
+        assert list(skills) == list(skill_names), response
+        assert [skills[name]['level'] for name in skill_names] == \
+            batch['skill_levels'][row][:len(skill_names)].tolist(), response
+
+
+@pytest.mark.parametrize("role", _grid_roles(), ids=str)
+def test_batch_matches_scalar_on_answer_grid(role):
+    _assert_matches_scalar(list(_answer_grid(role)))
+
+
+def test_batch_matches_scalar_on_random_responses():
+    _assert_matches_scalar(_random_responses(RANDOM_SAMPLE_SIZE))
@@ -0,0 +1,131 @@
+"""
+Parity tests for the MBA readiness scorer.
+
+The expected values were recorded from the per-role scoring functions that the
+compiled rule tables replaced, so any edit to the tables that changes a score,
+category, maturity level, percentile or tag fails here. If a change is
+intentional, regenerate the fixture with:
+
+    python -m tests.test_mba_scoring
+"""
+import hashlib
+import itertools
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.services import mba_scoring_orchestrator as scoring
+from src.services.mba_scoring_orchestrator import calculate_mba_readiness_score
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "mba_scoring_parity.json")
+
+ABSENT = object()
+EXPERIENCE_OPTIONS = ['0-2', '2-5', '5-8', '8-12', '12+', 'unknown', ABSENT]
+# Answers outside every rule table, and AI/ownership answers borrowed from other roles
+UNLISTED_ANSWER = 'something-else'
+BORROWED_AI_ANSWERS = ['reporting', 'insight']
+BORROWED_OWNERSHIP_ANSWER = 'margin'
+# Roles scored with base values only
+UNSCORED_ROLES = ['student', 'other', None, 123]
+
+
+def _question_options(role: Optional[str]) -> Dict[str, List[Any]]:
+    """Every answer that can matter for each of the role's questions, plus no answer."""
+    options: Dict[str, set] = {}
+    for question_key, answer_points in scoring.ROLE_MATURITY_RULES.get(role, []):
+        options.setdefault(question_key, set()).update(answer_points)
+    for question_key, answers, _ in scoring.READINESS_TAG_RULES.get(role, []):
+        options.setdefault(question_key, set()).update(answers)
+    ai_key = scoring.AI_FLUENCY_QUESTIONS.get(role)
+    if ai_key:
+        options.setdefault(ai_key, set()).update(BORROWED_AI_ANSWERS + [UNLISTED_ANSWER])
+    ownership_key = scoring.OWNERSHIP_QUESTIONS.get(role)
+    if ownership_key:
+        options.setdefault(ownership_key, set()).update([BORROWED_OWNERSHIP_ANSWER, UNLISTED_ANSWER])
+    return {question_key: sorted(answers) + [ABSENT] for question_key, answers in sorted(options.items())}
+
+
+def _answer_grid(role: Any) -> Iterator[Dict[str, Any]]:
+    """The full product of the role's question options and every experience band."""
+    options = _question_options(role) if isinstance(role, str) else {}
+    if not options:
+        # Unscored roles ignore answers; check that a scored role's answers change nothing
+        options = {question_key: [answer, ABSENT] for question_key, answer in (
+            ('pm-data-conflict', 'revalidate-hypothesis'), ('pm-ai-usage', 'predictive-insights'),
+            ('pm-ownership', 'product-line'),
+        )}
+    question_keys = list(options)
+    for experience in EXPERIENCE_OPTIONS:
+        for answers in itertools.product(*(options[key] for key in question_keys)):
+            responses = {'role': role}
+            if experience is not ABSENT:
+                responses['experience'] = experience
+            for question_key, answer in zip(question_keys, answers):
+                if answer is not ABSENT:
+                    responses[question_key] = answer
+            yield responses
+
+
+def _grid_roles() -> List[Any]:
+    return sorted(scoring.COMPILED_ROLE_RULES) + UNSCORED_ROLES
+
+
+def _grid_digest(role: Any, score=calculate_mba_readiness_score) -> Dict[str, Any]:
+    digest = hashlib.sha256()
+    cases = 0
+    for responses in _answer_grid(role):
+        digest.update(json.dumps(score(responses), sort_keys=True).encode("utf-8"))
+        cases += 1
+    return {"cases": cases, "sha256": digest.hexdigest()}
+
+
+def _load_fixture() -> Dict[str, Any]:
+    with open(FIXTURE_PATH, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def test_answer_grid_matches_recorded_scores():
+    expected = _load_fixture()["grid"]
+    for role in _grid_roles():
+        assert _grid_digest(role) == expected[str(role)], f"MBA scores changed for role {role!r}"
+
+
+def test_recorded_cases():
+    for case in _load_fixture()["cases"]:
+        assert calculate_mba_readiness_score(case["responses"]) == case["expected"]
+
+
+RECORDED_RESPONSES = [
+    {'role': 'product-manager', 'experience': '8-12', 'pm-data-conflict': 'revalidate-hypothesis',
+     'pm-roadmap-bloat': 'ruthless-prioritization', 'pm-ai-usage': 'predictive-insights',
+     'pm-feature-failure': 'systemic-failure', 'pm-ownership': 'business-unit',
+     'pm-retention-problem': 'resegment-cohorts', 'pm-ai-leverage': 'prioritization'},
+    {'role': 'finance', 'experience': '2-5', 'finance-ai-usage': 'reporting', 'finance-leadership-weight': 'me'},
+    {'role': 'sales', 'experience': '12+', 'sales-ai-usage': 'deal-risk', 'sales-ownership': 'team-number',
+     'sales-forecasting': 'predictive-models', 'sales-pipeline-reality': 'analyze-winloss'},
+    {'role': 'marketing', 'marketing-ai-application': 'content-generation'},
+    {'role': 'operations', 'experience': '5-8', 'operations-ai-leverage': 'automation',
+     'operations-ownership': 'margin', 'operations-purpose': 'enable-scale'},
+    {'role': 'founder', 'experience': '0-2', 'founder-ai-advantage': 'insight', 'founder-mvp-failure': 'pivot-icp'},
+    {'role': 'student', 'experience': '0-2'},
+    {},
+]
+
+
+def record_fixture(score=calculate_mba_readiness_score) -> None:
+    """Write the fixture from score (run only when a scoring change is intended)."""
+    fixture = {
+        "grid": {str(role): _grid_digest(role, score) for role in _grid_roles()},
+        "cases": [
+            {"responses": responses, "expected": json.loads(json.dumps(score(responses)))}
+            for responses in RECORDED_RESPONSES
+        ],
+    }
+    os.makedirs(os.path.dirname(FIXTURE_PATH), exist_ok=True)
+    with open(FIXTURE_PATH, "w", encoding="utf-8") as handle:
+        json.dump(fixture, handle, indent=2)
+        handle.write("\n")
+
+
+if __name__ == "__main__":
+    record_fixture()